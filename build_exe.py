@@ -62,6 +62,29 @@ def main():
         '--hidden-import', 'texas_holdem.core.player',
         '--hidden-import', 'texas_holdem.core.table',
         '--hidden-import', 'texas_holdem.core.evaluator',
+        '--hidden-import', 'texas_holdem.core.lookup_evaluator',
+        '--hidden-import', 'texas_holdem.core.table_cache',
+        '--hidden-import', 'texas_holdem.core.batch_evaluator',
+        '--hidden-import', 'texas_holdem.core.draw_analyzer',
+        '--hidden-import', 'texas_holdem.core.card_render',
+        '--hidden-import', 'texas_holdem.core.sampler',
+        '--hidden-import', 'texas_holdem.equity.engine',
+        '--hidden-import', 'texas_holdem.equity.backends',
+        '--hidden-import', 'texas_holdem.equity.cache',
+        '--hidden-import', 'texas_holdem.equity.canonical',
+        '--hidden-import', 'texas_holdem.equity.preflop_table',
+        '--hidden-import', 'texas_holdem.equity.parallel',
+        '--hidden-import', 'texas_holdem.equity.ranges',
+        '--hidden-import', 'texas_holdem.equity.flop_texture',
+        '--hidden-import', 'texas_holdem.equity.hand_strength',
+        '--hidden-import', 'texas_holdem.equity.push_fold',
+        '--hidden-import', 'texas_holdem.ai.policy_table',
+        '--hidden-import', 'texas_holdem.stats.opponent_model',
+        # 翻牌前胜率表
+        '--add-data', f'texas_holdem/equity/preflop_equity_v1.bin{os.pathsep}texas_holdem/equity',
+        '--add-data', f'texas_holdem/equity/flop_texture_v1.bin{os.pathsep}texas_holdem/equity',
+        '--add-data', f'texas_holdem/equity/ehs_flop_v1.bin{os.pathsep}texas_holdem/equity',
+        '--add-data', f'texas_holdem/equity/push_fold_v1.bin{os.pathsep}texas_holdem/equity',
         '--hidden-import', 'texas_holdem.game.game_state',
         '--hidden-import', 'texas_holdem.game.betting',
         '--hidden-import', 'texas_holdem.game.game_engine',
@@ -0,0 +1,274 @@
+"""
+测试胜率引擎
+验证各后端结果一致、花色同构缓存、翻牌前胜率表、并行与自适应模拟、对手范围，
+以及预计算的翻牌面结构索引和全押或弃牌图表
+"""
+
+import random
+
+from texas_holdem.core import batch_evaluator, lookup_evaluator
+from texas_holdem.core.card import Card
+from texas_holdem.equity import (HandRange, calculate, canonical_key, canonicalize, clear_cache,
+                                 cache_info, equity, flop_texture, parallel, preflop_table,
+                                 push_fold, ranges)
+from texas_holdem.equity.ranges import COMBOS
+
+
+def test_equity_backends_agree():
+    """精确枚举与两种模拟后端的胜率一致"""
+    hole = [Card.parse('AS'), Card.parse('KS')]
+    board = [Card.parse(c) for c in ('QS', '7H', '2D', '9C')]
+
+    exact = calculate(hole, board, method='exact')
+    assert exact.exact and exact.stderr == 0.0
+    assert exact.trials == 46 * 45 * 44 // 2
+
+    methods = ['montecarlo'] + (['vectorized'] if batch_evaluator.np is not None else [])
+    for method in methods:
+        result = calculate(hole, board, method=method, budget=20000, seed=5)
+        assert abs(result.equity - exact.equity) < 4 * result.stderr + 0.01
+
+    # 'auto' 在组合数低于阈值时改用精确枚举
+    auto = calculate(hole, board)
+    assert auto.method == 'exact' and auto.equity == exact.equity
+    assert calculate(hole, board, exact_threshold=0).method != 'exact'
+
+    # 等价类合并后的枚举与逐一枚举所有组合一致
+    hole = [Card.parse('2H'), Card.parse('3H')]
+    board = [Card.parse(c) for c in ('3C', 'JC', '10C', '2C')]
+    deck = [card for card in Card.all_cards() if card not in hole + board]
+    wins = ties = 0
+    for river in deck:
+        evaluator = lookup_evaluator.BoardEvaluator(board + [river])
+        hero_key = evaluator.evaluate_key(hole)
+        rest = [card for card in deck if card is not river]
+        for i, a in enumerate(rest):
+            for b in rest[i + 1:]:
+                key = evaluator.evaluate_key([a, b])
+                wins += hero_key > key
+                ties += hero_key == key
+    assert abs(equity(hole, board, method='exact') - (wins + ties / 2) / 45540) < 1e-12
+
+    # 河牌圈两人拿到相同的公共牌顺子：必然平分
+    board = [Card.parse(c) for c in ('10H', 'JD', 'QC', 'KS', 'AH')]
+    assert equity([Card.parse('2C'), Card.parse('3D')], board, method='exact') == 0.5
+
+    try:
+        equity(hole, board, method='magic')
+        assert False, "未知方法应抛出 ValueError"
+    except ValueError:
+        pass
+
+
+def test_equity_canonicalization_and_cache():
+    """花色同构的局面规范键相同，并共用一个缓存条目"""
+    def cards(*texts):
+        return [Card.parse(text) for text in texts]
+
+    key = canonical_key(cards('AS', 'KS'), cards('QH', 'JH', '2C'))
+    assert key == canonical_key(cards('AD', 'KD'), cards('QS', 'JS', '2H'))
+    assert key == canonical_key(cards('KD', 'AD'), cards('2H', 'QS', 'JS'))
+    assert key != canonical_key(cards('AS', 'KS'), cards('QS', 'JH', '2C'))
+    assert key != canonical_key(cards('AS', 'KS'), cards('QH', 'JH', '2C'), opponents=2)
+
+    rng = random.Random(13)
+    suits = list(Card.SUIT_ORDER)
+    for _ in range(200):
+        hole_board = rng.sample(Card.all_cards(), 2 + rng.choice((0, 3, 4, 5)))
+        hole, board = hole_board[:2], hole_board[2:]
+        permuted = suits[:]
+        rng.shuffle(permuted)
+        mapping = dict(zip(suits, permuted))
+        hole2 = [Card(mapping[card.suit], card.rank) for card in reversed(hole)]
+        board2 = [Card(mapping[card.suit], card.rank) for card in board]
+        assert canonical_key(hole, board) == canonical_key(hole2, board2)
+        assert canonicalize(hole, board) == canonicalize(hole2, board2)
+
+    river = cards('QH', 'JH', '2C', '7D', '9H')
+    canonical_hole, canonical_board = canonicalize(cards('AS', 'KS'), river)
+    assert equity(canonical_hole, canonical_board, method='exact', cache=False) == \
+        equity(cards('AS', 'KS'), river, method='exact', cache=False)
+
+    clear_cache()
+    first = calculate(cards('AS', 'KS'), river)
+    second = calculate(cards('AD', 'KD'), [Card.parse(text) for text in ('QS', 'JS', '2H', '7C', '9S')])
+    assert second is first
+    info = cache_info()
+    assert (info['hits'], info['misses'], info['size']) == (1, 1, 1)
+
+    # 指定种子时不读写缓存
+    calculate(cards('AS', 'KS'), river, seed=1)
+    assert cache_info()['size'] == 1
+
+
+def test_preflop_equity_table():
+    """翻牌前胜率表：类别编号、已知胜率和单挑矩阵的对称性"""
+    labels = [preflop_table.class_label(i) for i in range(preflop_table.NUM_CLASSES)]
+    assert len(set(labels)) == 169 and labels[:2] == ['AA', 'AKs'] and labels[13] == 'AKo'
+    assert sum(len(preflop_table.class_combos(i)) for i in range(169)) == 1326
+    for index in range(169):
+        for high, low in preflop_table.class_combos(index):
+            assert preflop_table.hand_class([low, high]) == index
+
+    table = preflop_table.get_table()
+    assert table is not None, "preflop_equity_v1.bin 缺失"
+    index = {label: i for i, label in enumerate(labels)}
+    for label, expected in (('AA', 0.852), ('KK', 0.824), ('AKs', 0.670), ('72o', 0.346), ('22', 0.503)):
+        assert abs(table.vs_random(index[label]) - expected) < 0.005, label
+    assert abs(table.matchup(index['AKo'], index['QQ']) - 0.432) < 0.01
+    for a, b in ((0, 1), (13, 168), (40, 90)):
+        assert abs(table.matchup(a, b) + table.matchup(b, a) - 1.0) < 1e-4
+    assert table.vs_random(0, 7) < table.vs_random(0, 2) < table.vs_random(0, 1)
+
+    result = calculate([Card.parse('AH'), Card.parse('AD')], [], opponents=3)
+    assert result.method == 'table' and result.equity == table.vs_random(0, 3)
+
+
+def test_parallel_equity():
+    """进程池并行模拟：同一种子结果可复现，并与查表结果一致；生成表的行任务与进程数无关"""
+    hole = [Card.parse('AS'), Card.parse('KS')]
+    try:
+        parallel.start_pool(2)
+        first = calculate(hole, [], 5, method='montecarlo', budget=8000, seed=11, parallel=True)
+        again = calculate(hole, [], 5, method='montecarlo', budget=8000, seed=11, parallel=True)
+        assert first.trials == 8000 and first.equity == again.equity
+        assert abs(first.equity - preflop_table.preflop_equity(hole, 5)) < 4 * first.stderr + 0.01
+
+        if preflop_table.np is not None:
+            task = (160, 200, 5)
+            assert list(parallel.start_pool(2).map(preflop_table._matchup_row, [task])) == \
+                [preflop_table._matchup_row(task)]
+    finally:
+        parallel.shutdown_pool()
+
+
+def test_adaptive_equity_stops_early():
+    """自适应模拟：阈值明显时少量模拟即停止，指定精度时达到精度为止"""
+    hole = [Card.parse('AS'), Card.parse('KS')]
+    board = [Card.parse(c) for c in ('QS', '7H', '2D')]
+
+    easy = calculate(hole, board, method='montecarlo', threshold=0.2, seed=1)
+    assert easy.trials < 1000 and easy.equity - 1.96 * easy.stderr > 0.2
+
+    precise = calculate(hole, board, method='montecarlo', precision=0.02, seed=1)
+    assert 1.96 * precise.stderr <= 0.02 + 1e-9 and precise.trials < 20000
+
+    capped = calculate(hole, board, method='montecarlo', precision=0.001, budget=600, seed=1)
+    assert capped.trials == 600
+
+
+def test_adaptive_cache_ignores_threshold_and_time():
+    """自适应结果按精度目标缓存：达到精度的结果对其他阈值复用，提前停止的结果不缓存"""
+    hole = [Card.parse('QH'), Card.parse('JH')]
+    board = [Card.parse(c) for c in ('TH', '4C', '8S')]
+    clear_cache()
+
+    stopped = calculate(hole, board, method='montecarlo', precision=0.005, threshold=0.1)
+    assert 1.96 * stopped.stderr > 0.005
+    assert cache_info()['size'] == 0
+
+    precise = calculate(hole, board, method='montecarlo', precision=0.02, time_limit=5.0)
+    assert cache_info()['size'] == 1
+    hits = cache_info()['hits']
+    for threshold, time_limit in ((0.45, 0.02), (0.6, 0.5), (None, None)):
+        assert calculate(hole, board, method='montecarlo', precision=0.02, time_limit=time_limit,
+                         threshold=threshold) is precise
+    assert cache_info()['hits'] == hits + 3
+    clear_cache()
+
+
+def test_range_equity():
+    """对手范围：按 VPIP/PFR 构造，精确枚举与两种模拟结果一致，随机范围等同于随机对手"""
+    full = HandRange.from_stats(0.25)
+    assert abs(full.fraction - 0.25) < 1e-9
+    assert full.weights[COMBOS.index((Card.parse('AH'), Card.parse('AD')))] == 1.0
+    assert full.weights[COMBOS.index((Card.parse('2H'), Card.parse('7D')))] == 0.0
+    caller = HandRange.from_stats(0.25, 0.1)
+    assert caller.weights[COMBOS.index((Card.parse('AH'), Card.parse('AD')))] == ranges.TRAP_WEIGHT
+
+    hole = [Card.parse('AS'), Card.parse('KD')]
+    board = [Card.parse(c) for c in ('QH', '7C', '2D', '5S')]
+    tight = HandRange.from_classes({'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'AQs': 0.5})
+    exact = calculate(hole, board, ranges=[tight])
+    assert exact.exact and 0 < exact.trials <= 46 * len(tight.live(hole + board))
+    for method in ('vectorized', 'montecarlo'):
+        sampled = calculate(hole, board, ranges=[tight], method=method, budget=4000, seed=2)
+        assert abs(sampled.equity - exact.equity) < 4 * sampled.stderr + 1e-3
+
+    random_range = calculate(hole, board, ranges=[HandRange.uniform()], method='exact')
+    assert abs(random_range.equity - calculate(hole, board, 1, method='exact').equity) < 1e-9
+    assert calculate(hole, board, ranges=[tight]).equity < random_range.equity
+
+
+def test_flop_texture_index():
+    """翻牌面索引：1,755 类覆盖全部翻牌，花色置换后查到同一类，发布的文件与重新计算一致"""
+    index = flop_texture.get_index()
+    assert len(index) == flop_texture.NUM_FLOPS
+    assert sum(texture.combos for texture in index.textures) == 22100
+
+    records = flop_texture.compute_textures()
+    for record, texture in zip(records, index.textures):
+        assert (texture.high, texture.middle, texture.low, texture.combos) == record[3:6] + record[8:9]
+        assert abs(texture.any_draw - record[14]) < 1e-4
+
+    def cards(*codes):
+        return [Card.parse(code) for code in codes]
+
+    wet = flop_texture.board_texture(cards('TH', '9H', '8H', '2S'))
+    assert wet == flop_texture.board_texture(cards('8S', 'TS', '9S'))
+    assert wet.monotone and wet.connectedness == 3 and not wet.paired
+    assert wet.wetness > 0.5 and not wet.dry
+
+    dry = flop_texture.board_texture(cards('KS', 'KD', '4C'))
+    assert dry.paired and dry.rainbow and dry.dry
+    assert dry.flush_draw == 0.0 and dry.straight_draw == 0.0
+    # 两色牌面：同花色剩余11张中任取两张即听同花
+    two_tone = flop_texture.board_texture(cards('AS', '7S', '2D'))
+    assert two_tone.two_tone and abs(two_tone.flush_draw - 55 / 1176) < 1e-4
+
+
+def test_push_fold_charts():
+    """全押或弃牌图表：单挑 10BB 的均衡范围合理，发布的文件与重新求解一致"""
+    table = push_fold.get_table()
+    assert table is not None and table.max_stack == push_fold.MAX_STACK
+
+    aces = [Card.parse('AS'), Card.parse('AH')]
+    trash = [Card.parse('7S'), Card.parse('2H')]
+    for chart in push_fold.CHARTS:
+        assert push_fold.push_fold_frequency(aces, 12, chart) == 1.0
+    # 虚拟对弈的平均策略在早期迭代中留下的频率可以忽略
+    for chart in ('hu_call', 'sb_call', 'bb_call', 'bb_overcall'):
+        assert push_fold.push_fold_frequency(trash, 20, chart) < 0.02
+
+    if batch_evaluator.np is not None:
+        np = batch_evaluator.np
+        equity_matrix, pairs, counts = push_fold._class_data()
+        push, call = push_fold._solve_heads_up(10, equity_matrix, pairs, push_fold.HEADS_UP_ITERATIONS)
+        share = counts / counts.sum()
+        # 单挑 10BB：小盲约六成全押，大盲约四成跟注
+        assert 0.5 < share @ push < 0.65
+        assert 0.3 < share @ call < 0.45
+        shipped = [table.frequency('hu_push', 10, index) for index in range(preflop_table.NUM_CLASSES)]
+        assert np.abs(np.array(shipped) - push).max() <= 0.5 / 255 + 1e-9
+
+
+
+if __name__ == "__main__":
+    test_equity_backends_agree()
+    print("[PASS] 胜率引擎")
+    test_equity_canonicalization_and_cache()
+    print("[PASS] 花色同构与胜率缓存")
+    test_preflop_equity_table()
+    print("[PASS] 翻牌前胜率表")
+    test_parallel_equity()
+    print("[PASS] 并行胜率计算")
+    test_adaptive_equity_stops_early()
+    print("[PASS] 自适应模拟")
+    test_adaptive_cache_ignores_threshold_and_time()
+    print("[PASS] 自适应结果缓存")
+    test_range_equity()
+    print("[PASS] 对手范围胜率")
+    test_flop_texture_index()
+    print("[PASS] 翻牌面结构索引")
+    test_push_fold_charts()
+    print("[PASS] 全押或弃牌图表")
@@ -0,0 +1,274 @@
+"""
+测试查表手牌评估器
+验证查表结果与逐一枚举5张组合的结果完全一致
+"""
+
+import copy
+import io
+import os
+import pickle
+import random
+import tempfile
+
+from texas_holdem.core import batch_evaluator, card_render, draw_analyzer, lookup_evaluator, table_cache
+from texas_holdem.core.card import Card
+from texas_holdem.core.deck import Deck
+from texas_holdem.core.draw_analyzer import DrawAnalyzer
+from texas_holdem.core.evaluator import PokerEvaluator
+from texas_holdem.core.sampler import DeadCardSampler
+
+
+def _cards(*specs):
+    """('H', 'A'), ('D', '10') ... -> Card 列表"""
+    return [Card(suit, rank) for suit, rank in specs]
+
+
+def test_cards_are_interned():
+    """52张牌为共享实例：编号、解析、存档格式和 pickle 往返都返回同一对象"""
+    assert len({id(card) for card in Deck().cards}) == 52
+    assert [card.id for card in Card.all_cards()] == list(range(52))
+
+    ace = Card('S', 'A')
+    assert ace is Card.parse('As') is Card.from_id(ace.id) is Card.from_dict(ace.to_dict())
+    assert ace.to_dict() == {'suit': 'S', 'rank': 'A'}
+    assert Card.parse('Th') is Card('H', '10') is Card.parse('10h')
+    assert pickle.loads(pickle.dumps(ace)) is ace and copy.deepcopy(ace) is ace
+    assert ace.mask == 1 << ace.id
+
+    try:
+        ace.value = 2
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("Card should be immutable")
+
+
+def test_card_rendering_by_stream():
+    """按输出流的能力查表渲染：非终端的 ASCII 流不带颜色和符号"""
+    if os.environ.get('FORCE_COLOR'):
+        print("设置了 FORCE_COLOR，跳过渲染测试")
+        return
+    ascii_stream = io.TextIOWrapper(io.BytesIO(), encoding='ascii')
+    cards = [Card('H', '10'), Card('S', 'A')]
+    assert card_render.render_cards(cards, stream=ascii_stream) == "10H AS"
+    assert card_render.render_cards([c.to_dict() for c in cards], stream=ascii_stream) == "10H AS"
+    assert card_render.get_capabilities(ascii_stream) == (False, False)
+
+    utf8_stream = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+    assert card_render.card_glyph(Card('D', 'K'), stream=utf8_stream) == "K♦"
+
+
+def test_seeded_deck_record_and_replay():
+    """同一种子的牌组洗牌结果一致；记录的顺序可以精确重放"""
+    first, second = Deck(seed=123), Deck(seed=123)
+    first.shuffle()
+    second.shuffle()
+    assert first.record() == second.record()
+
+    order = first.record()
+    hole = first.draw(2)
+    first.burn()
+    flop = first.draw(3)
+    assert len(first) == 46 and first.cards == [Card.from_id(i) for i in order[6:]]
+
+    first.replay(order)
+    assert first.draw(2) == hole
+    first.burn()
+    assert first.draw(3) == flop
+
+    a, b = Deck.streams(7, 2)
+    a.shuffle()
+    b.shuffle()
+    assert a.record() != b.record()
+
+
+def test_dead_card_sampler():
+    """采样不包含死牌、不重复；矩阵模式同样满足"""
+    dead = [Card('S', 'A'), Card('H', 'A'), Card('D', '7')]
+    sampler = DeadCardSampler(dead, seed=5)
+    assert sampler.live_count == 49
+
+    dead_ids = {card.id for card in dead}
+    for _ in range(200):
+        drawn = sampler.sample(9)
+        assert len(set(drawn)) == 9 and not dead_ids & {card.id for card in drawn}
+
+    if batch_evaluator.np is None:
+        return
+    np = batch_evaluator.np
+    matrix = sampler.sample_matrix(500, 9, np.random.default_rng(1))
+    assert matrix.shape == (500, 9)
+    assert all(len(set(row)) == 9 and not dead_ids & set(row.tolist()) for row in matrix)
+
+
+def test_lookup_matches_combinations():
+    """随机5-7张牌：查表评估与枚举组合评估一致"""
+    rng = random.Random(20240501)
+    full_deck = Deck().cards
+
+    for _ in range(3000):
+        cards = rng.sample(full_deck, rng.choice([5, 6, 7]))
+        expected = PokerEvaluator._evaluate_hand_by_combinations(cards)
+        assert PokerEvaluator.evaluate_hand(cards) == expected, cards
+
+
+def test_special_hands():
+    """特殊牌型：皇家同花顺、A-5顺子、双三条葫芦、同花压过顺子"""
+    royal = _cards(('S', 'A'), ('S', 'K'), ('S', 'Q'), ('S', 'J'), ('S', '10'), ('H', '2'), ('D', '3'))
+    assert PokerEvaluator.evaluate_hand(royal) == (PokerEvaluator.ROYAL_FLUSH, [14])
+
+    wheel = _cards(('S', 'A'), ('H', '2'), ('D', '3'), ('C', '4'), ('S', '5'), ('H', 'K'), ('D', 'K'))
+    assert PokerEvaluator.evaluate_hand(wheel) == (PokerEvaluator.STRAIGHT, [5])
+
+    two_trips = _cards(('S', '9'), ('H', '9'), ('D', '9'), ('C', '4'), ('S', '4'), ('H', '4'), ('D', 'K'))
+    assert PokerEvaluator.evaluate_hand(two_trips) == (PokerEvaluator.FULL_HOUSE, [9, 4])
+
+    flush_and_straight = _cards(('H', '6'), ('H', '7'), ('H', '8'), ('S', '9'), ('H', '10'), ('H', '2'), ('D', 'J'))
+    assert PokerEvaluator.evaluate_hand(flush_and_straight) == (PokerEvaluator.FLUSH, [10, 8, 7, 6, 2])
+
+
+def test_keys_order_like_tuples():
+    """整数牌力键的大小关系与 (hand_rank, rank_values) 元组比较一致"""
+    rng = random.Random(7)
+    full_deck = Deck().cards
+
+    hands = [rng.sample(full_deck, 7) for _ in range(400)]
+    keys = [PokerEvaluator.evaluate_key(h) for h in hands]
+    tuples = [PokerEvaluator.evaluate_hand(h) for h in hands]
+
+    for i in range(len(hands) - 1):
+        a, b = tuples[i], tuples[i + 1]
+        expected = (a > b) - (a < b)
+        assert (keys[i] > keys[i + 1]) - (keys[i] < keys[i + 1]) == expected
+        assert PokerEvaluator.compare_hands(hands[i], hands[i + 1]) == expected
+        assert PokerEvaluator.decode_key(keys[i]) == a
+
+    assert PokerEvaluator.describe_key(keys[0]) == PokerEvaluator.get_best_hand_description(hands[0])
+
+
+def test_batch_matches_scalar():
+    """NumPy 批量评估与逐手评估一致（未安装 numpy 时跳过）"""
+    if batch_evaluator.np is None:
+        print("未安装 numpy，跳过批量评估测试")
+        return
+
+    np = batch_evaluator.np
+    rng = np.random.default_rng(42)
+    ids = np.argsort(rng.random((2000, 52)), axis=1)[:, :7].astype(np.uint8)
+
+    for size in (5, 6, 7):
+        keys = PokerEvaluator.evaluate_batch(ids[:, :size])
+        for row, key in zip(ids[:, :size], keys):
+            cards = batch_evaluator.indices_to_cards(row)
+            assert PokerEvaluator.evaluate_key(cards) == key
+
+
+def test_board_evaluator_matches_full_evaluation():
+    """共享公共牌的增量评估与逐手完整评估一致，并按牌力分组"""
+    rng = random.Random(99)
+    full_deck = Deck().cards
+
+    for _ in range(500):
+        cards = rng.sample(full_deck, 5 + 2 * 8)
+        board, holes = cards[:5], [cards[5 + 2 * i:7 + 2 * i] for i in range(8)]
+        keys, tiers = PokerEvaluator.rank_hands(holes, board)
+        assert keys == [PokerEvaluator.evaluate_key(h + board) for h in holes]
+
+        best = max(keys)
+        assert tiers[0] == [i for i, k in enumerate(keys) if k == best]
+        assert sorted(i for tier in tiers for i in tier) == list(range(8))
+        assert all(keys[a[0]] > keys[b[0]] for a, b in zip(tiers, tiers[1:]))
+
+
+def test_draw_analyzer_counts_exact_outs():
+    """听牌分析：outs 与逐张枚举一致，重叠的 outs 只计一次，卡顺不限于连续四张"""
+    def cards(*codes):
+        return [Card.parse(code) for code in codes]
+
+    combo = DrawAnalyzer.analyze(cards('9H', '8H'), cards('TH', '7S', '2H'))
+    assert (combo['flush'], combo['straight'], combo['pair']) == (9, 6, 0)
+    assert combo['total'] == 15 and combo['weak_pair'] == 6
+
+    # 72 在 KQ9 上配成小对子不算听牌
+    weak = DrawAnalyzer.analyze(cards('7S', '2D'), cards('KC', 'QH', '9S'))
+    assert weak['total'] == 0 and weak['equity'] == 0.0 and weak['weak_pair'] == 6
+    # 高于所有公共牌的底牌配对成顶对，仍算 out
+    assert DrawAnalyzer.analyze(cards('AS', '2D'), cards('KC', 'QH', '9S'))['pair'] == 3
+
+    # 5-7 / 3-4-9 上缺6的卡顺（五张中间缺一张，不是连续四张）
+    gutshot = DrawAnalyzer.identify_draws(cards('5D', '7C'), cards('3H', '4S', '9D'))
+    assert gutshot['gutshot']['outs'] == 4 and 'oesd' not in gutshot
+    assert abs(gutshot['gutshot']['equity'] - (1 - 43 * 42 / (47 * 46))) < 1e-12
+
+    # 与逐张评估比较：out 使牌型升级且升级用到底牌
+    rng = random.Random(5)
+    deck = Card.all_cards()
+    for _ in range(200):
+        drawn = rng.sample(deck, 2 + rng.choice((3, 4)))
+        hole, board = drawn[:2], drawn[2:]
+        info = DrawAnalyzer.analyze(hole, board)
+        expected = []
+        before = PokerEvaluator.evaluate_hand(hole + board)[0]
+        for card in deck:
+            if card in drawn:
+                continue
+            after = PokerEvaluator.evaluate_hand(hole + board + [card])[0]
+            board_after = draw_analyzer.hand_category(draw_analyzer.card_bits(board + [card]))
+            if after > before and after > board_after:
+                expected.append(card)
+        assert sorted(info['outs'] + info['weak_outs'], key=lambda c: c.id) == expected
+        board_high = max(card.value for card in board)
+        assert all(card.value < board_high for card in info['weak_outs'])
+
+    assert DrawAnalyzer.analyze(cards('AH', 'KH'), cards('TH', '5H', '2D', '9C', '3S'))['total'] == 0
+
+
+def test_table_cache_rebuilds_corrupt_file():
+    """磁盘查找表：首次生成、再次映射，文件损坏时自动重建"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, table_cache.TABLE_FILENAME)
+        assert table_cache.load_tables(path)['source'] == 'built'
+        assert table_cache.load_tables(path)['source'] == 'cache'
+
+        hand = _cards(('S', 'A'), ('S', 'K'), ('H', 'A'), ('D', 'K'), ('C', '2'), ('H', '7'), ('D', '9'))
+        assert PokerEvaluator.evaluate_hand(hand) == (PokerEvaluator.TWO_PAIR, [14, 13, 9])
+
+        # 破坏数据区的一个字节，校验失败后应重建
+        table_cache._mapped = None
+        lookup_evaluator.install_tables(*lookup_evaluator.compute_tables())
+        with open(path, 'r+b') as f:
+            f.seek(-1, os.SEEK_END)
+            last = f.read(1)
+            f.seek(-1, os.SEEK_END)
+            f.write(bytes([last[0] ^ 0xFF]))
+        assert table_cache.load_tables(path)['source'] == 'built'
+        assert PokerEvaluator.evaluate_hand(hand) == (PokerEvaluator.TWO_PAIR, [14, 13, 9])
+
+        # 释放临时文件的映射，恢复为内存中的表
+        table_cache._mapped = None
+        lookup_evaluator.install_tables(*lookup_evaluator.compute_tables())
+
+
+if __name__ == "__main__":
+    test_cards_are_interned()
+    print("[PASS] 共享牌实例")
+    test_card_rendering_by_stream()
+    print("[PASS] 牌面渲染")
+    test_seeded_deck_record_and_replay()
+    print("[PASS] 牌组种子与重放")
+    test_dead_card_sampler()
+    print("[PASS] 死牌采样")
+    test_lookup_matches_combinations()
+    print("[PASS] 查表评估与枚举评估一致")
+    test_special_hands()
+    print("[PASS] 特殊牌型")
+    test_keys_order_like_tuples()
+    print("[PASS] 整数牌力键比较")
+    test_batch_matches_scalar()
+    print("[PASS] 批量评估")
+    test_board_evaluator_matches_full_evaluation()
+    print("[PASS] 共享公共牌增量评估")
+    test_draw_analyzer_counts_exact_outs()
+    print("[PASS] 听牌 outs 精确统计")
+    test_table_cache_rebuilds_corrupt_file()
+    print("[PASS] 查找表磁盘缓存")
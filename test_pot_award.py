@@ -5,7 +5,9 @@
 
 from texas_holdem.game.game_engine import GameEngine
 from texas_holdem.core.player import Player
-from texas_holdem.core.table import Table
+from texas_holdem.core.table import Table, SidePot
+from texas_holdem.core.card import Card
+from texas_holdem.core.evaluator import PokerEvaluator
 
 def test_single_winner_pot_collection():
     """测试：只剩一个玩家时，底池正确分配"""
@@ -135,6 +137,57 @@ def test_multiple_betting_rounds():
         return False
 
 
+def test_side_pot_best_eligible_hand():
+    """测试：整体赢家没有资格的边池，由有资格的最强手牌赢得"""
+    print("\n" + "=" * 50)
+    print("测试3: 边池按摊牌排名分配")
+    print("=" * 50)
+
+    short, mid, deep = Player('短码', 0), Player('中码', 0), Player('深码', 0)
+    short.hand.add_cards([Card('H', 'A'), Card('D', 'A')])   # 三条A，最强
+    mid.hand.add_cards([Card('H', 'K'), Card('D', 'K')])     # 三条K，第二
+    deep.hand.add_cards([Card('H', '3'), Card('D', '4')])
+    board = [Card('S', 'A'), Card('C', 'K'), Card('S', '8'), Card('C', '7'), Card('H', '2')]
+
+    table = Table()
+    table.main_pot.add(300)
+    table.main_pot.eligible_players.update([short, mid, deep])
+    side_pot = SidePot(200)
+    side_pot.eligible_players.update([mid, deep])
+    table.side_pots.append(side_pot)
+
+    tiers = PokerEvaluator.rank_showdown([short, mid, deep], board)
+    print(f"排名: {[[p.name for p in tier] for tier in tiers]}")
+    winnings = table.award_pots(tiers=tiers)
+    print(f"分配: {({p.name: amount for p, amount in winnings.items()})}")
+
+    assert tiers[0] == [short]
+    assert winnings == {short: 300, mid: 200}
+    print("[PASS] 测试通过：边池由有资格的最强手牌赢得")
+    return True
+
+
+def test_showdown_ranking_reset_each_hand():
+    """测试：上一手的摊牌排名不会留到下一手"""
+    print("\n" + "=" * 50)
+    print("测试4: 新一手牌清空摊牌排名")
+    print("=" * 50)
+
+    engine = GameEngine(['玩家1', '玩家2'], 1000)
+    engine.start_new_hand()
+    engine.deal_flop()
+    engine.deal_turn()
+    engine.deal_river()
+    tiers = engine.rank_showdown()
+    assert tiers and engine.showdown_keys
+
+    # 下一手没有摊牌（有人弃牌）时，读取排名不应得到上一手的结果
+    engine.start_new_hand()
+    assert engine.showdown_tiers == [] and engine.showdown_keys == {}
+    print("[PASS] 测试通过：新一手牌开始时摊牌排名已清空")
+    return True
+
+
 if __name__ == "__main__":
     print("\n" + "=" * 50)
     print("筹码分配修复测试")
@@ -158,6 +211,22 @@ if __name__ == "__main__":
         traceback.print_exc()
         results.append(("多轮下注后弃牌", False))
     
+    try:
+        results.append(("边池按摊牌排名分配", test_side_pot_best_eligible_hand()))
+    except Exception as e:
+        print(f"测试3异常: {e}")
+        import traceback
+        traceback.print_exc()
+        results.append(("边池按摊牌排名分配", False))
+    
+    try:
+        results.append(("新一手牌清空摊牌排名", test_showdown_ranking_reset_each_hand()))
+    except Exception as e:
+        print(f"测试4异常: {e}")
+        import traceback
+        traceback.print_exc()
+        results.append(("新一手牌清空摊牌排名", False))
+    
     print("\n" + "=" * 50)
     print("测试结果汇总")
     print("=" * 50)
@@ -2,16 +2,50 @@
 AI引擎 - 管理各种AI风格的决策逻辑
 """
 
+import bisect
 import random
-from typing import Dict, Tuple, List, Any
+from typing import Dict, Tuple, List, Any, Optional
 from texas_holdem.core.player import Player
 from texas_holdem.game.betting import BettingRound
 from texas_holdem.utils.constants import GameState
+from texas_holdem.ai import policy_table
 
 
 class AIEngine:
     """AI决策引擎"""
     
+    # 风格的紧度：手牌强度减去该值后再分档分配行动权重
+    STYLE_TIGHTNESS = {'TAG': 0.10, 'LAG': -0.05, 'LAP': 0.08, 'LP': -0.08}
+    # 行动权重的强度分档：调整后强度严格大于分界值才进入更高一档（中等、强牌、超强牌）
+    STRENGTH_CUTOFFS = (0.40, 0.55, 0.75)
+    # 翻牌后 sqrt(EHS²) -> 成牌评分（made_hand_score）的分位数映射，按公共牌张数。
+    # 各处的强度阈值（行动分档、下注量、鲨鱼AI翻牌后决策）都是按成牌评分设定的，
+    # 映射后落在各阈值之上的比例不变，同一档内仍按 EHS 排序。
+    # 由 calibrate_postflop_scale 生成：翻牌、转牌、河牌分别抽样 50000、6000、8000 次，种子为公共牌张数
+    POSTFLOP_STRENGTH_SCALE = {
+        3: (
+            (0.0, 0.319, 0.349, 0.376, 0.401, 0.425, 0.447, 0.469, 0.489, 0.513, 0.535, 0.564, 0.587, 0.61,
+             0.639, 0.674, 0.711, 0.754, 0.804, 0.859, 0.901, 0.925, 0.944, 0.954, 1.0),
+            (0.1, 0.14, 0.154, 0.157, 0.171, 0.172, 0.183, 0.186, 0.187, 0.197, 0.2, 0.201, 0.202, 0.203, 0.225,
+             0.24, 0.268, 0.283, 0.311, 0.379, 0.419, 0.448, 0.519, 0.63, 1.0),
+        ),
+        4: (
+            (0.0, 0.234, 0.277, 0.319, 0.349, 0.376, 0.405, 0.434, 0.46, 0.488, 0.517, 0.543, 0.575, 0.611,
+             0.646, 0.689, 0.743, 0.794, 0.847, 0.903, 0.939, 0.951, 0.969, 0.98, 1.0),
+            (0.114, 0.143, 0.157, 0.168, 0.183, 0.186, 0.187, 0.197, 0.2, 0.201, 0.202, 0.211, 0.24, 0.254,
+             0.268, 0.297, 0.311, 0.351, 0.394, 0.476, 0.559, 0.63, 0.741, 0.767, 0.921),
+        ),
+        5: (
+            (0.0, 0.053, 0.099, 0.146, 0.186, 0.241, 0.293, 0.34, 0.398, 0.444, 0.494, 0.55, 0.598, 0.653, 0.71,
+             0.759, 0.817, 0.866, 0.912, 0.959, 0.975, 0.985, 0.995, 0.999, 1.0),
+            (0.129, 0.154, 0.168, 0.183, 0.186, 0.2, 0.201, 0.211, 0.225, 0.254, 0.268, 0.283, 0.308, 0.322,
+             0.365, 0.39, 0.408, 0.422, 0.533, 0.713, 0.756, 0.757, 0.824, 0.852, 0.975),
+        ),
+    }
+    # 生成映射时取的分位点
+    SCALE_QUANTILES = (0.0, 0.05, 0.10, 0.15, 0.20, 0.25, 0.30, 0.35, 0.40, 0.45, 0.50, 0.55,
+                       0.60, 0.65, 0.70, 0.75, 0.80, 0.85, 0.90, 0.95, 0.97, 0.98, 0.99, 0.995, 1.0)
+    
     def __init__(self):
         # 打法风格参数配置
         self.style_configs = {
@@ -56,6 +90,10 @@ class AIEngine:
                 'fold_to_raise': 0.30,
             },
         }
+        
+        # 每种风格编译后的行动权重表（首次使用时编译；权重只取决于风格和强度档，
+        # 不随对局变化，无需重建）
+        self._policy_tables: Dict[str, policy_table.PolicyTable] = {}
     
     def get_action(self, player: Player, betting_round: BettingRound,
                    hand_strength: float, win_probability: float,
@@ -125,13 +163,8 @@ class AIEngine:
                     return (Action.CALL if amount_to_call > 0 else Action.CHECK, 0)
                 return Action.FOLD, 0
         
-        # 根据手牌强度选择行动权重
-        action_weights = self._calculate_action_weights(
-            hand_strength, style, config
-        )
-        
-        # 选择行动
-        action_name = self._weighted_choice(action_weights, available_names)
+        # 按手牌强度查编译后的行动权重表并选择行动
+        action_name = self._policy_choice(hand_strength, style, available_names)
         
         # 映射到Action
         action_map = {
@@ -165,30 +198,30 @@ class AIEngine:
     def _calculate_action_weights(self, hand_strength: float, style: str, 
                                   config: Dict) -> Dict[str, float]:
         """计算行动权重"""
-        weights = {'fold': 0, 'check': 0, 'call': 0, 'bet': 0, 'raise': 0, 'all_in': 0}
-        
         # 根据风格调整
-        tightness = {
-            'TAG': 0.10, 'LAG': -0.05, 'LAP': 0.08, 'LP': -0.08
-        }.get(style, 0)
-        
-        adjusted = hand_strength - tightness
+        adjusted = hand_strength - self.STYLE_TIGHTNESS.get(style, 0)
+        return self._adjusted_action_weights(adjusted, style)
+    
+    def _adjusted_action_weights(self, adjusted: float, style: str) -> Dict[str, float]:
+        """按风格调整后的手牌强度计算行动权重（在 STRENGTH_CUTOFFS 划分的每档内为常数）"""
+        weights = {'fold': 0, 'check': 0, 'call': 0, 'bet': 0, 'raise': 0, 'all_in': 0}
+        medium, strong, premium = self.STRENGTH_CUTOFFS
         
-        if adjusted > 0.75:  # 超强牌
+        if adjusted > premium:  # 超强牌
             if style in ['TAG', 'LAG']:
                 weights.update({'raise': 0.55, 'bet': 0.30, 'call': 0.15})
             elif style == 'LAP':
                 weights.update({'raise': 0.15, 'bet': 0.25, 'call': 0.50, 'check': 0.10})
             else:
                 weights.update({'raise': 0.30, 'bet': 0.40, 'call': 0.30})
-        elif adjusted > 0.55:  # 强牌
+        elif adjusted > strong:  # 强牌
             if style in ['TAG', 'LAG']:
                 weights.update({'raise': 0.40, 'bet': 0.35, 'call': 0.25})
             elif style == 'LAP':
                 weights.update({'raise': 0.10, 'bet': 0.20, 'call': 0.60, 'fold': 0.10})
             else:
                 weights.update({'raise': 0.15, 'bet': 0.30, 'call': 0.55})
-        elif adjusted > 0.40:  # 中等牌
+        elif adjusted > medium:  # 中等牌
             if style == 'TAG':
                 weights.update({'fold': 0.20, 'raise': 0.15, 'bet': 0.25, 'call': 0.40})
             elif style == 'LAG':
@@ -206,6 +239,24 @@ class AIEngine:
         
         return weights
     
+    def _policy_choice(self, hand_strength: float, style: str, available: List[str]) -> str:
+        """
+        查编译后的权重表选择行动（与 _calculate_action_weights + _weighted_choice 等价：
+        按风格调整后的强度在 STRENGTH_CUTOFFS 上分档，档内权重相同）
+        """
+        table = self._policy_tables.get(style)
+        if table is None:
+            table = policy_table.compile_threshold_policy(
+                lambda adjusted: self._adjusted_action_weights(adjusted, style),
+                self.STRENGTH_CUTOFFS, prefer_check=True)
+            self._policy_tables[style] = table
+        adjusted = hand_strength - self.STYLE_TIGHTNESS.get(style, 0)
+        action = table.sample(policy_table.threshold_bucket(self.STRENGTH_CUTOFFS, adjusted),
+                              policy_table.action_mask(available))
+        if action is None:
+            return 'fold' if 'fold' in available else available[0] if available else 'fold'
+        return action
+    
     def _weighted_choice(self, weights: Dict[str, float], available: List[str]) -> str:
         """加权随机选择"""
         # 过滤可用行动
@@ -285,24 +336,110 @@ class AIEngine:
     # 手牌评估方法
     @staticmethod
     def evaluate_hand_strength(hole_cards, community_cards) -> float:
-        """评估手牌强度（0.0-1.0）"""
-        from texas_holdem.core.evaluator import PokerEvaluator
-        
+        """
+        评估手牌强度（0.0-1.0）
+
+        翻牌后为 sqrt(EHS²)：当前牌力超过随机一手牌的比例，并计入听牌潜力
+        （翻牌圈查预计算表，转牌、河牌精确枚举），经 scale_postflop_strength 映射到成牌评分的尺度；
+        翻牌前查起手牌强度字典。
+        没有 numpy 时转牌圈的纯 Python 枚举约需50毫秒，未缓存的局面改用当前牌力 HS
+        """
         if not hole_cards:
             return 0.5
         
         all_cards = hole_cards + community_cards
         
+        if len(hole_cards) == 2 and 3 <= len(community_cards) <= 5:
+            from texas_holdem.core import batch_evaluator
+            from texas_holdem.equity import hand_strength
+
+            if len(community_cards) == 4 and batch_evaluator.np is None:
+                cached = hand_strength.cached_strength(hole_cards, community_cards)
+                if cached is None:
+                    value = hand_strength.current_strength(hole_cards, community_cards)
+                else:
+                    value = cached.potential
+            else:
+                value = hand_strength.postflop_strength(hole_cards, community_cards).potential
+            return AIEngine.scale_postflop_strength(value, len(community_cards))
         if len(all_cards) >= 5:
-            rank, values = PokerEvaluator.evaluate_hand(all_cards)
-            base_strength = rank / 9.0
-            
-            if values:
-                high_card_bonus = values[0] / 14.0 * 0.2
-                return min(1.0, base_strength + high_card_bonus)
-            return base_strength
+            return AIEngine.made_hand_score(all_cards)
         else:
             return AIEngine._evaluate_preflop_strength(hole_cards)
+
+    @staticmethod
+    def made_hand_score(cards) -> float:
+        """成牌评分：牌型等级 / 9 加最大牌面值的加成（0.0-1.0），不计听牌"""
+        from texas_holdem.core.evaluator import PokerEvaluator
+
+        rank, values = PokerEvaluator.evaluate_hand(cards)
+        base_strength = rank / 9.0
+        if values:
+            high_card_bonus = values[0] / 14.0 * 0.2
+            return min(1.0, base_strength + high_card_bonus)
+        return base_strength
+
+    @staticmethod
+    def scale_postflop_strength(value: float, board_size: int) -> float:
+        """
+        把翻牌后的 sqrt(EHS²) 映射到成牌评分的尺度（按 POSTFLOP_STRENGTH_SCALE 分段线性插值）
+
+        Args:
+            value: sqrt(EHS²) 或 HS（0.0-1.0）
+            board_size: 公共牌张数（3-5）
+
+        Returns:
+            映射后的强度（0.0-1.0）
+        """
+        knots = AIEngine.POSTFLOP_STRENGTH_SCALE.get(board_size)
+        if not knots:
+            return value
+        xs, ys = knots
+        index = bisect.bisect_right(xs, value)
+        if index <= 0:
+            return ys[0]
+        if index >= len(xs):
+            return ys[-1]
+        x0, x1 = xs[index - 1], xs[index]
+        return ys[index - 1] + (ys[index] - ys[index - 1]) * (value - x0) / (x1 - x0)
+
+    @staticmethod
+    def calibrate_postflop_scale(board_size: int, samples: int, seed: int = 0):
+        """
+        随机抽样底牌和公共牌，按分位数对齐 sqrt(EHS²) 与成牌评分，生成 POSTFLOP_STRENGTH_SCALE 的一项
+
+        Args:
+            board_size: 公共牌张数（3-5）
+            samples: 抽样次数
+            seed: 随机种子
+
+        Returns:
+            (sqrt(EHS²) 分位数, 成牌评分分位数)，两者均严格递增
+        """
+        from texas_holdem.core.card import Card
+        from texas_holdem.equity.hand_strength import postflop_strength
+
+        rng = random.Random(seed)
+        deck = Card.all_cards()
+        potentials, scores = [], []
+        for _ in range(samples):
+            cards = rng.sample(deck, 2 + board_size)
+            potentials.append(postflop_strength(cards[:2], cards[2:]).potential)
+            scores.append(AIEngine.made_hand_score(cards))
+        potentials.sort()
+        scores.sort()
+
+        xs, ys = [], []
+        for q in AIEngine.SCALE_QUANTILES:
+            position = min(samples - 1, int(q * samples))
+            x = 0.0 if q == 0.0 else 1.0 if q == 1.0 else round(potentials[position], 3)
+            # 成牌评分有大量并列，稍微抬高以保持严格递增（不改变 EHS 的次序）
+            y = round(max(scores[position], ys[-1] + 0.001 if ys else 0.0), 3)
+            if xs and x <= xs[-1]:
+                continue
+            xs.append(x)
+            ys.append(y)
+        return tuple(xs), tuple(ys)
     
     @staticmethod
     def _evaluate_preflop_strength(hole_cards) -> float:
@@ -320,9 +457,42 @@ class AIEngine:
         return amount_to_call / total_pot
     
     @staticmethod
-    def estimate_win_probability(hole_cards, community_cards) -> float:
-        """估算胜率（简化版蒙特卡洛）"""
-        return AIEngine.evaluate_hand_strength(hole_cards, community_cards)
+    def estimate_win_probability(hole_cards, community_cards, opponents=1, budget=None,
+                                 threshold=None, ranges=None) -> float:
+        """
+        估算胜率（调用胜率引擎，平局按人数平分）
+
+        需要模拟时按 95% 置信区间 ±1% 或 20ms 自适应停止；
+        给出 threshold（如跟注所需的胜率）时，结果明显高于或低于它即可停止
+
+        Args:
+            hole_cards: 底牌列表
+            community_cards: 公共牌列表
+            opponents: 对手数量（默认按单挑计算）
+            budget: 模拟次数上限（默认使用引擎的 ADAPTIVE_MAX_BUDGET）
+            threshold: 决策阈值
+            ranges: 对手手牌范围列表（HandRange），指定时对手数量取其长度
+
+        Returns:
+            胜率（0.0-1.0）
+        """
+        if not hole_cards:
+            return 0.5
+        from texas_holdem.equity import equity
+        return equity(hole_cards, community_cards, opponents, budget=budget,
+                      precision=0.01, time_limit=0.02, threshold=threshold, ranges=ranges)
+
+    @staticmethod
+    def breakeven_equity(total_pot, amount_to_call) -> Optional[float]:
+        """
+        跟注不亏所需的胜率 call / (pot + call)
+
+        Returns:
+            不需要跟注时返回 None
+        """
+        if amount_to_call <= 0:
+            return None
+        return amount_to_call / (total_pot + amount_to_call)
     
     @staticmethod
     def calculate_expected_value(hand_strength, pot_odds, amount_to_call, total_pot) -> float:
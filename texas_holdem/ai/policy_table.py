@@ -0,0 +1,119 @@
+"""
+编译后的行动权重表
+风格AI的行动权重是手牌强度的分段常数函数，按权重函数自己的分界值分档预先算好，
+运行时只需一次下标查找和一次抽样：
+
+- 分档与权重函数的 `value > cutoff` 比较完全一致，每档取一个代表值计算
+- 每档对每种可用行动组合（6位掩码）预先算好过滤后的累积权重，
+  抽样与逐次计算权重字典再加权选择等价：一次 random.random() 加二分查找
+
+只编译风格AI的权重函数：它只取决于风格和手牌强度，表与原逻辑完全等价，
+且权重不随对局变化，编译一次即可。鲨鱼AI的翻牌后决策还用到底池赔率、SPR、
+听牌胜率等连续输入，配置又随对手模型调整，离散成表会改变决策，因此不在此列
+"""
+
+import bisect
+import random
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# 行动顺序与权重字典的键顺序一致
+ACTIONS = ('fold', 'check', 'call', 'bet', 'raise', 'all_in')
+ALL_ACTIONS_MASK = (1 << len(ACTIONS)) - 1
+
+_ACTION_BITS = {action: 1 << index for index, action in enumerate(ACTIONS)}
+_FOLD = _ACTION_BITS['fold']
+_CHECK = _ACTION_BITS['check']
+
+
+def threshold_bucket(cutoffs: Sequence[float], value: float) -> int:
+    """
+    value 所在的档：严格大于其中 i 个分界值时为第 i 档
+
+    Args:
+        cutoffs: 升序的分界值
+        value: 输入值
+    """
+    return bisect.bisect_left(cutoffs, value)
+
+
+def action_mask(names: Sequence[str]) -> int:
+    """可用行动名称列表 -> 6位掩码（不认识的名称忽略）"""
+    mask = 0
+    for name in names:
+        mask |= _ACTION_BITS.get(name, 0)
+    return mask
+
+
+def _distribution(weights: Sequence[float], mask: int,
+                  prefer_check: bool) -> Optional[Tuple[Tuple[str, ...], Tuple[float, ...]]]:
+    """一组权重在可用行动下的 (行动, 累积权重)；没有可选行动时返回 None"""
+    if prefer_check and mask & _CHECK:
+        mask &= ~_FOLD
+    actions = []
+    cumulative = []
+    total = 0
+    for index, weight in enumerate(weights):
+        if mask >> index & 1 and weight > 0:
+            total += weight
+            actions.append(ACTIONS[index])
+            cumulative.append(total)
+    if not actions:
+        return None
+    return tuple(actions), tuple(cumulative)
+
+
+class PolicyTable:
+    """分档的行动分布：每行一组权重，每行 × 每种可用行动组合一个累积分布"""
+
+    def __init__(self, rows: Sequence[Dict[str, float]], prefer_check: bool = False):
+        """
+        Args:
+            rows: 每档的行动权重字典
+            prefer_check: 可以过牌时不选弃牌（与 AIEngine._weighted_choice 一致）
+        """
+        self.weights = [tuple(row.get(action, 0) for action in ACTIONS) for row in rows]
+        self._distributions: List[List] = [
+            [_distribution(weights, mask, prefer_check) for mask in range(ALL_ACTIONS_MASK + 1)]
+            for weights in self.weights
+        ]
+
+    def sample(self, row: int, mask: int = ALL_ACTIONS_MASK) -> Optional[str]:
+        """
+        按第 row 行的权重在可用行动中抽样
+
+        Args:
+            row: 档的下标
+            mask: 可用行动掩码（action_mask）
+
+        Returns:
+            行动名称；没有权重为正的可用行动时返回 None
+        """
+        distribution = self._distributions[row][mask]
+        if distribution is None:
+            return None
+        actions, cumulative = distribution
+        r = random.random() * cumulative[-1]
+        return actions[min(len(actions) - 1, bisect.bisect_left(cumulative, r))]
+
+    def __len__(self):
+        return len(self.weights)
+
+
+def compile_threshold_policy(weight_function: Callable[[float], Dict[str, float]],
+                             cutoffs: Sequence[float], prefer_check: bool = False) -> PolicyTable:
+    """
+    编译一个在分界值之间为常数的权重函数
+
+    第 i 档（i < len(cutoffs)）取分界值 cutoffs[i] 本身为代表值（恰好不大于它），
+    最后一档取 cutoffs[-1] + 1
+
+    Args:
+        weight_function: 输入值 -> 行动权重字典
+        cutoffs: 升序的分界值（与权重函数中 `value > cutoff` 的比较一致）
+        prefer_check: 见 PolicyTable
+
+    Returns:
+        len(cutoffs) + 1 行的 PolicyTable，下标为 threshold_bucket(cutoffs, 输入值)
+    """
+    representatives = list(cutoffs) + [cutoffs[-1] + 1.0]
+    return PolicyTable([weight_function(value) for value in representatives], prefer_check)
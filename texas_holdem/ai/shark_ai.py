@@ -4,11 +4,21 @@
 """
 
 import random
+import time
+from collections import deque
 from typing import Dict, List, Tuple, Any, Optional
 from texas_holdem.core.player import Player
 from texas_holdem.game.betting import BettingRound
 from texas_holdem.utils.constants import GameState
+from texas_holdem.core import batch_evaluator
 from texas_holdem.core.card import Card
+from texas_holdem.core.draw_analyzer import DrawAnalyzer
+from texas_holdem.ai.ai_engine import AIEngine
+from texas_holdem.equity import engine as equity_engine, hand_strength, push_fold
+from texas_holdem.equity.flop_texture import board_texture
+from texas_holdem.preflop_strength import get_hand_class
+from texas_holdem.stats.opponent_model import (OpponentModel, FOLD_THRESHOLD, BLUFF_THRESHOLD,
+                                               CALL_THRESHOLD)
 
 
 class DrawEvaluator:
@@ -16,59 +26,8 @@ class DrawEvaluator:
     
     @staticmethod
     def identify_draws(hole_cards: List[Card], community_cards: List[Card]) -> Dict[str, Any]:
-        """识别所有可能的听牌"""
-        draws = {}
-        if not community_cards:
-            return draws
-        
-        all_cards = hole_cards + community_cards
-        values = sorted(set([c.value for c in all_cards]))
-        suits = [c.suit for c in all_cards]
-        
-        # 同花听牌检测
-        for suit in set(suits):
-            suited_cards = [c for c in all_cards if c.suit == suit]
-            if len(suited_cards) == 4:
-                # 检查是否是后门同花（只有2张同花色）
-                hole_suited = [c for c in hole_cards if c.suit == suit]
-                if len(hole_suited) >= 1:
-                    draws['flush_draw'] = {'outs': 9, 'equity': 0.35}
-        
-        # 检查后门同花
-        for suit in set(suits):
-            suited_count = suits.count(suit)
-            if suited_count == 3 and len(community_cards) == 3:
-                draws['backdoor_flush'] = {'outs': 1, 'equity': 0.04}
-        
-        # 顺子听牌检测
-        if len(values) >= 4:
-            # 检查两端顺子听牌 (OESD)
-            for i in range(len(values) - 3):
-                if values[i+3] - values[i] == 3 and len(set(values[i:i+4])) == 4:
-                    draws['oesd'] = {'outs': 8, 'equity': 0.31}
-                    break
-            
-            # 检查卡顺听牌 (Gutshot)
-            for i in range(len(values) - 3):
-                gap = values[i+3] - values[i]
-                if gap == 4 and len(set(values[i:i+4])) == 4:
-                    draws['gutshot'] = {'outs': 4, 'equity': 0.16}
-                    break
-        
-        # 检查高牌 Outs
-        hole_values = sorted([c.value for c in hole_cards], reverse=True)
-        if hole_values[0] >= 12:  # A或K
-            overcard_outs = sum(1 for v in hole_values if v > max(community_cards, key=lambda x: x.value).value)
-            if overcard_outs > 0:
-                draws['overcards'] = {'outs': overcard_outs * 3, 'equity': overcard_outs * 0.12}
-        
-        # 组合听牌
-        if 'flush_draw' in draws and 'oesd' in draws:
-            draws['combo_draw'] = {'outs': 15, 'equity': 0.54}
-        elif 'flush_draw' in draws and 'gutshot' in draws:
-            draws['combo_draw'] = {'outs': 12, 'equity': 0.45}
-        
-        return draws
+        """识别所有可能的听牌（outs 由 DrawAnalyzer 精确统计）"""
+        return DrawAnalyzer.identify_draws(hole_cards, community_cards)
     
     @staticmethod
     def calculate_total_equity(draws: Dict) -> float:
@@ -240,7 +199,25 @@ class SharkAI:
     # 前4组包含：AA-88, AKs-A9s, AKo-AJo, KQs-KTs, KQo, QJs-Q9s, QJo, JTs, J9s, T9s
     TIER3_THRESHOLD = 0.60  # 只玩Sklansky前3组强牌(约前16%的手牌)
     
-    def __init__(self):
+    # 有效筹码不超过该大盲数、且不超过3人参与时，翻牌前按全押或弃牌图表行动
+    PUSH_FOLD_MAX_BB = 15
+    
+    # decide() 每次决策的默认时间预算（秒）
+    DECISION_BUDGET = 0.05
+    # 预算中留给最终规则决策（听牌识别、牌面结构、下注量）的时间（秒）
+    DECISION_RESERVE = 0.003
+    # 没有表和缓存时精确计算 EHS² 的预计耗时（秒），按公共牌张数（转牌圈有 numpy 时批量枚举）
+    STRENGTH_REFINE_COST = {3: 1.0, 4: 0.005 if batch_evaluator.np is not None else 0.1}
+    # 胜率引擎精确枚举的预计速度（情形数/秒），按剩余时间限制精确枚举的规模
+    EXACT_TRIALS_PER_SECOND = 400000
+    # 保留最近多少次决策的耗时
+    LATENCY_WINDOW = 1000
+    
+    def __init__(self, opponent_decay: float = 0.0):
+        """
+        Args:
+            opponent_decay: 对手模型的指数衰减率（见 OpponentModel），0 表示不衰减
+        """
         # 初始使用紧凶(TAG)风格，只玩前3组强牌，学习后动态调整
         self.base_config = {
             'vpip_range': (12, 18),      # TAG - 紧：只玩好牌
@@ -255,10 +232,8 @@ class SharkAI:
             'learning_rate': 0.1,
         }
         
-        # 对手追踪数据
-        self.opponent_data: Dict[str, Dict] = {}
-        self.adaptation_active = False
-        self.hands_observed = 0
+        # 对手追踪数据（增量维护的计数、倾向和平均倾向）
+        self.opponent_model = OpponentModel(self.base_config['adaptation_start'], opponent_decay)
         self.current_config = self.base_config.copy()
         
         # 子系统
@@ -272,121 +247,69 @@ class SharkAI:
         self.total_pot = 0
         self.effective_stack = 0
         self.is_preflop_raiser = False  # 是否是翻牌前加注者（用于CBet决策）
+        
+        # 带时间预算的决策：最近的 (耗时, 预算)，以及最近一次决策使用的特征
+        self._latencies = deque(maxlen=self.LATENCY_WINDOW)
+        self.last_decision: Dict[str, Any] = {}
+    
+    @property
+    def opponent_data(self) -> Dict[str, Dict]:
+        """每个对手的计数与倾向值"""
+        return self.opponent_model.players
+    
+    @property
+    def adaptation_active(self) -> bool:
+        """是否已开始根据对手数据调整策略"""
+        return self.opponent_model.adaptation_active
+    
+    @property
+    def hands_observed(self) -> int:
+        """累计观察到的对手行动次数"""
+        return self.opponent_model.total_observed
     
     def initialize_opponents(self, players: List[Player]):
         """初始化对手追踪"""
-        self.opponent_data = {}
-        for player in players:
-            if not player.is_ai or getattr(player, 'ai_style', 'LAG') != 'SHARK':
-                self.opponent_data[player.name] = {
-                    'hands_observed': 0,
-                    'folds': 0,
-                    'calls': 0,
-                    'raises': 0,
-                    'bluffs_detected': 0,
-                    'bluff_opportunities': 0,
-                    'fold_to_cbet': 0,
-                    'cbet_opportunities': 0,
-                    'showdown_wins': 0,
-                    'showdowns': 0,
-                    'fold_tendency': 0.5,
-                    'bluff_tendency': 0.5,
-                    'calling_tendency': 0.3,
-                }
-        self.adaptation_active = False
-        self.hands_observed = 0
+        self.opponent_model.reset(
+            player.name for player in players
+            if not player.is_ai or getattr(player, 'ai_style', 'LAG') != 'SHARK')
         self.current_config = self.base_config.copy()
     
     def update_after_action(self, player_name: str, action: str, street: str,
                            is_bluff: bool = False, facing_cbet: bool = False):
-        """每轮行动后更新对手数据"""
-        if player_name not in self.opponent_data:
-            return
-        
-        data = self.opponent_data[player_name]
-        data['hands_observed'] += 1
-        self.hands_observed += 1
-        
-        if action == 'fold':
-            data['folds'] += 1
-            if facing_cbet:
-                data['fold_to_cbet'] += 1
-        elif action in ['call']:
-            data['calls'] += 1
-        elif action in ['raise', 'bet']:
-            data['raises'] += 1
-            if is_bluff:
-                data['bluffs_detected'] += 1
-        
-        if facing_cbet:
-            data['cbet_opportunities'] += 1
-        
-        if not self.adaptation_active:
-            total_hands = sum(d['hands_observed'] for d in self.opponent_data.values())
-            if total_hands >= self.base_config['adaptation_start']:
-                self.adaptation_active = True
-        
-        if data['hands_observed'] % 5 == 0 or self.adaptation_active:
-            self._calculate_tendencies(player_name)
-            if self.adaptation_active:
-                self._update_strategy()
-    
-    def _calculate_tendencies(self, player_name: str):
-        """计算对手的倾向值"""
-        data = self.opponent_data[player_name]
-        hands = data['hands_observed']
-        
-        if hands < 3:
-            return
-        
-        fold_rate = data['folds'] / hands
-        data['fold_tendency'] = min(1.0, max(0.0, fold_rate * 2))
-        
-        if data['raises'] > 0:
-            bluff_rate = data['bluffs_detected'] / data['raises']
-            data['bluff_tendency'] = min(1.0, bluff_rate * 3)
-        
-        if hands > data['folds']:
-            calling_rate = data['calls'] / (hands - data['folds'])
-            data['calling_tendency'] = min(1.0, max(0.0, calling_rate))
+        """每轮行动后更新对手数据（O(1)），平均倾向越过阈值时才重新调整策略"""
+        if self.opponent_model.record(player_name, action, is_bluff, facing_cbet):
+            self._update_strategy()
     
     def _update_strategy(self):
         """根据对手数据更新当前策略配置"""
         if not self.opponent_data:
             return
         
-        avg_fold = sum(d['fold_tendency'] for d in self.opponent_data.values()) / len(self.opponent_data)
-        avg_bluff = sum(d['bluff_tendency'] for d in self.opponent_data.values()) / len(self.opponent_data)
-        avg_call = sum(d['calling_tendency'] for d in self.opponent_data.values()) / len(self.opponent_data)
-        
-        adjustments = []
+        model = self.opponent_model
+        avg_fold, avg_bluff, avg_call = model.avg_fold, model.avg_bluff, model.avg_call
+        # 每次从基础配置重新调整，不保留已失效的调整
+        self.current_config = self.base_config.copy()
         
         # 对手容易弃牌 -> 增加诈唬
-        if avg_fold > 0.6:
+        if avg_fold > FOLD_THRESHOLD:
             self.current_config['bluff_freq'] = min(0.5, self.base_config['bluff_freq'] + 0.15)
             self.current_config['bet_postflop'] = min(0.7, self.base_config['bet_postflop'] + 0.15)
             self.current_config['af_factor'] = self.base_config['af_factor'] + 0.5
-            adjustments.append("对手易弃牌→增加诈唬")
         
         # 对手喜欢诈唬 -> 打得更紧
-        if avg_bluff > 0.4:
+        if avg_bluff > BLUFF_THRESHOLD:
             self.current_config['vpip_range'] = (
                 max(15, self.base_config['vpip_range'][0] - 5),
                 max(20, self.base_config['vpip_range'][1] - 5)
             )
             self.current_config['call_preflop'] = min(0.4, self.base_config['call_preflop'] + 0.1)
             self.current_config['fold_to_raise'] = max(0.3, self.base_config['fold_to_raise'] - 0.1)
-            adjustments.append("对手爱诈唬→收紧范围")
         
         # 对手跟注站 -> 减少诈唬，增加价值下注
-        if avg_call > 0.6:
+        if avg_call > CALL_THRESHOLD:
             self.current_config['bluff_freq'] = max(0.1, self.base_config['bluff_freq'] - 0.1)
             self.current_config['bet_postflop'] = self.base_config['bet_postflop'] + 0.1
             self.current_config['af_factor'] = self.base_config['af_factor'] + 0.3
-            adjustments.append("对手跟注多→减少诈唬")
-        
-        if not adjustments:
-            self.current_config = self.base_config.copy()
     
     def get_action(self, player: Player, betting_round: BettingRound,
                    hand_strength: float, win_probability: float,
@@ -430,6 +353,10 @@ class SharkAI:
         draws = self.draw_evaluator.identify_draws(hole_cards, community_cards)
         draw_equity = self.draw_evaluator.calculate_total_equity(draws)
         
+        # 翻牌面结构（查预计算的索引）。索引只描述三张翻牌，转牌、河牌可能已经成同花或顺子，
+        # 只在翻牌圈使用
+        texture = board_texture(community_cards) if len(community_cards) == 3 else None
+        
         # 确定当前街
         street_map = {
             GameState.PRE_FLOP: 'preflop',
@@ -458,6 +385,10 @@ class SharkAI:
         
         # 翻牌前决策
         if is_preflop:
+            chart_decision = self._push_fold_decision(player, game_state, available_actions,
+                                                      amount_to_call, hole_cards)
+            if chart_decision is not None:
+                return chart_decision
             action, amount = self._preflop_decision(
                 player, available_actions, amount_to_call, 
                 hand_strength, position, spr_guidance, config
@@ -474,9 +405,189 @@ class SharkAI:
             player, available_actions, amount_to_call, current_bet,
             hand_strength, draw_equity, total_equity, direct_odds, 
             implied_calc, spr_guidance, config, draws, total_pot,
-            is_preflop_raiser=self.is_preflop_raiser
+            is_preflop_raiser=self.is_preflop_raiser, texture=texture
         )
     
+    def decide(self, player: Player, betting_round: BettingRound,
+               budget: Optional[float] = None, ranges=None) -> Tuple[Any, int]:
+        """
+        带时间预算的决策：先算廉价特征，剩余时间内逐步细化，到时用已有的最好估计决策
+        
+        1. 廉价特征：翻牌前查起手牌表；翻牌后查强度表或缓存，没有时只算当前牌力 HS
+           （约1毫秒），河牌圈直接精确计算
+        2. 剩余时间超过预计耗时时精确计算 EHS²（主要是转牌圈）
+        3. 胜率引擎在剩余时间内自适应模拟，精确枚举的规模也按剩余时间限制
+        
+        特征算完后调用一次 get_action；耗时见 latency_stats
+        
+        Args:
+            player: 鲨鱼AI玩家
+            betting_round: 下注轮次对象
+            budget: 时间预算（秒），默认 DECISION_BUDGET
+            ranges: 对手手牌范围列表（HandRange），传给胜率引擎
+        
+        Returns:
+            (行动, 金额) 元组
+        """
+        start = time.perf_counter()
+        budget = self.DECISION_BUDGET if budget is None else budget
+        try:
+            if player is None or betting_round is None or betting_round.game_state is None:
+                return self.get_action(player, betting_round, 0.5, 0.5, 0, 0)
+            features = self._anytime_features(player, betting_round,
+                                              start + budget - self.DECISION_RESERVE, ranges)
+            return self.get_action(player, betting_round, *features)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._latencies.append((elapsed, budget))
+            self.last_decision['elapsed'] = elapsed
+    
+    def _anytime_features(self, player, betting_round, deadline: float, ranges) -> Tuple:
+        """
+        在截止时间前计算 get_action 所需的特征
+        
+        Returns:
+            (手牌强度, 胜率, 底池赔率, 期望值)
+        """
+        game_state = betting_round.game_state
+        hole_cards = player.hand.get_cards() if player.hand else []
+        community_cards = game_state.table.get_community_cards()
+        total_pot = game_state.table.total_pot
+        amount_to_call = betting_round.get_amount_to_call(player)
+        pot_odds = AIEngine.calculate_pot_odds(total_pot, amount_to_call)
+        stage = 'features'
+        
+        # 1. 廉价特征（胜率先用当前牌力代替）
+        if len(hole_cards) == 2 and 3 <= len(community_cards) <= 5:
+            strength = hand_strength.cached_strength(hole_cards, community_cards)
+            if strength is None and len(community_cards) == 5:
+                strength = hand_strength.postflop_strength(hole_cards, community_cards)
+            if strength is None:
+                current = hand_strength.current_strength(hole_cards, community_cards)
+                # 2. 时间足够时补上听牌潜力
+                cost = self.STRENGTH_REFINE_COST[len(community_cards)]
+                if deadline - time.perf_counter() > cost:
+                    strength = hand_strength.postflop_strength(hole_cards, community_cards)
+                    stage = 'strength'
+            else:
+                current = strength.hs
+            strength_value = AIEngine.scale_postflop_strength(
+                strength.potential if strength is not None else current, len(community_cards))
+            win_probability = current
+        else:
+            strength_value = AIEngine.evaluate_hand_strength(hole_cards, community_cards)
+            win_probability = strength_value
+        
+        # 3. 剩余时间内用胜率引擎细化胜率
+        remaining = deadline - time.perf_counter()
+        if hole_cards and remaining > 0:
+            limit = (equity_engine.RANGE_EXACT_THRESHOLD if ranges is not None
+                     else equity_engine.EXACT_THRESHOLD)
+            win_probability = equity_engine.equity(
+                hole_cards, community_cards, 1, precision=0.01, time_limit=remaining,
+                threshold=AIEngine.breakeven_equity(total_pot, amount_to_call), ranges=ranges,
+                exact_threshold=min(limit, int(remaining * self.EXACT_TRIALS_PER_SECOND)))
+            stage = 'equity'
+        
+        ev = AIEngine.calculate_expected_value(strength_value, pot_odds, amount_to_call, total_pot)
+        self.last_decision = {'hand_strength': strength_value, 'win_probability': win_probability,
+                              'stage': stage}
+        return strength_value, win_probability, pot_odds, ev
+    
+    def latency_stats(self) -> Dict[str, float]:
+        """
+        最近 LATENCY_WINDOW 次 decide() 的耗时统计
+        
+        Returns:
+            {'count', 'p50', 'p90', 'p99', 'max'（秒）, 'over_budget'（超出预算的次数）}
+        """
+        if not self._latencies:
+            return {'count': 0, 'p50': 0.0, 'p90': 0.0, 'p99': 0.0, 'max': 0.0, 'over_budget': 0}
+        elapsed = sorted(latency for latency, _ in self._latencies)
+        count = len(elapsed)
+        
+        def percentile(p):
+            return elapsed[min(count - 1, int(p * count))]
+        
+        return {
+            'count': count,
+            'p50': percentile(0.50),
+            'p90': percentile(0.90),
+            'p99': percentile(0.99),
+            'max': elapsed[-1],
+            'over_budget': sum(1 for latency, budget in self._latencies if latency > budget),
+        }
+    
+    def _push_fold_decision(self, player, game_state, available_actions, amount_to_call,
+                            hole_cards) -> Optional[Tuple[Any, int]]:
+        """
+        短筹码翻牌前查全押或弃牌均衡图表
+        
+        只处理图表覆盖的情形：单挑或三人桌、有效筹码不超过 PUSH_FOLD_MAX_BB，
+        且轮到的是无人加注时的首个全押者或面对全押的跟注者（面对未全押的加注交给常规决策）
+        
+        Returns:
+            (行动, 金额)；不适用时返回 None，交给常规翻牌前决策
+        """
+        from texas_holdem.utils.constants import Action
+        from texas_holdem.utils import constants as _constants
+        
+        table = push_fold.get_table()
+        if table is None or len(hole_cards) != 2:
+            return None
+        
+        big_blind = _constants.BIG_BLIND
+        # 本手参与的玩家：未弃牌的，或已投入/仍有筹码的（弃牌者也算一个座位）
+        seated = [p for p in game_state.players if p.is_active or p.chips > 0 or p.bet_amount > 0]
+        opponents = [p for p in game_state.players if p.is_active and p is not player]
+        if len(seated) not in (2, 3) or not opponents:
+            return None
+        
+        # 有效筹码按本手开始前计算（加回已投入的盲注）
+        stack = player.chips + player.bet_amount
+        effective = min(stack, max(p.chips + p.bet_amount for p in opponents))
+        stack_bb = effective / big_blind
+        if stack_bb > self.PUSH_FOLD_MAX_BB:
+            return None
+        
+        raised = game_state.current_bet > big_blind
+        if raised:
+            # 跟注图表只适用于面对全押：加注者已全押，或加注额已达到与其的有效筹码
+            raisers = [p for p in opponents if p.bet_amount >= game_state.current_bet]
+            if not any(p.is_all_in or p.bet_amount >= min(stack, p.chips + p.bet_amount)
+                       for p in raisers):
+                return None
+        chart = None
+        if len(seated) == 2:
+            if player.is_small_blind and not raised:
+                chart = 'hu_push'
+            elif player.is_big_blind and raised:
+                chart = 'hu_call'
+        elif not raised:
+            if player.is_dealer and not player.is_small_blind and not player.is_big_blind:
+                chart = 'btn_push'
+            elif player.is_small_blind and len(opponents) == 1:
+                # 按钮弃牌后小盲对大盲即为单挑
+                chart = 'hu_push'
+        elif player.is_small_blind:
+            chart = 'sb_call'
+        elif player.is_big_blind:
+            if len(opponents) == 2:
+                chart = 'bb_overcall'
+            elif opponents[0].is_small_blind:
+                chart = 'hu_call'
+            else:
+                chart = 'bb_call'
+        if chart is None:
+            return None
+        
+        if random.random() < table.frequency(chart, stack_bb, get_hand_class(hole_cards)):
+            return Action.ALL_IN, player.chips
+        available_names = [str(a).lower().replace('action.', '') for a in available_actions]
+        if amount_to_call <= 0 and 'check' in available_names:
+            return Action.CHECK, 0
+        return Action.FOLD, 0
+    
     def _preflop_decision(self, player, available_actions, amount_to_call,
                          hand_strength, position, spr_guidance, config) -> Tuple[Any, int]:
         """翻牌前决策 - TAG风格，根据学习机制动态调整"""
@@ -502,12 +613,12 @@ class SharkAI:
         # 如果对手容易弃牌，后位可以更松；如果对手诈唬多，收紧范围
         adjust_factor = 1.0
         if self.adaptation_active:
-            avg_fold = sum(d['fold_tendency'] for d in self.opponent_data.values()) / len(self.opponent_data)
-            avg_bluff = sum(d['bluff_tendency'] for d in self.opponent_data.values()) / len(self.opponent_data)
+            avg_fold = self.opponent_model.avg_fold
+            avg_bluff = self.opponent_model.avg_bluff
             
-            if avg_fold > 0.6:
+            if avg_fold > FOLD_THRESHOLD:
                 adjust_factor = 0.95  # 对手易弃牌，放宽5%
-            elif avg_bluff > 0.4:
+            elif avg_bluff > BLUFF_THRESHOLD:
                 adjust_factor = 1.05  # 对手爱诈唬，收紧5%
         
         position_multipliers = {k: v * adjust_factor for k, v in base_multipliers.items()}
@@ -589,10 +700,10 @@ class SharkAI:
     def _postflop_decision(self, player, available_actions, amount_to_call,
                           current_bet, hand_strength, draw_equity, total_equity,
                           direct_odds, implied_calc, spr_guidance, config, draws, total_pot,
-                          is_preflop_raiser=False) -> Tuple[Any, int]:
+                          is_preflop_raiser=False, texture=None) -> Tuple[Any, int]:
         """
         翻牌后决策 - 自适应学习版
-        根据对手数据动态调整策略
+        根据对手数据和牌面结构（texture: FlopTexture，仅翻牌圈，其余街为 None）动态调整策略
         """
         from texas_holdem.utils.constants import Action
         
@@ -621,8 +732,8 @@ class SharkAI:
             pure_bluff_freq = bluff_freq  # 使用学习后的诈唬频率
             
             if self.adaptation_active:
-                avg_fold = sum(d['fold_tendency'] for d in self.opponent_data.values()) / len(self.opponent_data)
-                if avg_fold > 0.6:
+                avg_fold = self.opponent_model.avg_fold
+                if avg_fold > FOLD_THRESHOLD:
                     # 对手易弃牌，降低CBet阈值，增加诈唬
                     cbet_threshold = 0.35
                     semi_bluff_threshold = 0.15
@@ -633,9 +744,20 @@ class SharkAI:
                     semi_bluff_threshold = 0.25
                     pure_bluff_freq = max(0.05, bluff_freq - 0.05)
             
+            # 牌面结构：干燥牌面对手很少能继续，多CBet；湿润牌面收紧范围、加大价值下注
+            value_size = 0.66 + (af_factor - 2.5) * 0.05
+            if texture is not None:
+                if texture.dry:
+                    cbet_threshold -= 0.05
+                    pure_bluff_freq = min(0.5, pure_bluff_freq + 0.05)
+                elif texture.wetness > 0.5:
+                    cbet_threshold += 0.05
+                    pure_bluff_freq = max(0.0, pure_bluff_freq - 0.05)
+                    value_size += 0.10
+            
             if total_strength >= cbet_threshold:  # 有摊牌价值或听牌
                 if 'bet' in available_names:
-                    bet_size = max(40, int(total_pot * (0.66 + (af_factor - 2.5) * 0.05)))
+                    bet_size = max(40, int(total_pot * value_size))
                     bet_size = min(bet_size, player.chips)
                     if bet_size >= player.chips:
                         return Action.ALL_IN, player.chips
@@ -680,7 +802,9 @@ class SharkAI:
         if total_strength >= bet_threshold:  # 强牌 - 激进价值下注
             if current_bet == 0:
                 if 'bet' in available_names:
-                    bet_size = max(40, int(total_pot * (0.75 + (af_factor - 2.5) * 0.03)))
+                    # 湿润牌面下注更大，让听牌付出代价
+                    wet_bonus = 0.10 if texture is not None and texture.wetness > 0.5 else 0.0
+                    bet_size = max(40, int(total_pot * (0.75 + (af_factor - 2.5) * 0.03 + wet_bonus)))
                     if bet_size >= player.chips:
                         return Action.ALL_IN, player.chips
                     return Action.BET, bet_size
@@ -708,7 +832,7 @@ class SharkAI:
             # 根据对手跟注倾向调整
             should_call = False
             if self.adaptation_active:
-                avg_call = sum(d['calling_tendency'] for d in self.opponent_data.values()) / len(self.opponent_data)
+                avg_call = self.opponent_model.avg_call
                 if avg_call > 0.5 and amount_to_call > 0:
                     # 对手跟注多，不诈唬，弃牌
                     pass
@@ -856,9 +980,9 @@ class SharkAI:
         summaries = []
         for name, data in self.opponent_data.items():
             if data['hands_observed'] >= 5:
-                fold_desc = "易弃牌" if data['fold_tendency'] > 0.6 else \
+                fold_desc = "易弃牌" if data['fold_tendency'] > FOLD_THRESHOLD else \
                            "难弃牌" if data['fold_tendency'] < 0.4 else "中等"
-                bluff_desc = "爱诈唬" if data['bluff_tendency'] > 0.4 else \
+                bluff_desc = "爱诈唬" if data['bluff_tendency'] > BLUFF_THRESHOLD else \
                             "诚实" if data['bluff_tendency'] < 0.2 else "平衡"
                 summaries.append(f"{name}({fold_desc}/{bluff_desc})")
         
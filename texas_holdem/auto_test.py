@@ -207,18 +207,18 @@ class AutoCLI(CLI):
         if len(community_cards) < 5:
             return
         
-        best_rank = float('inf')
+        best_key = -1
         winners = []
         
         for player in active_players:
             if player.hand and len(player.hand.cards) == 2:
                 all_cards = player.hand.cards + community_cards
                 try:
-                    rank, values = PokerEvaluator.evaluate_hand(all_cards)
-                    if rank < best_rank:
-                        best_rank = rank
+                    key = PokerEvaluator.evaluate_key(all_cards)
+                    if key > best_key:
+                        best_key = key
                         winners = [player]
-                    elif rank == best_rank:
+                    elif key == best_key:
                         winners.append(player)
                 except:
                     continue
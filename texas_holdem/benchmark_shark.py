@@ -7,7 +7,7 @@ import sys
 import random
 import io
 from contextlib import redirect_stdout
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from collections import defaultdict
 
 sys.path.insert(0, 'd:\\workspace\\Texes')
@@ -22,14 +22,16 @@ from texas_holdem.utils.constants import INITIAL_CHIPS, GameState as GS
 class SilentGameRunner:
     """静默运行游戏，不输出到控制台"""
     
-    def __init__(self, max_hands: int = 10000):
+    def __init__(self, max_hands: int = 10000, seed: Optional[int] = None):
         """
         初始化测试运行器
         
         Args:
             max_hands: 最大手牌数（防止无限循环），默认10000手
+            seed: 牌组随机种子（指定后发牌顺序可复现）
         """
         self.max_hands = max_hands
+        self.seed = seed
         self.ai_engine = AIEngine()
         self.shark_ai = SharkAI()
         
@@ -172,7 +174,7 @@ class SilentGameRunner:
             '电脑6号[紧凶]'
         ]
         
-        self.engine = GameEngine(player_names, INITIAL_CHIPS)
+        self.engine = GameEngine(player_names, INITIAL_CHIPS, seed=self.seed)
         
         # 设置AI风格
         style_map = {
@@ -302,24 +304,24 @@ class SilentGameRunner:
         hole_cards = player.hand.cards if player.hand else []
         community_cards = game_state.table.community_cards
         
-        hand_strength = self.ai_engine.evaluate_hand_strength(hole_cards, community_cards)
-        win_prob = hand_strength
+        # 鲨鱼AI在时间预算内自己计算特征并决策
+        if player.ai_style == 'SHARK':
+            action, amount = self.shark_ai.decide(player, betting_round)
+            return action, amount, self.shark_ai.last_decision.get('hand_strength', 0.5)
         
+        hand_strength = self.ai_engine.evaluate_hand_strength(hole_cards, community_cards)
         amount_to_call = betting_round.get_amount_to_call(player)
         total_pot = game_state.table.total_pot
+        win_prob = self.ai_engine.estimate_win_probability(
+            hole_cards, community_cards,
+            threshold=self.ai_engine.breakeven_equity(total_pot, amount_to_call))
         pot_odds = self.ai_engine.calculate_pot_odds(total_pot, amount_to_call) if amount_to_call > 0 else 0
         ev = self.ai_engine.calculate_expected_value(hand_strength, pot_odds, amount_to_call, total_pot)
         
-        # 鲨鱼AI使用自己的决策
-        if player.ai_style == 'SHARK':
-            action, amount = self.shark_ai.get_action(
-                player, betting_round, hand_strength, win_prob, pot_odds, ev
-            )
-        else:
-            # 其他AI使用标准引擎
-            action, amount = self.ai_engine.get_action(
-                player, betting_round, hand_strength, win_prob, pot_odds, ev
-            )
+        # 其他AI使用标准引擎
+        action, amount = self.ai_engine.get_action(
+            player, betting_round, hand_strength, win_prob, pot_odds, ev
+        )
         
         return action, amount, hand_strength
     
@@ -724,18 +726,18 @@ class SilentGameRunner:
         if len(community_cards) < 5:
             return
         
-        best_rank = float('inf')
+        best_key = -1
         winners = []
         
         for player in active_players:
             if player.hand and len(player.hand.cards) == 2:
                 all_cards = player.hand.cards + community_cards
                 try:
-                    rank, values = PokerEvaluator.evaluate_hand(all_cards)
-                    if rank < best_rank:
-                        best_rank = rank
+                    key = PokerEvaluator.evaluate_key(all_cards)
+                    if key > best_key:
+                        best_key = key
                         winners = [player]
-                    elif rank == best_rank:
+                    elif key == best_key:
                         winners.append(player)
                 except:
                     continue
@@ -1066,6 +1068,11 @@ class SilentGameRunner:
         lines.append(f"\n  【其他统计】")
         lines.append(f"  总弃牌:         {s['folds']}次")
         lines.append(f"  总跟注:         {s['call_count']}次")
+        latency = self.shark_ai.latency_stats()
+        if latency['count']:
+            lines.append(f"  决策耗时:       p50 {latency['p50'] * 1000:.2f}ms / p90 {latency['p90'] * 1000:.2f}ms / "
+                         f"p99 {latency['p99'] * 1000:.2f}ms / 最大 {latency['max'] * 1000:.2f}ms "
+                         f"（{latency['count']}次，超时{latency['over_budget']}次）")
         if s.get('eliminated'):
             lines.append(f"  游戏结果:       淘汰 (第{s['eliminated_at']}手)")
         elif s.get('victory'):
@@ -0,0 +1,153 @@
+"""
+NumPy 批量手牌评估器
+一次调用评估 N 手 5-7 张牌，结果与 PokerEvaluator.evaluate_key 完全一致
+
+牌编号约定：card_id = (value - 2) * 4 + 花色序号，花色顺序为 H, D, C, S
+"""
+
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 为可选依赖，未安装时仅批量接口不可用
+    np = None
+
+from . import lookup_evaluator
+from .card import Card
+
+SUIT_ORDER = Card.SUIT_ORDER
+
+# 每批处理的行数，限制中间数组的内存占用
+CHUNK_ROWS = 1 << 18
+
+_rank_quinary = None   # 排序后的五进制和
+_rank_keys = None      # 与 _rank_quinary 对应的牌力键
+_flush_keys = None     # 13位同花掩码 -> 牌力键
+_pow5_by_id = None     # 牌编号 -> 五进制权重
+_bit_by_id = None      # 牌编号 -> 花色分段的牌面值位（每种花色占13位）
+
+
+def card_index(card) -> int:
+    """Card -> 0-51 的牌编号（即 Card.id）"""
+    return card.id
+
+
+def cards_to_indices(hands: Sequence[Sequence]) -> 'np.ndarray':
+    """
+    将若干手牌（Card 列表）转换为 [N, k] 的牌编号矩阵
+
+    Args:
+        hands: 每手牌张数相同的 Card 列表序列
+
+    Returns:
+        uint8 类型的牌编号矩阵
+    """
+    _require_numpy()
+    return np.array([[c.id for c in hand] for hand in hands], dtype=np.uint8)
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("批量评估需要安装 numpy: pip install numpy")
+
+
+def _ensure_arrays():
+    """由查表评估器的表生成 NumPy 数组（只执行一次）"""
+    global _rank_quinary, _rank_keys, _flush_keys, _pow5_by_id, _bit_by_id
+    if _rank_quinary is not None:
+        return
+
+    if lookup_evaluator._RANK_TABLE is None:
+        lookup_evaluator.build_tables()
+
+    from .table_cache import get_mapped_tables
+    mapped = get_mapped_tables()
+    if mapped is not None:
+        # 直接在映射的文件上建立只读数组，多进程共享同一份物理内存
+        buffer, layout, entries = mapped['mmap'], mapped['layout'], mapped['rank_entries']
+        _rank_quinary = np.frombuffer(buffer, dtype='<i8', count=entries, offset=layout['rank_quinary'])
+        _rank_keys = np.frombuffer(buffer, dtype='<i4', count=entries, offset=layout['rank_keys'])
+        _flush_keys = np.frombuffer(buffer, dtype='<i4', count=1 << 13, offset=layout['flush_keys'])
+    else:
+        items = sorted(lookup_evaluator._RANK_TABLE.items())
+        _rank_quinary = np.array([q for q, _ in items], dtype=np.int64)
+        _rank_keys = np.array([k for _, k in items], dtype=np.int32)
+        _flush_keys = np.array(lookup_evaluator._FLUSH_TABLE, dtype=np.int32)
+    _pow5_by_id = np.array(lookup_evaluator._POW5_BY_ID, dtype=np.int64)
+    _bit_by_id = np.array(lookup_evaluator._SUIT_BIT_BY_ID, dtype=np.int64)
+
+
+def _evaluate_chunk(ids: 'np.ndarray') -> 'np.ndarray':
+    # 每种花色的牌面值掩码占13位，按行求和即可一次得到4个花色掩码
+    return _evaluate_sums(_pow5_by_id[ids].sum(axis=1), _bit_by_id[ids].sum(axis=1))
+
+
+def _evaluate_sums(quinary: 'np.ndarray', suit_bits: 'np.ndarray') -> 'np.ndarray':
+    keys = _rank_keys[np.searchsorted(_rank_quinary, quinary)]
+    flush = _flush_keys[suit_bits & 0x1FFF]
+    for suit in range(1, 4):
+        flush = np.maximum(flush, _flush_keys[(suit_bits >> (13 * suit)) & 0x1FFF])
+
+    # 7张牌以内同花不会与四条/葫芦共存，有同花时同花键即为最佳
+    return np.where(flush > 0, flush, keys)
+
+
+def evaluate_batch(hands) -> 'np.ndarray':
+    """
+    批量评估手牌
+
+    Args:
+        hands: [N, k] 的牌编号矩阵（k 为 5-7），或等长 Card 列表的序列
+
+    Returns:
+        [N] 的 int32 牌力键数组，与 PokerEvaluator.evaluate_key 一致
+    """
+    _require_numpy()
+    _ensure_arrays()
+
+    if not isinstance(hands, np.ndarray):
+        hands = cards_to_indices(hands)
+    if hands.ndim != 2 or not 5 <= hands.shape[1] <= 7:
+        raise ValueError(f"Expected an [N, 5-7] array of card ids, got shape {hands.shape}")
+
+    ids = hands.astype(np.intp, copy=False)
+    if len(ids) <= CHUNK_ROWS:
+        return _evaluate_chunk(ids)
+
+    result = np.empty(len(ids), dtype=np.int32)
+    for start in range(0, len(ids), CHUNK_ROWS):
+        result[start:start + CHUNK_ROWS] = _evaluate_chunk(ids[start:start + CHUNK_ROWS])
+    return result
+
+
+def card_weights() -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    每张牌的五进制权重和花色分段位（按牌编号索引的 int64 数组）
+
+    一手牌的五进制和与花色掩码分别是各张牌对应值之和，
+    公共牌固定时可以先累加公共牌部分，再与各组底牌相加后调用 evaluate_sums
+    """
+    _require_numpy()
+    _ensure_arrays()
+    return _pow5_by_id, _bit_by_id
+
+
+def evaluate_sums(quinary: 'np.ndarray', suit_bits: 'np.ndarray') -> 'np.ndarray':
+    """
+    由预先累加的五进制和与花色掩码批量求牌力键
+
+    Args:
+        quinary: [N] 每手牌的五进制和（card_weights 第一项之和）
+        suit_bits: [N] 每手牌的花色分段掩码（card_weights 第二项之和）
+
+    Returns:
+        [N] 的牌力键数组，与 evaluate_batch 一致
+    """
+    _require_numpy()
+    _ensure_arrays()
+    return _evaluate_sums(quinary, suit_bits)
+
+
+def indices_to_cards(ids: Sequence[int]) -> List:
+    """牌编号序列 -> Card 列表"""
+    return [Card.from_id(int(i)) for i in ids]
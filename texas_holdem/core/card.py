@@ -3,46 +3,7 @@
 表示一张标准的扑克牌，包含花色和牌面值
 """
 
-import sys
-import os
-
-
-def _supports_ansi():
-    """检测当前环境是否支持 ANSI 颜色代码"""
-    # 如果显式设置了 NO_COLOR，则禁用颜色
-    if os.environ.get('NO_COLOR'):
-        return False
-    
-    # 如果显式设置了 FORCE_COLOR，则启用颜色
-    if os.environ.get('FORCE_COLOR'):
-        return True
-    
-    # Windows 平台检测
-    if sys.platform == 'win32':
-        # 检测是否在支持 ANSI 的终端中（Windows 10+）
-        try:
-            import ctypes
-            from ctypes import wintypes
-            
-            kernel32 = ctypes.windll.kernel32
-            STD_OUTPUT_HANDLE = -11
-            ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
-            
-            handle = kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
-            if handle == -1:
-                return False
-                
-            mode = wintypes.DWORD()
-            if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
-                return bool(mode.value & ENABLE_VIRTUAL_TERMINAL_PROCESSING)
-        except:
-            pass
-        
-        # 在旧版 Windows 或某些终端中不支持
-        return False
-    
-    # Unix/Linux/Mac 通常支持 ANSI
-    return hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
+from .card_render import card_glyph
 
 
 class Card:
@@ -99,22 +60,90 @@ class Card:
         11: 'J', 12: 'Q', 13: 'K', 14: 'A'
     }
 
-    def __init__(self, suit: str, rank: str):
+    # 花色顺序（决定牌编号），与 batch_evaluator 的约定一致
+    SUIT_ORDER = ('H', 'D', 'C', 'S')
+
+    # 简写解析用：'T' 与 '10' 等价，花色大小写均可
+    _PARSE_RANKS = {'T': '10'}
+
+    __slots__ = ('suit', 'rank', 'value', 'id', 'mask', 'suit_index')
+
+    # 52张牌的唯一实例，按 (suit, rank) 和牌编号索引
+    _INTERNED = {}
+    _BY_ID = [None] * 52
+
+    def __new__(cls, suit: str, rank: str):
         """
-        初始化一张扑克牌
+        获取一张扑克牌（每种牌只有一个共享的不可变实例）
 
         Args:
             suit: 花色 ('H', 'D', 'C', 'S')
             rank: 牌面值 ('2'-'10', 'J', 'Q', 'K', 'A')
         """
-        if suit not in self.SUITS:
-            raise ValueError(f"Invalid suit: {suit}. Must be one of {list(self.SUITS.keys())}")
-        if rank not in self.RANKS:
-            raise ValueError(f"Invalid rank: {rank}. Must be one of {list(self.RANKS.keys())}")
+        card = cls._INTERNED.get((suit, rank))
+        if card is not None:
+            return card
+
+        if suit not in cls.SUITS:
+            raise ValueError(f"Invalid suit: {suit}. Must be one of {list(cls.SUITS.keys())}")
+        if rank not in cls.RANKS:
+            raise ValueError(f"Invalid rank: {rank}. Must be one of {list(cls.RANKS.keys())}")
+
+        card = object.__new__(cls)
+        value = cls.RANKS[rank]
+        suit_index = cls.SUIT_ORDER.index(suit)
+        card_id = (value - 2) * 4 + suit_index
+        for name, attr in (('suit', suit), ('rank', rank), ('value', value), ('id', card_id),
+                           ('mask', 1 << card_id), ('suit_index', suit_index)):
+            object.__setattr__(card, name, attr)
+
+        cls._INTERNED[(suit, rank)] = card
+        cls._BY_ID[card_id] = card
+        return card
 
-        self.suit = suit
-        self.rank = rank
-        self.value = self.RANKS[rank]
+    def __setattr__(self, name, value):
+        raise AttributeError("Card is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Card is immutable")
+
+    @classmethod
+    def from_id(cls, card_id: int) -> 'Card':
+        """由 0-51 的牌编号获取扑克牌（编号 = (牌面值-2)*4 + 花色序号）"""
+        return cls._BY_ID[card_id]
+
+    @classmethod
+    def parse(cls, text: str) -> 'Card':
+        """
+        解析简写形式，如 "As"、"Th"、"10d"、"2C"
+
+        Args:
+            text: 牌面值 + 花色字母
+
+        Returns:
+            对应的扑克牌
+        """
+        text = text.strip()
+        if len(text) < 2:
+            raise ValueError(f"Invalid card: {text!r}")
+        rank, suit = text[:-1].upper(), text[-1].upper()
+        rank = cls._PARSE_RANKS.get(rank, rank)
+        return cls(suit, rank)
+
+    @classmethod
+    def all_cards(cls) -> list:
+        """按牌编号顺序返回全部52张牌"""
+        return list(cls._BY_ID)
+
+    def __reduce__(self):
+        # pickle 还原时同样返回共享实例
+        return (Card, (self.suit, self.rank))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __repr__(self):
         return f"Card('{self.suit}', '{self.rank}')"
@@ -122,41 +151,19 @@ class Card:
     def __str__(self):
         """
         返回扑克牌的字符串表示
-        自动检测环境支持情况，选择合适的显示方式
+        根据 sys.stdout 的显示能力（只检测一次）从预生成的字符串表中查找
         """
-        # 检测是否支持 ANSI 颜色
-        use_color = _supports_ansi()
-        
-        # 检测是否支持 Unicode（简单检测：尝试编码）
-        try:
-            '♥'.encode(sys.stdout.encoding or 'utf-8')
-            use_symbols = True
-        except (UnicodeEncodeError, AttributeError):
-            use_symbols = False
-        
-        # 选择花色表示方式
-        if use_symbols:
-            suit_symbol = self.SUIT_SYMBOLS[self.suit]
-        else:
-            suit_symbol = self.SUIT_ASCII[self.suit]
-        
-        rank_str = self.rank if len(self.rank) <= 2 else self.rank
-        
-        if use_color:
-            color_key = self.SUIT_COLORS[self.suit]
-            color_code = self.COLORS[color_key]
-            reset_code = self.COLORS['reset']
-            return f"{color_code}{rank_str}{suit_symbol}{reset_code}"
-        else:
-            return f"{rank_str}{suit_symbol}"
+        return card_glyph(self)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Card):
             return False
-        return self.suit == other.suit and self.rank == other.rank
+        return self.id == other.id
 
     def __hash__(self):
-        return hash((self.suit, self.rank))
+        return self.id
 
     def __lt__(self, other):
         if not isinstance(other, Card):
@@ -186,3 +193,10 @@ class Card:
     def from_dict(cls, data):
         """从字典创建Card对象"""
         return cls(data['suit'], data['rank'])
+
+
+# 预先创建全部52张牌
+for _suit in Card.SUIT_ORDER:
+    for _rank in Card.RANKS:
+        Card(_suit, _rank)
+del _suit, _rank
@@ -0,0 +1,166 @@
+"""
+扑克牌渲染
+终端能力（ANSI 颜色、Unicode 花色符号）按输出流只检测一次，
+52张牌在4种显示方式下的字符串预先生成，渲染时直接查表
+"""
+
+import os
+import sys
+import weakref
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def _supports_ansi(stream=None) -> bool:
+    """检测输出流是否支持 ANSI 颜色代码"""
+    # 如果显式设置了 NO_COLOR，则禁用颜色
+    if os.environ.get('NO_COLOR'):
+        return False
+
+    # 如果显式设置了 FORCE_COLOR，则启用颜色
+    if os.environ.get('FORCE_COLOR'):
+        return True
+
+    stream = stream if stream is not None else sys.stdout
+
+    # Windows 平台检测
+    if sys.platform == 'win32':
+        # 检测是否在支持 ANSI 的终端中（Windows 10+）
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            kernel32 = ctypes.windll.kernel32
+            STD_OUTPUT_HANDLE = -11
+            ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+            handle = kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
+            if handle == -1:
+                return False
+
+            mode = wintypes.DWORD()
+            if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                return bool(mode.value & ENABLE_VIRTUAL_TERMINAL_PROCESSING)
+        except:
+            pass
+
+        # 在旧版 Windows 或某些终端中不支持
+        return False
+
+    # Unix/Linux/Mac 通常支持 ANSI
+    return hasattr(stream, 'isatty') and stream.isatty()
+
+
+def _supports_unicode(stream=None) -> bool:
+    """检测输出流的编码能否输出花色符号"""
+    stream = stream if stream is not None else sys.stdout
+    try:
+        '♥♦♣♠'.encode(stream.encoding or 'utf-8')
+        return True
+    except (UnicodeEncodeError, AttributeError, LookupError, TypeError):
+        return False
+
+
+# 输出流 -> (use_color, use_symbols)；流对象被回收后自动移除
+_capabilities: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+# 不支持弱引用的流按 id 缓存
+_capabilities_by_id: Dict[int, Tuple[object, Tuple[bool, bool]]] = {}
+
+# 4种显示方式（颜色 × 符号）下按牌编号排列的字符串
+_GLYPHS: Optional[List[List[str]]] = None
+
+
+def get_capabilities(stream=None) -> Tuple[bool, bool]:
+    """
+    获取输出流的显示能力（每个流只检测一次）
+
+    Args:
+        stream: 输出流，默认 sys.stdout
+
+    Returns:
+        (use_color, use_symbols) 元组
+    """
+    stream = stream if stream is not None else sys.stdout
+    try:
+        caps = _capabilities.get(stream)
+    except TypeError:
+        entry = _capabilities_by_id.get(id(stream))
+        caps = entry[1] if entry is not None and entry[0] is stream else None
+    if caps is not None:
+        return caps
+
+    caps = (_supports_ansi(stream), _supports_unicode(stream))
+    try:
+        _capabilities[stream] = caps
+    except TypeError:
+        _capabilities_by_id[id(stream)] = (stream, caps)
+    return caps
+
+
+def reset_capabilities():
+    """清除已检测的能力（环境变量或终端设置改变后调用）"""
+    _capabilities.clear()
+    _capabilities_by_id.clear()
+
+
+def _build_glyphs() -> List[List[str]]:
+    """生成 52张牌 × 4种显示方式 的字符串表"""
+    from .card import Card
+
+    glyphs = []
+    for use_color in (False, True):
+        for use_symbols in (False, True):
+            row = []
+            for card in Card.all_cards():
+                symbols = Card.SUIT_SYMBOLS if use_symbols else Card.SUIT_ASCII
+                text = f"{card.rank}{symbols[card.suit]}"
+                if use_color:
+                    color_code = Card.COLORS[Card.SUIT_COLORS[card.suit]]
+                    text = f"{color_code}{text}{Card.COLORS['reset']}"
+                row.append(text)
+            glyphs.append(row)
+    return glyphs
+
+
+def card_glyph(card, stream=None) -> str:
+    """
+    按输出流的显示能力渲染一张牌
+
+    Args:
+        card: Card 对象
+        stream: 输出流，默认 sys.stdout
+
+    Returns:
+        带颜色/花色符号（视终端支持情况）的字符串
+    """
+    global _GLYPHS
+    if _GLYPHS is None:
+        _GLYPHS = _build_glyphs()
+    use_color, use_symbols = get_capabilities(stream)
+    return _GLYPHS[use_color * 2 + use_symbols][card.id]
+
+
+def render_cards(cards: Iterable, sep: str = ' ', stream=None) -> str:
+    """
+    渲染多张牌
+
+    Args:
+        cards: Card 对象，或 {'suit', 'rank'} 字典（网络/存档格式）
+        sep: 分隔符
+        stream: 输出流，默认 sys.stdout
+
+    Returns:
+        拼接后的字符串
+    """
+    global _GLYPHS
+    if _GLYPHS is None:
+        _GLYPHS = _build_glyphs()
+    use_color, use_symbols = get_capabilities(stream)
+    row = _GLYPHS[use_color * 2 + use_symbols]
+
+    parts = []
+    for card in cards:
+        if isinstance(card, dict):
+            from .card import Card
+            card = Card.from_dict(card)
+        parts.append(row[card.id])
+    return sep.join(parts)
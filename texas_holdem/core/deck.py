@@ -4,27 +4,67 @@
 """
 
 import random
+from typing import List, Optional, Sequence
 from .card import Card
 
+# 红桃、方块、梅花、黑桃依次排列的完整牌组
+_FULL_DECK = tuple(Card(suit, rank) for suit in ['H', 'D', 'C', 'S']
+                   for rank in ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A'])
+
 class Deck:
-    def __init__(self):
-        """初始化一副完整的52张扑克牌"""
-        self.cards = []
+    def __init__(self, seed: Optional[int] = None, rng=None):
+        """
+        初始化一副完整的52张扑克牌
+
+        牌存放在固定的52格数组中，发牌只移动游标，不再切片复制列表
+
+        Args:
+            seed: 随机种子；指定后该牌组使用独立的 random.Random，洗牌结果可复现
+            rng: 自定义随机数生成器（random.Random 或 numpy.random.Generator，
+                 需提供 shuffle 方法）；都不指定时沿用全局 random 模块
+        """
+        if rng is None:
+            rng = random.Random(seed) if seed is not None else random
+        self.rng = rng
+        self._slots: List[Card] = []
+        self._cursor = 0
         self.reset()
 
+    @classmethod
+    def streams(cls, seed: int, count: int) -> List['Deck']:
+        """
+        由一个种子派生多个互相独立的牌组（用于并行模拟）
+
+        安装了 numpy 时使用 SeedSequence.spawn 派生子流，否则用字符串种子区分
+
+        Args:
+            seed: 根种子
+            count: 牌组数量
+
+        Returns:
+            牌组列表
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return [cls(rng=random.Random(f"{seed}:{i}")) for i in range(count)]
+        children = np.random.SeedSequence(seed).spawn(count)
+        return [cls(rng=random.Random(int(child.generate_state(1)[0]))) for child in children]
+
     def reset(self):
         """重置牌组为完整的52张牌"""
-        self.cards = []
-        suits = ['H', 'D', 'C', 'S']  # 红桃、方块、梅花、黑桃
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-
-        for suit in suits:
-            for rank in ranks:
-                self.cards.append(Card(suit, rank))
+        # 52张牌是共享的不可变实例，这里只复制引用
+        self._slots = list(_FULL_DECK)
+        self._cursor = 0
 
     def shuffle(self):
-        """随机洗牌"""
-        random.shuffle(self.cards)
+        """随机洗牌（只打乱尚未发出的牌）"""
+        if self._cursor == 0:
+            self.rng.shuffle(self._slots)
+        else:
+            remaining = self._slots[self._cursor:]
+            self.rng.shuffle(remaining)
+            self._slots[self._cursor:] = remaining
 
     def draw(self, count=1):
         """
@@ -36,23 +76,61 @@ class Deck:
         Returns:
             如果count=1，返回单张Card对象；否则返回Card对象列表
         """
-        if count > len(self.cards):
-            raise ValueError(f"Cannot draw {count} cards, only {len(self.cards)} remaining")
+        remaining = len(self._slots) - self._cursor
+        if count > remaining:
+            raise ValueError(f"Cannot draw {count} cards, only {remaining} remaining")
+
+        start = self._cursor
+        self._cursor = start + count
+
+        if count == 1:
+            return self._slots[start]
+        return self._slots[start:self._cursor]
+
+    def burn(self, count=1):
+        """烧掉顶部的牌（只移动游标）"""
+        remaining = len(self._slots) - self._cursor
+        if count > remaining:
+            raise ValueError(f"Cannot burn {count} cards, only {remaining} remaining")
+        self._cursor += count
+
+    def record(self) -> List[int]:
+        """
+        记录整副牌当前的顺序（牌编号列表，含已发出的牌）
+
+        配合 replay 可以精确重现一手牌的发牌过程
+        """
+        return [card.id for card in self._slots]
+
+    def replay(self, order: Sequence[int]):
+        """
+        按记录的顺序恢复牌组，游标回到顶部
+
+        Args:
+            order: record 返回的牌编号列表
+        """
+        self._slots = [Card.from_id(card_id) for card_id in order]
+        self._cursor = 0
 
-        drawn = self.cards[:count]
-        self.cards = self.cards[count:]
+    @property
+    def cards(self) -> List[Card]:
+        """尚未发出的牌（副本）"""
+        return self._slots[self._cursor:]
 
-        return drawn[0] if count == 1 else drawn
+    @cards.setter
+    def cards(self, cards: Sequence[Card]):
+        self._slots = list(cards)
+        self._cursor = 0
 
     def remaining(self):
         """返回剩余牌的数量"""
-        return len(self.cards)
+        return len(self._slots) - self._cursor
 
     def __len__(self):
-        return len(self.cards)
+        return len(self._slots) - self._cursor
 
     def __str__(self):
-        return f"Deck with {len(self.cards)} cards"
+        return f"Deck with {len(self)} cards"
 
     def peek(self, count=1):
         """
@@ -64,6 +142,7 @@ class Deck:
         Returns:
             Card对象列表
         """
-        if count > len(self.cards):
-            raise ValueError(f"Cannot peek {count} cards, only {len(self.cards)} remaining")
-        return self.cards[:count]
\ No newline at end of file
+        remaining = len(self._slots) - self._cursor
+        if count > remaining:
+            raise ValueError(f"Cannot peek {count} cards, only {remaining} remaining")
+        return self._slots[self._cursor:self._cursor + count]
@@ -0,0 +1,238 @@
+"""
+听牌分析器
+用每种花色一个13位牌面值掩码表示手牌（与 lookup_evaluator 的花色分段掩码相同），
+逐张检查剩余的牌，精确统计能让己方牌型升级的 outs
+"""
+
+from typing import Any, Dict, Sequence
+
+from . import lookup_evaluator
+from .card import Card
+from .lookup_evaluator import (HIGH_CARD, ONE_PAIR, TWO_PAIR, THREE_OF_A_KIND, STRAIGHT,
+                               FLUSH, FULL_HOUSE, FOUR_OF_A_KIND, STRAIGHT_FLUSH)
+
+# 被污染的 outs（同时可能让对手做成更大的牌）折算的权重
+TAINTED_WEIGHT = 0.5
+
+_SUIT_MASK = 0x1FFF
+_SUIT_SHIFTS = (0, 13, 26, 39)
+_BIT_BY_ID = [1 << ((card_id >> 2) + 13 * (card_id & 3)) for card_id in range(52)]
+
+# 13位掩码 -> 顺子最大牌面值（无顺子为0），与 lookup_evaluator 共用
+_straight_high = None
+
+
+def straight_table():
+    """13位牌面值掩码 -> 顺子最大牌面值（无顺子为0）的查找表"""
+    global _straight_high
+    if _straight_high is None:
+        if lookup_evaluator._STRAIGHT_HIGH is None:
+            lookup_evaluator.build_tables()
+        _straight_high = lookup_evaluator._STRAIGHT_HIGH
+    return _straight_high
+
+
+def card_bits(cards: Sequence[Card]) -> int:
+    """牌列表的花色分段掩码（每种花色占13位）"""
+    bits = 0
+    for card in cards:
+        bits |= _BIT_BY_ID[card.id]
+    return bits
+
+
+def hand_category(bits: int) -> int:
+    """
+    由花色分段掩码判断牌型等级（适用于不超过7张牌）
+
+    Args:
+        bits: card_bits 的结果
+
+    Returns:
+        牌型等级（HIGH_CARD 到 STRAIGHT_FLUSH）
+    """
+    straight_high = straight_table()
+    a = bits & _SUIT_MASK
+    b = (bits >> 13) & _SUIT_MASK
+    c = (bits >> 26) & _SUIT_MASK
+    d = bits >> 39
+
+    # 7张牌以内同花与四条/葫芦不可能共存
+    for suited in (a, b, c, d):
+        if bin(suited).count('1') >= 5:
+            return STRAIGHT_FLUSH if straight_high[suited] else FLUSH
+
+    if a & b & c & d:
+        return FOUR_OF_A_KIND
+    trips = (a & b & c) | (a & b & d) | (a & c & d) | (b & c & d)
+    pairs = (a & b) | (a & c) | (a & d) | (b & c) | (b & d) | (c & d)
+    if trips and (trips & (trips - 1) or pairs & ~trips):
+        return FULL_HOUSE
+    if straight_high[a | b | c | d]:
+        return STRAIGHT
+    if trips:
+        return THREE_OF_A_KIND
+    if pairs & (pairs - 1):
+        return TWO_PAIR
+    if pairs:
+        return ONE_PAIR
+    return HIGH_CARD
+
+
+def hit_probability(outs: float, unseen: int, cards_to_come: int) -> float:
+    """
+    剩余 cards_to_come 张牌中至少出现一张 out 的概率
+
+    Args:
+        outs: outs 数（可以是折算后的小数）
+        unseen: 未见过的牌数
+        cards_to_come: 还要发的公共牌数
+
+    Returns:
+        概率（0.0-1.0）
+    """
+    if outs <= 0 or cards_to_come <= 0 or unseen <= 0:
+        return 0.0
+    miss = 1.0
+    for i in range(cards_to_come):
+        miss *= max(0.0, (unseen - i - outs) / (unseen - i))
+    return 1.0 - miss
+
+
+class DrawAnalyzer:
+    """精确的 outs 统计与听牌识别"""
+
+    @staticmethod
+    def analyze(hole_cards: Sequence[Card], community_cards: Sequence[Card],
+                discount: bool = False) -> Dict[str, Any]:
+        """
+        统计下一张牌中能让己方牌型升级的 outs
+
+        一张牌算作 out，当且仅当它让己方的牌型等级提高，且高于公共牌加这张牌本身的牌型
+        （即升级用到了底牌）。同时做成多种牌型的牌只计一次，按升级后的牌型归类。
+        高牌升一对但对子小于公共牌最大牌（例如 72 在 KQ9 上配7）不算 out，
+        单独记入 'weak_pair'，不计入 'total' 和 'equity'
+
+        Args:
+            hole_cards: 底牌（2张）
+            community_cards: 公共牌（3-4张；5张时没有 outs）
+            discount: 是否把被污染的 outs 按 TAINTED_WEIGHT 折算：
+                      做成顺子/同花的同时让公共牌成对（对手可能葫芦），
+                      或做成同花以下的牌型时让公共牌出现3张同花色（对手可能同花）
+
+        Returns:
+            {'total', 'flush', 'straight', 'pair', 'outs', 'weak_pair', 'weak_outs',
+             'tainted', 'effective', 'equity', 'category', 'backdoor_flush'}
+            其中 'pair' 包括顶对及以上的一对、两对、三条、葫芦、四条；'weak_pair'/'weak_outs'
+            为只做成小对子的牌；'effective' 为折算后的 outs 数，
+            'equity' 为剩余街至少命中一张 out 的概率
+        """
+        result = {'total': 0, 'flush': 0, 'straight': 0, 'pair': 0, 'outs': [],
+                  'weak_pair': 0, 'weak_outs': [], 'tainted': 0, 'effective': 0.0, 'equity': 0.0,
+                  'category': HIGH_CARD, 'backdoor_flush': False}
+        if len(hole_cards) != 2 or len(community_cards) < 3:
+            return result
+
+        hole_bits = card_bits(hole_cards)
+        board_bits = card_bits(community_cards)
+        hero_bits = hole_bits | board_bits
+        category = hand_category(hero_bits)
+        result['category'] = category
+        cards_to_come = 5 - len(community_cards)
+        if cards_to_come <= 0:
+            return result
+
+        board_category = hand_category(board_bits)
+        board_ranks = (board_bits | board_bits >> 13 | board_bits >> 26 | board_bits >> 39) & _SUIT_MASK
+        board_high_rank = board_ranks.bit_length() - 1
+        effective = 0.0
+        for card_id in range(52):
+            bit = _BIT_BY_ID[card_id]
+            if hero_bits & bit:
+                continue
+            improved = hand_category(hero_bits | bit)
+            if improved <= category:
+                continue
+            board_improved = hand_category(board_bits | bit)
+            if improved <= board_improved:
+                continue
+            # 高牌 -> 一对时这张牌一定与底牌成对，对子小于公共牌最大牌时只是小对子
+            if improved == ONE_PAIR and card_id >> 2 < board_high_rank:
+                result['weak_pair'] += 1
+                result['weak_outs'].append(Card.from_id(card_id))
+                continue
+
+            if improved >= FLUSH and improved != FULL_HOUSE and improved != FOUR_OF_A_KIND:
+                result['flush'] += 1
+            elif improved == STRAIGHT:
+                result['straight'] += 1
+            else:
+                result['pair'] += 1
+            result['outs'].append(Card.from_id(card_id))
+
+            weight = 1.0
+            if discount:
+                shift = 13 * (card_id & 3)
+                suited_on_board = bin(((board_bits | bit) >> shift) & _SUIT_MASK).count('1')
+                pairs_board = board_improved >= ONE_PAIR and board_improved > board_category
+                if (improved in (STRAIGHT, FLUSH) and pairs_board) or \
+                        (improved < FLUSH and suited_on_board >= 3):
+                    result['tainted'] += 1
+                    weight = TAINTED_WEIGHT
+            effective += weight
+
+        result['total'] = len(result['outs'])
+        result['effective'] = effective
+        unseen = 52 - len(hole_cards) - len(community_cards)
+        result['equity'] = hit_probability(effective, unseen, cards_to_come)
+
+        # 翻牌圈后门同花：底牌参与的3张同花色，还差转牌和河牌两张
+        if cards_to_come == 2 and not result['flush']:
+            for shift in _SUIT_SHIFTS:
+                if hole_bits >> shift & _SUIT_MASK and \
+                        bin(hero_bits >> shift & _SUIT_MASK).count('1') == 3:
+                    result['backdoor_flush'] = True
+                    break
+        return result
+
+    @staticmethod
+    def identify_draws(hole_cards: Sequence[Card], community_cards: Sequence[Card]) -> Dict[str, Dict[str, float]]:
+        """
+        识别听牌类型（供 AI 决策使用）
+
+        Returns:
+            {听牌类型: {'outs': outs 数, 'equity': 命中概率}}，类型包括
+            'flush_draw'、'backdoor_flush'、'oesd'、'gutshot'、'overcards'、'combo_draw'
+        """
+        draws: Dict[str, Dict[str, float]] = {}
+        info = DrawAnalyzer.analyze(hole_cards, community_cards)
+        cards_to_come = 5 - len(community_cards)
+        if cards_to_come <= 0 or len(community_cards) < 3:
+            return draws
+        unseen = 52 - len(hole_cards) - len(community_cards)
+
+        def draw(outs):
+            return {'outs': outs, 'equity': hit_probability(outs, unseen, cards_to_come)}
+
+        if info['flush']:
+            draws['flush_draw'] = draw(info['flush'])
+        if info['backdoor_flush']:
+            draws['backdoor_flush'] = {'outs': 1, 'equity': 0.04}
+        if info['straight'] >= 8:
+            draws['oesd'] = draw(info['straight'])
+        elif info['straight']:
+            draws['gutshot'] = draw(info['straight'])
+
+        # 高张：未与公共牌成对、且大于所有公共牌的底牌，命中即成顶对
+        board_high = max(card.value for card in community_cards)
+        board_values = {card.value for card in community_cards}
+        if info['category'] < TWO_PAIR and hole_cards[0].value != hole_cards[1].value:
+            overcards = {card.value for card in hole_cards
+                         if card.value > board_high and card.value not in board_values}
+            if overcards:
+                outs = sum(1 for card in info['outs'] if card.value in overcards)
+                if outs:
+                    draws['overcards'] = draw(outs)
+
+        if info['flush'] and info['straight']:
+            draws['combo_draw'] = draw(info['flush'] + info['straight'])
+        return draws
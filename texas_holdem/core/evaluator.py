@@ -6,6 +6,7 @@
 import itertools
 from typing import List, Tuple, Dict, Optional
 from .card import Card
+from .lookup_evaluator import LookupEvaluator, BoardEvaluator, unpack_key
 
 class PokerEvaluator:
     """德州扑克手牌评估器"""
@@ -39,7 +40,7 @@ class PokerEvaluator:
     @staticmethod
     def evaluate_hand(cards: List[Card]) -> Tuple[int, List[int]]:
         """
-        评估7张牌中的最佳5张牌组合
+        评估5-7张牌中的最佳5张牌组合
 
         Args:
             cards: 7张牌的列表（2张底牌 + 5张公共牌）
@@ -52,7 +53,88 @@ class PokerEvaluator:
         if len(cards) < 5:
             raise ValueError(f"Need at least 5 cards, got {len(cards)}")
 
-        # 生成所有5张牌的组合
+        # 查表评估：一次遍历得到最佳牌型，不再枚举21种5张组合
+        return LookupEvaluator.evaluate(cards)
+
+    @staticmethod
+    def evaluate_key(cards: List[Card]) -> int:
+        """
+        评估5-7张牌，返回单个整数形式的牌力键
+
+        键中依次打包了手牌等级和比较用牌面值，整数越大牌力越强，
+        两手牌比较只需一次整数比较
+
+        Args:
+            cards: 5-7张牌的列表
+
+        Returns:
+            牌力键（可用 decode_key 还原为 (hand_rank, rank_values)）
+        """
+        if len(cards) < 5:
+            raise ValueError(f"Need at least 5 cards, got {len(cards)}")
+        return LookupEvaluator.evaluate_key(cards)
+
+    @staticmethod
+    def evaluate_batch(hands):
+        """
+        批量评估（需要 numpy）
+
+        Args:
+            hands: [N, k] 的牌编号矩阵（k 为 5-7），编号约定见 batch_evaluator
+
+        Returns:
+            [N] 的牌力键数组，与 evaluate_key 一致
+        """
+        from .batch_evaluator import evaluate_batch
+        return evaluate_batch(hands)
+
+    @staticmethod
+    def rank_hands(holes: List[List[Card]], board: List[Card]) -> Tuple[List[int], List[List[int]]]:
+        """
+        共享公共牌评估多手底牌（公共牌只处理一次）
+
+        Args:
+            holes: 每位玩家的底牌列表
+            board: 公共牌列表
+
+        Returns:
+            (keys, tiers)：每手牌的牌力键，以及按牌力从高到低分组的下标列表
+        """
+        return BoardEvaluator(board).rank_hands(holes)
+
+    @staticmethod
+    def rank_showdown(players: List, board: List[Card]) -> List[List]:
+        """
+        摊牌排名：每位玩家只评估一次，按牌力从高到低分组
+
+        Args:
+            players: 参与摊牌的玩家列表（需有 hand.get_cards()）
+            board: 公共牌列表
+
+        Returns:
+            玩家分组列表，第一组为最强（同组玩家牌力相同）
+        """
+        if len(players) <= 1:
+            return [list(players)] if players else []
+        _, tiers = PokerEvaluator.rank_hands([player.hand.get_cards() for player in players], board)
+        return [[players[i] for i in tier] for tier in tiers]
+
+    @staticmethod
+    def decode_key(key: int) -> Tuple[int, List[int]]:
+        """将牌力键还原为 (hand_rank, rank_values) 元组"""
+        return unpack_key(key)
+
+    @staticmethod
+    def _evaluate_hand_by_combinations(cards: List[Card]) -> Tuple[int, List[int]]:
+        """
+        枚举所有5张组合的参考实现（用于校验查表评估器）
+
+        Args:
+            cards: 5张以上的牌
+
+        Returns:
+            (hand_rank, rank_values) 元组
+        """
         best_rank = -1
         best_rank_values = []
 
@@ -183,21 +265,9 @@ class PokerEvaluator:
             -1: hand2更强
             0: 平局
         """
-        rank1, values1 = PokerEvaluator.evaluate_hand(hand1_cards)
-        rank2, values2 = PokerEvaluator.evaluate_hand(hand2_cards)
-
-        if rank1 > rank2:
-            return 1
-        elif rank1 < rank2:
-            return -1
-        else:
-            # 相同牌型，比较牌面值
-            for v1, v2 in zip(values1, values2):
-                if v1 > v2:
-                    return 1
-                elif v1 < v2:
-                    return -1
-            return 0
+        key1 = PokerEvaluator.evaluate_key(hand1_cards)
+        key2 = PokerEvaluator.evaluate_key(hand2_cards)
+        return (key1 > key2) - (key1 < key2)
 
     @staticmethod
     def get_hand_name(hand_rank: int) -> str:
@@ -215,7 +285,20 @@ class PokerEvaluator:
         Returns:
             手牌描述字符串
         """
-        rank, values = PokerEvaluator.evaluate_hand(cards)
+        return PokerEvaluator.describe_key(PokerEvaluator.evaluate_key(cards))
+
+    @staticmethod
+    def describe_key(key: int) -> str:
+        """
+        根据牌力键生成手牌描述
+
+        Args:
+            key: evaluate_key 返回的牌力键
+
+        Returns:
+            手牌描述字符串
+        """
+        rank, values = PokerEvaluator.decode_key(key)
         hand_name = PokerEvaluator.get_hand_name(rank)
 
         # 添加具体的牌面值信息
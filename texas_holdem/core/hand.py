@@ -5,6 +5,7 @@
 
 from typing import List
 from .card import Card
+from .card_render import render_cards
 
 class Hand:
     def __init__(self):
@@ -46,7 +47,7 @@ class Hand:
     def __str__(self):
         if not self.cards:
             return "Empty hand"
-        return " ".join(str(card) for card in self.cards)
+        return render_cards(self.cards)
 
     def __repr__(self):
         return f"Hand({self.cards})"
@@ -0,0 +1,390 @@
+"""
+查表手牌评估器
+使用预计算的牌面值表和同花表，一次遍历即可评估5-7张牌
+"""
+
+import itertools
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# 手牌等级（与 PokerEvaluator 保持一致）
+HIGH_CARD = 0
+ONE_PAIR = 1
+TWO_PAIR = 2
+THREE_OF_A_KIND = 3
+STRAIGHT = 4
+FLUSH = 5
+FULL_HOUSE = 6
+FOUR_OF_A_KIND = 7
+STRAIGHT_FLUSH = 8
+ROYAL_FLUSH = 9
+
+# 每个等级比较值列表的长度，用于打包/解包整数键
+VALUES_PER_RANK = {
+    HIGH_CARD: 5,
+    ONE_PAIR: 4,
+    TWO_PAIR: 3,
+    THREE_OF_A_KIND: 3,
+    STRAIGHT: 1,
+    FLUSH: 5,
+    FULL_HOUSE: 2,
+    FOUR_OF_A_KIND: 2,
+    STRAIGHT_FLUSH: 1,
+    ROYAL_FLUSH: 1,
+}
+
+# 牌面值 2-14 对应的五进制权重：每种牌面值最多4张，五进制求和不会进位，
+# 因此牌面值多重集合与求和结果一一对应
+_POW5 = [0, 0] + [5 ** (value - 2) for value in range(2, 15)]
+_BIT = [0, 0] + [1 << (value - 2) for value in range(2, 15)]
+
+# 按牌编号（Card.id = (value-2)*4 + 花色序号）索引的权重：
+# 每种花色的牌面值掩码占13位，按位或即可同时得到4个花色的掩码
+_POW5_BY_ID = [5 ** (card_id >> 2) for card_id in range(52)]
+_SUIT_BIT_BY_ID = [1 << ((card_id >> 2) + 13 * (card_id & 3)) for card_id in range(52)]
+_SUIT_SHIFT_BY_ID = [13 * (card_id & 3) for card_id in range(52)]
+
+# 延迟构建的查找表
+_RANK_TABLE: Optional[Dict[int, int]] = None  # 五进制和 -> 打包键（非同花）
+_FLUSH_TABLE: Optional[Sequence[int]] = None      # 同花色13位掩码 -> 打包键（不足5张为0）
+_STRAIGHT_HIGH: Optional[Sequence[int]] = None    # 13位掩码 -> 顺子最大牌面值（无顺子为0）
+_DECODE_CACHE: Dict[int, Tuple[int, Tuple[int, ...]]] = {}
+
+
+def pack_key(hand_rank: int, rank_values: Sequence[int]) -> int:
+    """
+    将 (hand_rank, rank_values) 打包为单个整数
+
+    每个牌面值占4位，等级占最高位段；同一等级的比较值列表长度固定，
+    因此整数大小关系与原元组的比较结果一致
+    """
+    key = hand_rank
+    for value in rank_values:
+        key = (key << 4) | value
+    return key << (4 * (5 - len(rank_values)))
+
+
+def unpack_key(key: int) -> Tuple[int, List[int]]:
+    """将整数键还原为 (hand_rank, rank_values)"""
+    cached = _DECODE_CACHE.get(key)
+    if cached is None:
+        hand_rank = key >> 20
+        count = VALUES_PER_RANK[hand_rank]
+        values = tuple((key >> (16 - 4 * i)) & 0xF for i in range(count))
+        cached = (hand_rank, values)
+        _DECODE_CACHE[key] = cached
+    return cached[0], list(cached[1])
+
+
+def _straight_high(mask: int) -> int:
+    """返回13位牌面值掩码中最大顺子的最大牌面值，没有顺子返回0"""
+    for high in range(12, 3, -1):  # A高 到 6高
+        run = 0b11111 << (high - 4)
+        if mask & run == run:
+            return high + 2
+    # A-2-3-4-5
+    if mask & 0b1000000001111 == 0b1000000001111:
+        return 5
+    return 0
+
+
+def _top_values(mask: int, count: int, exclude: int = 0) -> List[int]:
+    """从掩码中取出最大的若干个牌面值（从高到低）"""
+    values = []
+    for r in range(12, -1, -1):
+        if mask & (1 << r) and not exclude & (1 << r):
+            values.append(r + 2)
+            if len(values) == count:
+                break
+    return values
+
+
+def _evaluate_counts(counts: List[int]) -> int:
+    """根据牌面值计数（不考虑同花）计算最佳5张牌的打包键"""
+    mask = 0
+    quads, trips, pairs = [], [], []
+    for r in range(12, -1, -1):
+        c = counts[r]
+        if not c:
+            continue
+        mask |= 1 << r
+        if c == 4:
+            quads.append(r)
+        elif c == 3:
+            trips.append(r)
+        elif c == 2:
+            pairs.append(r)
+
+    if quads:
+        q = quads[0]
+        kicker = _top_values(mask, 1, 1 << q)
+        return pack_key(FOUR_OF_A_KIND, [q + 2] + kicker)
+
+    if trips and (len(trips) >= 2 or pairs):
+        t = trips[0]
+        p = max(trips[1:] + pairs)
+        return pack_key(FULL_HOUSE, [t + 2, p + 2])
+
+    high = _STRAIGHT_HIGH[mask]
+    if high:
+        return pack_key(STRAIGHT, [high])
+
+    if trips:
+        t = trips[0]
+        return pack_key(THREE_OF_A_KIND, [t + 2] + _top_values(mask, 2, 1 << t))
+
+    if len(pairs) >= 2:
+        p1, p2 = pairs[0], pairs[1]
+        kicker = _top_values(mask, 1, (1 << p1) | (1 << p2))
+        return pack_key(TWO_PAIR, [p1 + 2, p2 + 2] + kicker)
+
+    if pairs:
+        p = pairs[0]
+        return pack_key(ONE_PAIR, [p + 2] + _top_values(mask, 3, 1 << p))
+
+    return pack_key(HIGH_CARD, _top_values(mask, 5))
+
+
+def _flush_key(mask: int) -> int:
+    """同花色掩码（至少5张）的最佳打包键"""
+    high = _STRAIGHT_HIGH[mask]
+    if high == 14:
+        return pack_key(ROYAL_FLUSH, [14])
+    if high:
+        return pack_key(STRAIGHT_FLUSH, [high])
+    return pack_key(FLUSH, _top_values(mask, 5))
+
+
+def compute_tables() -> Tuple[Dict[int, int], List[int], List[int]]:
+    """
+    从头计算查找表
+
+    Returns:
+        (rank_table, flush_table, straight_high) 三元组
+    """
+    global _STRAIGHT_HIGH
+
+    straight_high = [_straight_high(mask) for mask in range(1 << 13)]
+    _STRAIGHT_HIGH = straight_high
+
+    flush_table = [0] * (1 << 13)
+    for mask in range(1 << 13):
+        if bin(mask).count('1') >= 5:
+            flush_table[mask] = _flush_key(mask)
+
+    rank_table = {}
+    for size in (5, 6, 7):
+        for combo in itertools.combinations_with_replacement(range(2, 15), size):
+            counts = [0] * 13
+            quinary = 0
+            for value in combo:
+                counts[value - 2] += 1
+                quinary += _POW5[value]
+            if max(counts) > 4:
+                continue
+            rank_table[quinary] = _evaluate_counts(counts)
+
+    return rank_table, flush_table, straight_high
+
+
+def install_tables(rank_table: Dict[int, int], flush_table: Sequence[int],
+                   straight_high: Sequence[int]):
+    """
+    安装查找表（可以是列表，也可以是映射到磁盘文件的只读视图）
+    """
+    global _RANK_TABLE, _FLUSH_TABLE, _STRAIGHT_HIGH
+    _STRAIGHT_HIGH = straight_high
+    _FLUSH_TABLE = flush_table
+    _RANK_TABLE = rank_table
+
+
+def build_tables(use_cache: bool = True):
+    """
+    准备查找表（首次评估时自动调用）
+
+    Args:
+        use_cache: 是否使用磁盘缓存（见 table_cache），False 时仅在内存中计算
+    """
+    if use_cache:
+        from .table_cache import load_tables
+        load_tables()
+    else:
+        install_tables(*compute_tables())
+
+
+def _key_by_combinations(cards) -> int:
+    """超过7张牌或数据异常时的后备方案：枚举所有5张组合"""
+    best = -1
+    for combo in itertools.combinations(cards, 5):
+        counts = [0] * 13
+        suits = set()
+        mask = 0
+        for card in combo:
+            counts[card.value - 2] += 1
+            mask |= _BIT[card.value]
+            suits.add(card.suit)
+        if len(suits) == 1 and max(counts) == 1:
+            key = _flush_key(mask)
+        else:
+            key = _evaluate_counts(counts)
+        if key > best:
+            best = key
+    return best
+
+
+class LookupEvaluator:
+    """查表评估器：一次遍历得到5-7张牌的最佳牌型"""
+
+    @staticmethod
+    def evaluate_key(cards) -> int:
+        """
+        评估5-7张牌，返回打包后的整数键
+
+        Args:
+            cards: Card对象列表
+
+        Returns:
+            整数键，越大牌力越强
+        """
+        if _RANK_TABLE is None:
+            build_tables()
+
+        if len(cards) > 7:
+            return _key_by_combinations(cards)
+
+        quinary = 0
+        suit_bits = 0
+        for card in cards:
+            card_id = card.id
+            quinary += _POW5_BY_ID[card_id]
+            suit_bits |= _SUIT_BIT_BY_ID[card_id]
+
+        # 7张牌以内同花与四条/葫芦不可能共存，有同花时同花表即为最佳
+        flush_table = _FLUSH_TABLE
+        flush = (flush_table[suit_bits & 0x1FFF] or flush_table[(suit_bits >> 13) & 0x1FFF] or
+                 flush_table[(suit_bits >> 26) & 0x1FFF] or flush_table[suit_bits >> 39])
+        if flush:
+            return flush
+
+        key = _RANK_TABLE.get(quinary)
+        if key is None:
+            # 重复的牌等异常输入
+            return _key_by_combinations(cards)
+        return key
+
+    @staticmethod
+    def evaluate(cards) -> Tuple[int, List[int]]:
+        """
+        评估5-7张牌
+
+        Returns:
+            (hand_rank, rank_values) 元组，与 PokerEvaluator.evaluate_hand 格式一致
+        """
+        return unpack_key(LookupEvaluator.evaluate_key(cards))
+
+
+def group_tiers(keys: Sequence[int]) -> List[List[int]]:
+    """
+    按牌力键从高到低将下标分组
+
+    Args:
+        keys: 牌力键列表
+
+    Returns:
+        下标分组列表，第一组为最强（可能多人平分）
+    """
+    tiers: Dict[int, List[int]] = {}
+    for index, key in enumerate(keys):
+        tiers.setdefault(key, []).append(index)
+    return [tiers[key] for key in sorted(tiers, reverse=True)]
+
+
+class BoardEvaluator:
+    """
+    共享公共牌的增量评估器
+
+    公共牌的五进制和与各花色掩码只计算一次，之后每位玩家只需叠加自己的底牌，
+    适用于多人摊牌和蒙特卡洛模拟中同一公共牌对多个对手的评估
+    """
+
+    __slots__ = ('board', 'quinary', 'suit_bits', 'board_flush', 'count')
+
+    def __init__(self, board):
+        """
+        Args:
+            board: 公共牌列表（0-5张）
+        """
+        if _RANK_TABLE is None:
+            build_tables()
+
+        self.board = list(board)
+        self.count = len(self.board)
+        quinary = 0
+        suit_bits = 0
+        for card in self.board:
+            quinary += _POW5_BY_ID[card.id]
+            suit_bits |= _SUIT_BIT_BY_ID[card.id]
+        self.quinary = quinary
+        self.suit_bits = suit_bits
+
+        # 公共牌自身已有同花时，与花色不同的底牌组合仍保留这个同花
+        flush_table = _FLUSH_TABLE
+        self.board_flush = (flush_table[suit_bits & 0x1FFF] or flush_table[(suit_bits >> 13) & 0x1FFF] or
+                            flush_table[(suit_bits >> 26) & 0x1FFF] or flush_table[suit_bits >> 39])
+
+    def evaluate_key(self, hole) -> int:
+        """
+        评估 底牌 + 公共牌
+
+        Args:
+            hole: 底牌列表（通常2张）
+
+        Returns:
+            与 LookupEvaluator.evaluate_key(hole + board) 相同的牌力键
+        """
+        total = self.count + len(hole)
+        if total > 7 or total < 5:
+            if total < 5:
+                raise ValueError(f"Need at least 5 cards, got {total}")
+            return _key_by_combinations(list(hole) + self.board)
+
+        flush_table = _FLUSH_TABLE
+        if len(hole) == 2:
+            a, b = hole
+            id_a, id_b = a.id, b.id
+            quinary = self.quinary + _POW5_BY_ID[id_a] + _POW5_BY_ID[id_b]
+            suit_bits = self.suit_bits | _SUIT_BIT_BY_ID[id_a] | _SUIT_BIT_BY_ID[id_b]
+            # 7张牌中最多一种花色达到5张，因此只需查底牌所在花色，再退回公共牌自身的同花
+            flush = (flush_table[(suit_bits >> _SUIT_SHIFT_BY_ID[id_a]) & 0x1FFF] or
+                     flush_table[(suit_bits >> _SUIT_SHIFT_BY_ID[id_b]) & 0x1FFF] or
+                     self.board_flush)
+        else:
+            quinary = self.quinary
+            suit_bits = self.suit_bits
+            for card in hole:
+                quinary += _POW5_BY_ID[card.id]
+                suit_bits |= _SUIT_BIT_BY_ID[card.id]
+            flush = (flush_table[suit_bits & 0x1FFF] or flush_table[(suit_bits >> 13) & 0x1FFF] or
+                     flush_table[(suit_bits >> 26) & 0x1FFF] or flush_table[suit_bits >> 39])
+
+        # 7张牌以内同花与四条/葫芦不可能共存，有同花时同花表即为最佳
+        if flush:
+            return flush
+
+        key = _RANK_TABLE.get(quinary)
+        if key is None:
+            # 重复的牌等异常输入
+            return _key_by_combinations(list(hole) + self.board)
+        return key
+
+    def rank_hands(self, holes) -> Tuple[List[int], List[List[int]]]:
+        """
+        一次评估多手底牌
+
+        Args:
+            holes: 每位玩家的底牌列表
+
+        Returns:
+            (keys, tiers)：每手牌的牌力键，以及按牌力从高到低分组的下标
+        """
+        keys = [self.evaluate_key(hole) for hole in holes]
+        return keys, group_tiers(keys)
@@ -0,0 +1,105 @@
+"""
+死牌采样器
+蒙特卡洛模拟中从剩余的牌里随机抽取少量牌（补全公共牌、生成对手底牌）
+"""
+
+import random
+from typing import List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 为可选依赖，未安装时仅矩阵采样不可用
+    np = None
+
+from .card import Card
+
+
+class DeadCardSampler:
+    """
+    从去掉死牌（已知的牌）后的剩余牌中采样
+
+    剩余牌保存在一个持久数组里，每次只对前 k 个位置做部分 Fisher-Yates 洗牌，
+    不再每次重建并完整洗乱整副牌。数组在多次采样之间保持打乱后的状态，
+    从任意排列出发做部分洗牌得到的仍是均匀随机样本
+    """
+
+    def __init__(self, dead_cards: Sequence[Card] = (), seed: Optional[int] = None, rng=None):
+        """
+        Args:
+            dead_cards: 不参与采样的牌
+            seed: 随机种子（指定后使用独立的 random.Random）
+            rng: 自定义 random.Random；都不指定时沿用全局 random 模块
+        """
+        if rng is None:
+            rng = random.Random(seed) if seed is not None else random
+        self.rng = rng
+        self.dead_mask = 0
+        self._live: List[Card] = []
+        self.set_dead(dead_cards)
+
+    def set_dead(self, dead_cards: Sequence[Card]):
+        """重新设置死牌"""
+        dead_mask = 0
+        for card in dead_cards:
+            dead_mask |= card.mask
+        self.dead_mask = dead_mask
+        self._live = [card for card in Card.all_cards() if not dead_mask & card.mask]
+
+    @property
+    def live_count(self) -> int:
+        """可采样的牌数"""
+        return len(self._live)
+
+    def sample(self, k: int) -> List[Card]:
+        """
+        随机抽取 k 张不重复的剩余牌
+
+        Args:
+            k: 抽取张数
+
+        Returns:
+            Card 列表（顺序随机）
+        """
+        live = self._live
+        n = len(live)
+        if k > n:
+            raise ValueError(f"Cannot sample {k} cards, only {n} live cards")
+
+        rand = self.rng.random
+        for i in range(k):
+            j = i + int(rand() * (n - i))
+            live[i], live[j] = live[j], live[i]
+        return live[:k]
+
+    def sample_matrix(self, iterations: int, k: int, generator=None) -> 'np.ndarray':
+        """
+        一次生成 [iterations, k] 的牌编号矩阵（需要 numpy）
+
+        每行是从剩余牌中不放回抽取的 k 张牌，行内顺序随机
+
+        Args:
+            iterations: 行数
+            k: 每行张数
+            generator: numpy.random.Generator，默认新建一个
+
+        Returns:
+            uint8 牌编号矩阵，可直接传给 batch_evaluator.evaluate_batch
+        """
+        if np is None:
+            raise RuntimeError("矩阵采样需要安装 numpy: pip install numpy")
+        n = len(self._live)
+        if k > n:
+            raise ValueError(f"Cannot sample {k} cards, only {n} live cards")
+        if generator is None:
+            generator = np.random.default_rng()
+
+        live_ids = np.array([card.id for card in self._live], dtype=np.uint8)
+        # 逐列做部分 Fisher-Yates：每列对所有行同时交换一次，只需 k 次向量运算
+        perm = np.tile(live_ids, (iterations, 1))
+        rows = np.arange(iterations)
+        for i in range(k):
+            j = i + (generator.random(iterations) * (n - i)).astype(np.intp)
+            picked = perm[rows, j]
+            perm[rows, j] = perm[:, i]
+            perm[:, i] = picked
+        return perm[:, :k]
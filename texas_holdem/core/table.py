@@ -5,6 +5,7 @@
 
 from typing import List, Dict, Tuple
 from .card import Card
+from .card_render import render_cards
 
 class Pot:
     """底池类"""
@@ -143,16 +144,46 @@ class Table:
 
         return side_pots_created
 
-    def award_pots(self, winners_by_pot):
+    def resolve_pot_winners(self, tiers):
+        """
+        根据摊牌排名确定主池和每个边池的赢家
+
+        每个底池的赢家是排名最靠前、且有资格赢得该底池的那一组玩家，
+        因此即使整体赢家没有资格参与某个边池，该边池也能正确分配
+
+        Args:
+            tiers: 按牌力从高到低分组的玩家列表（见 PokerEvaluator.rank_showdown）
+
+        Returns:
+            字典，键为底池对象，值为赢家列表
+        """
+        tier_of = {}
+        for index, tier in enumerate(tiers):
+            for player in tier:
+                tier_of[player] = index
+
+        winners_by_pot = {}
+        for pot in [self.main_pot] + self.side_pots:
+            ranked = [tier_of[p] for p in pot.eligible_players if p in tier_of]
+            if ranked:
+                best = min(ranked)
+                winners_by_pot[pot] = [p for p in tiers[best] if p in pot.eligible_players]
+        return winners_by_pot
+
+    def award_pots(self, winners_by_pot=None, tiers=None):
         """
         分配底池给赢家
 
         Args:
             winners_by_pot: 字典，键为底池对象，值为赢家列表
+            tiers: 摊牌排名分组（提供时按排名为每个底池确定赢家，忽略 winners_by_pot）
 
         Returns:
             每个玩家赢得的筹码数量字典
         """
+        if tiers is not None:
+            winners_by_pot = self.resolve_pot_winners(tiers)
+        winners_by_pot = winners_by_pot or {}
         winnings = {}
 
         # 分配主池
@@ -181,7 +212,7 @@ class Table:
         return winnings
 
     def __str__(self):
-        community_str = " ".join(str(card) for card in self.community_cards) if self.community_cards else "No community cards"
+        community_str = render_cards(self.community_cards) if self.community_cards else "No community cards"
         pots_str = f"Main pot: {self.main_pot.amount}"
 
         if self.side_pots:
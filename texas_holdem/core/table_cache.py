@@ -0,0 +1,203 @@
+"""
+评估器查找表的磁盘缓存
+首次运行时生成查找表并写入版本化的二进制文件，之后以只读 mmap 方式打开，
+多个进程映射同一文件时共享相同的物理内存页
+
+文件格式（小端）：
+    文件头 64 字节: 魔数(8) 版本(4) 非同花表条目数(4) 同花表条目数(4) 保留(12) SHA-256(32)
+    数据区: int64[非同花条目] 五进制和（升序）
+            int32[非同花条目] 对应的牌力键
+            int32[8192]       同花表
+            uint8[8192]       顺子最大牌面值表
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import time
+from typing import Any, Dict, Optional
+
+from . import lookup_evaluator
+
+TABLE_MAGIC = b'THEVALTB'
+TABLE_VERSION = 1  # 表的生成逻辑或布局改变时递增，旧文件会被自动重建
+TABLE_FILENAME = f"hand_tables_v{TABLE_VERSION}.bin"
+
+_HEADER = struct.Struct('<8sIII12s32s')
+_MASK_ENTRIES = 1 << 13
+
+# 当前映射的文件（保持引用，避免 mmap 被回收）
+_mapped: Optional[Dict[str, Any]] = None
+
+# 最近一次加载的统计信息
+LOAD_STATS: Dict[str, Any] = {'source': None, 'seconds': 0.0, 'path': None}
+
+
+def get_table_path() -> str:
+    """查找表文件路径（位于存档目录旁的缓存目录）"""
+    try:
+        from ..utils.save_manager import SaveManager
+    except ImportError:
+        # 以 core 为顶层包导入时（在 texas_holdem 目录下直接运行脚本），utils 同样是顶层包
+        from utils.save_manager import SaveManager
+    return os.path.join(SaveManager.get_cache_dir(), TABLE_FILENAME)
+
+
+def _payload_layout(rank_entries: int) -> Dict[str, int]:
+    """各数组在文件中的偏移量"""
+    offset = _HEADER.size
+    layout = {'rank_quinary': offset}
+    offset += 8 * rank_entries
+    layout['rank_keys'] = offset
+    offset += 4 * rank_entries
+    layout['flush_keys'] = offset
+    offset += 4 * _MASK_ENTRIES
+    layout['straight_high'] = offset
+    offset += _MASK_ENTRIES
+    layout['end'] = offset
+    return layout
+
+
+def _serialize(rank_table, flush_table, straight_high) -> bytes:
+    """将查找表编码为文件内容"""
+    items = sorted(rank_table.items())
+    payload = b''.join([
+        struct.pack(f'<{len(items)}q', *(q for q, _ in items)),
+        struct.pack(f'<{len(items)}i', *(k for _, k in items)),
+        struct.pack(f'<{_MASK_ENTRIES}i', *flush_table),
+        bytes(straight_high),
+    ])
+    header = _HEADER.pack(TABLE_MAGIC, TABLE_VERSION, len(items), _MASK_ENTRIES,
+                          b'\0' * 12, hashlib.sha256(payload).digest())
+    return header + payload
+
+
+def _write_table_file(path: str, data: bytes):
+    """先写临时文件再替换，避免并发进程读到写了一半的文件"""
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _map_table_file(path: str) -> Optional[Dict[str, Any]]:
+    """
+    以只读方式映射查找表文件并校验
+
+    Returns:
+        映射信息字典；文件不存在、版本不符或校验失败时返回 None
+    """
+    try:
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        if len(mm) < _HEADER.size:
+            raise ValueError("truncated header")
+        magic, version, rank_entries, mask_entries, _, digest = _HEADER.unpack_from(mm, 0)
+        layout = _payload_layout(rank_entries)
+        if (magic != TABLE_MAGIC or version != TABLE_VERSION or
+                mask_entries != _MASK_ENTRIES or len(mm) != layout['end']):
+            raise ValueError("version or size mismatch")
+        if hashlib.sha256(memoryview(mm)[_HEADER.size:]).digest() != digest:
+            raise ValueError("checksum mismatch")
+    except ValueError:
+        mm.close()
+        return None
+
+    view = memoryview(mm)
+    mapped = {
+        'mmap': mm,
+        'path': path,
+        'layout': layout,
+        'rank_entries': rank_entries,
+        'rank_quinary': view[layout['rank_quinary']:layout['rank_keys']].cast('q'),
+        'rank_keys': view[layout['rank_keys']:layout['flush_keys']].cast('i'),
+        'flush_keys': view[layout['flush_keys']:layout['straight_high']].cast('i'),
+        'straight_high': view[layout['straight_high']:layout['end']],
+    }
+    if sys.byteorder != 'little':
+        # 大端平台上原生视图字节序不符，退回到逐项解码
+        mapped['rank_quinary'] = struct.unpack_from(f'<{rank_entries}q', mm, layout['rank_quinary'])
+        mapped['rank_keys'] = struct.unpack_from(f'<{rank_entries}i', mm, layout['rank_keys'])
+        mapped['flush_keys'] = struct.unpack_from(f'<{_MASK_ENTRIES}i', mm, layout['flush_keys'])
+    return mapped
+
+
+def load_tables(path: Optional[str] = None, rebuild: bool = False) -> Dict[str, Any]:
+    """
+    加载（必要时生成）查找表并安装到查表评估器
+
+    Args:
+        path: 查找表文件路径，默认使用缓存目录
+        rebuild: 是否忽略已有文件强制重建
+
+    Returns:
+        加载统计信息 {'source': 'cache'|'built'|'memory', 'seconds': 耗时, 'path': 路径}
+    """
+    global _mapped
+
+    start = time.perf_counter()
+    path = path or get_table_path()
+
+    mapped = None if rebuild else _map_table_file(path)
+    source = 'cache'
+
+    if mapped is None:
+        rank_table, flush_table, straight_high = lookup_evaluator.compute_tables()
+        source = 'built'
+        try:
+            _write_table_file(path, _serialize(rank_table, flush_table, straight_high))
+            mapped = _map_table_file(path)
+        except OSError:
+            mapped = None
+        if mapped is None:
+            # 无法写入缓存目录（例如只读目录），直接使用内存中的表
+            lookup_evaluator.install_tables(rank_table, flush_table, straight_high)
+            source = 'memory'
+
+    if mapped is not None:
+        rank_table = dict(zip(mapped['rank_quinary'], mapped['rank_keys']))
+        lookup_evaluator.install_tables(rank_table, mapped['flush_keys'], mapped['straight_high'])
+    # 旧映射可能仍被批量评估器的数组引用，不主动关闭，交由垃圾回收释放
+    _mapped = mapped
+
+    LOAD_STATS.update({'source': source, 'seconds': time.perf_counter() - start, 'path': path})
+    return dict(LOAD_STATS)
+
+
+def get_mapped_tables() -> Optional[Dict[str, Any]]:
+    """当前映射的查找表文件信息（未使用磁盘缓存时为 None）"""
+    return _mapped
+
+
+def timing_report(path: Optional[str] = None) -> Dict[str, float]:
+    """
+    测量冷启动（重建并写入文件）与热启动（映射已有文件）的加载耗时
+
+    Returns:
+        {'cold': 秒, 'warm': 秒}
+    """
+    cold = load_tables(path, rebuild=True)
+    warm = load_tables(path)
+    return {'cold': cold['seconds'], 'warm': warm['seconds'],
+            'cold_source': cold['source'], 'warm_source': warm['source']}
+
+
+if __name__ == '__main__':
+    report = timing_report()
+    print(f"查找表文件: {LOAD_STATS['path']}")
+    print(f"冷启动（生成并写入）: {report['cold'] * 1000:.1f} ms [{report['cold_source']}]")
+    print(f"热启动（mmap 映射）: {report['warm'] * 1000:.1f} ms [{report['warm_source']}]")
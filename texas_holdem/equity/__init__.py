@@ -0,0 +1,26 @@
+"""
+胜率（equity）计算模块
+提供统一的 equity() 接口，支持精确枚举、蒙特卡洛和 NumPy 向量化三种后端，
+花色同构的局面共用 LRU 结果缓存，翻牌前直接查预先计算的胜率表；
+对手底牌可以按加权范围（HandRange）抽取；翻牌面结构查预计算的 1,755 类翻牌索引，
+翻牌后的手牌强度（HS/EHS²）翻牌圈查表、转牌和河牌精确枚举；
+短筹码翻牌前查全押或弃牌均衡图表
+"""
+
+from .engine import (equity, calculate, cache_info, clear_cache,
+                     EquityResult, METHODS, EXACT_THRESHOLD, EQUITY_CACHE)
+from .cache import EquityCache
+from .canonical import canonical_key, canonicalize
+from .preflop_table import hand_class, class_label, preflop_equity, matchup_equity
+from .parallel import start_pool, shutdown_pool
+from .ranges import HandRange
+from .flop_texture import FlopTexture, board_texture
+from .hand_strength import HandStrength, postflop_strength
+from .push_fold import push_fold_frequency
+
+__all__ = ['equity', 'calculate', 'cache_info', 'clear_cache', 'EquityResult',
+           'METHODS', 'EXACT_THRESHOLD', 'EQUITY_CACHE', 'EquityCache',
+           'canonical_key', 'canonicalize', 'hand_class', 'class_label',
+           'preflop_equity', 'matchup_equity', 'start_pool', 'shutdown_pool',
+           'HandRange', 'FlopTexture', 'board_texture', 'HandStrength', 'postflop_strength',
+           'push_fold_frequency']
@@ -0,0 +1,468 @@
+"""
+胜率计算后端
+
+每个后端返回 (share_sum, share_sq_sum, trials)：
+    share 为每次模拟/枚举中己方分得底池的比例（独赢为1，与 m 人平分为 1/(m+1)，输掉为0），
+    同时累计平方和，便于计算置信区间
+"""
+
+import itertools
+import random
+from typing import List, Sequence, Tuple
+
+from ..core.card import Card
+from ..core.lookup_evaluator import BoardEvaluator
+from ..core.sampler import DeadCardSampler
+from .ranges import COMBO_MASKS, COMBOS, HandRange
+
+# 向量化后端每批处理的模拟次数，限制中间数组的内存占用
+VECTOR_CHUNK = 1 << 16
+
+# 按范围抽取对手底牌时，连续冲突（对手之间抽到同一张牌）的最大重抽次数
+MAX_REJECTIONS = 1000
+
+# 向量化后端使用的组合牌编号矩阵 [1326, 2] 和掩码数组（首次使用时生成）
+_combo_arrays = None
+
+
+def _share(hero_key: int, opponent_keys: Sequence[int]) -> float:
+    """己方分得底池的比例"""
+    best = max(opponent_keys)
+    if hero_key > best:
+        return 1.0
+    if hero_key < best:
+        return 0.0
+    return 1.0 / (1 + sum(1 for key in opponent_keys if key == hero_key))
+
+
+def live_cards(dead_cards: Sequence[Card]) -> List[Card]:
+    """去掉死牌后剩余的牌（按牌编号顺序）"""
+    dead_mask = 0
+    for card in dead_cards:
+        dead_mask |= card.mask
+    return [card for card in Card.all_cards() if not dead_mask & card.mask]
+
+
+def _comb(n: int, k: int) -> int:
+    if k < 0 or k > n:
+        return 0
+    result = 1
+    for i in range(k):
+        result = result * (n - i) // (i + 1)
+    return result
+
+
+def exact_trials(live_count: int, missing: int, opponents: int) -> int:
+    """
+    精确枚举需要评估的情形数
+
+    Args:
+        live_count: 剩余牌数
+        missing: 待发的公共牌数
+        opponents: 对手数量
+
+    Returns:
+        公共牌补全方式数 × 对手底牌（无序、互不重叠）组合数
+    """
+    count = _comb(live_count, missing)
+    rest = live_count - missing
+    pairs = 1
+    for i in range(opponents):
+        pairs *= _comb(rest - 2 * i, 2)
+    for i in range(2, opponents + 1):
+        pairs //= i
+    return count * pairs
+
+
+def _disjoint_pair_sets(pair_masks: List[int], count: int, start: int = 0, used: int = 0):
+    """枚举 count 个互不重叠的两张牌组合（无序），产出组合下标元组"""
+    if count == 0:
+        yield ()
+        return
+    for index in range(start, len(pair_masks)):
+        mask = pair_masks[index]
+        if used & mask:
+            continue
+        for rest in _disjoint_pair_sets(pair_masks, count - 1, index + 1, used | mask):
+            yield (index,) + rest
+
+
+def _flush_suit(cards: Sequence[Card]) -> int:
+    """完整公共牌中能组成同花的花色（至少3张），没有时返回 -1"""
+    counts = [0, 0, 0, 0]
+    for card in cards:
+        counts[card.suit_index] += 1
+    for suit_index, count in enumerate(counts):
+        if count >= 3:
+            return suit_index
+    return -1
+
+
+def _card_class(card: Card, flush_suit: int) -> int:
+    """
+    牌在给定公共牌下的等价类
+
+    公共牌确定后，牌力只取决于点数以及是否属于可成同花的花色，
+    因此同点数的非同花花色牌可以互换
+    """
+    return card.value + 16 if card.suit_index == flush_suit else card.value
+
+
+def _runout_groups(board: List[Card], live: List[Card], missing: int):
+    """
+    按等价类合并公共牌补全方式
+
+    两种补全的同花花色相同、补出的牌等价类也相同时，
+    己方和对手的牌力分布完全一样，只需计算一次
+
+    Returns:
+        [(代表性补全, 该类补全的数量), ...]
+    """
+    groups = {}
+    for runout in itertools.combinations(live, missing):
+        flush_suit = _flush_suit(board + list(runout))
+        signature = (flush_suit, tuple(sorted(_card_class(card, flush_suit) for card in runout)))
+        group = groups.get(signature)
+        if group is None:
+            groups[signature] = [runout, 1]
+        else:
+            group[1] += 1
+    return groups.values()
+
+
+def exact_equity(hole: Sequence[Card], board: Sequence[Card], opponents: int) -> Tuple[float, float, int]:
+    """
+    精确枚举所有公共牌补全方式和对手底牌组合
+
+    等价的补全方式只计算一次；单挑时对手底牌也按等价类合并，
+    只评估每类的一个代表组合并乘以组合数
+
+    Returns:
+        (share_sum, share_sq_sum, trials)
+    """
+    board = list(board)
+    hole = list(hole)
+    live = live_cards(hole + board)
+    missing = 5 - len(board)
+
+    share_sum = share_sq_sum = 0.0
+    trials = 0
+    for runout, weight in _runout_groups(board, live, missing):
+        full_board = board + list(runout)
+        board_evaluator = BoardEvaluator(full_board)
+        hero_key = board_evaluator.evaluate_key(hole)
+
+        runout_mask = 0
+        for card in runout:
+            runout_mask |= card.mask
+        rest = [card for card in live if not runout_mask & card.mask]
+
+        if opponents == 1:
+            flush_suit = _flush_suit(full_board)
+            by_class = {}
+            for card in rest:
+                by_class.setdefault(_card_class(card, flush_suit), []).append(card)
+            classes = list(by_class.values())
+
+            for i, cards_a in enumerate(classes):
+                count_a = len(cards_a)
+                combos = [(cards_a[:2], count_a * (count_a - 1) // 2)] if count_a >= 2 else []
+                combos.extend(((cards_a[0], cards_b[0]), count_a * len(cards_b)) for cards_b in classes[i + 1:])
+                for pair, count in combos:
+                    key = board_evaluator.evaluate_key(pair)
+                    if hero_key > key:
+                        share_sum += weight * count
+                        share_sq_sum += weight * count
+                    elif hero_key == key:
+                        share_sum += weight * count * 0.5
+                        share_sq_sum += weight * count * 0.25
+                    trials += weight * count
+            continue
+
+        pairs = list(itertools.combinations(rest, 2))
+        pair_keys = [board_evaluator.evaluate_key(pair) for pair in pairs]
+        pair_masks = [a.mask | b.mask for a, b in pairs]
+        for indices in _disjoint_pair_sets(pair_masks, opponents):
+            share = _share(hero_key, [pair_keys[i] for i in indices])
+            share_sum += weight * share
+            share_sq_sum += weight * share * share
+            trials += weight
+
+    return share_sum, share_sq_sum, trials
+
+
+def monte_carlo_equity(hole: Sequence[Card], board: Sequence[Card], opponents: int,
+                       iterations: int, rng=None) -> Tuple[float, float, int]:
+    """
+    蒙特卡洛模拟（纯 Python）
+
+    Args:
+        rng: random.Random，默认使用全局 random 模块
+
+    Returns:
+        (share_sum, share_sq_sum, trials)
+    """
+    board = list(board)
+    hole = list(hole)
+    sampler = DeadCardSampler(hole + board, rng=rng)
+    missing = 5 - len(board)
+    needed = missing + 2 * opponents
+
+    share_sum = share_sq_sum = 0.0
+    for _ in range(iterations):
+        drawn = sampler.sample(needed)
+        board_evaluator = BoardEvaluator(board + drawn[:missing])
+        hero_key = board_evaluator.evaluate_key(hole)
+
+        tied = 0
+        for i in range(missing, needed, 2):
+            key = board_evaluator.evaluate_key(drawn[i:i + 2])
+            if key > hero_key:
+                break
+            if key == hero_key:
+                tied += 1
+        else:
+            # 没有对手比己方大：独赢或与 tied 个对手平分
+            share = 1.0 / (1 + tied)
+            share_sum += share
+            share_sq_sum += share * share
+
+    return share_sum, share_sq_sum, iterations
+
+
+def vectorized_equity(hole: Sequence[Card], board: Sequence[Card], opponents: int,
+                      iterations: int, generator=None) -> Tuple[float, float, int]:
+    """
+    NumPy 向量化模拟：一次采样 [iterations, k] 的牌编号矩阵并批量评估
+
+    Args:
+        generator: numpy.random.Generator，默认新建一个
+
+    Returns:
+        (share_sum, share_sq_sum, trials)
+    """
+    from ..core import batch_evaluator
+    np = batch_evaluator.np
+    if np is None:
+        raise RuntimeError("向量化胜率计算需要安装 numpy: pip install numpy")
+    if generator is None:
+        generator = np.random.default_rng()
+
+    board = list(board)
+    hole = list(hole)
+    sampler = DeadCardSampler(hole + board)
+    missing = 5 - len(board)
+    needed = missing + 2 * opponents
+    board_ids = np.array([card.id for card in board], dtype=np.uint8)
+    hole_ids = np.array([card.id for card in hole], dtype=np.uint8)
+
+    share_sum = share_sq_sum = 0.0
+    for start in range(0, iterations, VECTOR_CHUNK):
+        rows = min(VECTOR_CHUNK, iterations - start)
+        drawn = sampler.sample_matrix(rows, needed, generator)
+        full_board = np.hstack([np.broadcast_to(board_ids, (rows, len(board_ids))), drawn[:, :missing]])
+
+        hero = batch_evaluator.evaluate_batch(
+            np.hstack([full_board, np.broadcast_to(hole_ids, (rows, 2))]))
+        opponent_keys = np.stack([
+            batch_evaluator.evaluate_batch(np.hstack([full_board, drawn[:, missing + 2 * i:missing + 2 * i + 2]]))
+            for i in range(opponents)
+        ])
+
+        best = opponent_keys.max(axis=0)
+        tied = (opponent_keys == hero).sum(axis=0)
+        share = np.where(hero > best, 1.0, np.where(hero == best, 1.0 / (1 + tied), 0.0))
+        share_sum += float(share.sum())
+        share_sq_sum += float((share * share).sum())
+
+    return share_sum, share_sq_sum, iterations
+
+
+def _range_pools(hole: List[Card], board: List[Card], ranges: Sequence[HandRange]):
+    """每个对手范围中与死牌不冲突的 (组合下标列表, 权重列表)"""
+    pools = []
+    for hand_range in ranges:
+        live = hand_range.live(hole + board)
+        if not live:
+            raise ValueError(f"{hand_range!r} has no combos left after removing dead cards")
+        pools.append(([index for index, _ in live], [weight for _, weight in live]))
+    return pools
+
+
+def range_exact_trials(hole: Sequence[Card], board: Sequence[Card], hand_range: HandRange) -> int:
+    """单挑范围精确枚举需要评估的情形数（公共牌补全方式数 × 范围内剩余组合数）"""
+    dead = list(hole) + list(board)
+    return _comb(52 - len(dead), 5 - len(board)) * len(hand_range.live(dead))
+
+
+def range_exact_equity(hole: Sequence[Card], board: Sequence[Card],
+                       hand_range: HandRange) -> Tuple[float, float, int]:
+    """
+    单挑时对一个加权范围精确枚举
+
+    Returns:
+        (share_sum, share_sq_sum, trials)，trials 为枚举的情形数，
+        两个累计值已按权重折算，share_sum / trials 即加权胜率
+    """
+    board = list(board)
+    hole = list(hole)
+    live = live_cards(hole + board)
+    combos = hand_range.live(hole + board)
+    missing = 5 - len(board)
+
+    share_sum = share_sq_sum = total_weight = 0.0
+    trials = 0
+    for runout in itertools.combinations(live, missing):
+        board_evaluator = BoardEvaluator(board + list(runout))
+        hero_key = board_evaluator.evaluate_key(hole)
+        runout_mask = 0
+        for card in runout:
+            runout_mask |= card.mask
+
+        for index, weight in combos:
+            if COMBO_MASKS[index] & runout_mask:
+                continue
+            key = board_evaluator.evaluate_key(COMBOS[index])
+            if hero_key > key:
+                share_sum += weight
+                share_sq_sum += weight
+            elif hero_key == key:
+                share_sum += weight * 0.5
+                share_sq_sum += weight * 0.25
+            total_weight += weight
+            trials += 1
+
+    if not total_weight:
+        return 0.0, 0.0, 0
+    scale = trials / total_weight
+    return share_sum * scale, share_sq_sum * scale, trials
+
+
+def range_monte_carlo_equity(hole: Sequence[Card], board: Sequence[Card], ranges: Sequence[HandRange],
+                             iterations: int, rng=None) -> Tuple[float, float, int]:
+    """
+    对手底牌按范围加权抽取的蒙特卡洛模拟（纯 Python）
+
+    对手之间抽到同一张牌时整组重抽；公共牌从剩余的牌中补全
+
+    Args:
+        ranges: 每个对手一个 HandRange
+        rng: random.Random，默认使用全局 random 模块
+
+    Returns:
+        (share_sum, share_sq_sum, trials)
+    """
+    board = list(board)
+    hole = list(hole)
+    rng = rng or random
+    pools = _range_pools(hole, board, ranges)
+    cumulative = [(indices, list(itertools.accumulate(weights))) for indices, weights in pools]
+    sampler = DeadCardSampler(hole + board, rng=rng)
+    missing = 5 - len(board)
+    needed = missing + 2 * len(pools)
+
+    share_sum = share_sq_sum = 0.0
+    for _ in range(iterations):
+        for _attempt in range(MAX_REJECTIONS):
+            used = 0
+            picks = []
+            for indices, cum_weights in cumulative:
+                index = rng.choices(indices, cum_weights=cum_weights)[0]
+                if COMBO_MASKS[index] & used:
+                    break
+                used |= COMBO_MASKS[index]
+                picks.append(index)
+            else:
+                break
+        else:
+            raise ValueError("Opponent ranges cannot be dealt without overlapping cards")
+
+        runout = [card for card in sampler.sample(needed) if not used & card.mask][:missing]
+        board_evaluator = BoardEvaluator(board + runout)
+        share = _share(board_evaluator.evaluate_key(hole),
+                       [board_evaluator.evaluate_key(COMBOS[index]) for index in picks])
+        share_sum += share
+        share_sq_sum += share * share
+
+    return share_sum, share_sq_sum, iterations
+
+
+def range_vectorized_equity(hole: Sequence[Card], board: Sequence[Card], ranges: Sequence[HandRange],
+                            iterations: int, generator=None) -> Tuple[float, float, int]:
+    """
+    对手底牌按范围加权抽取的 NumPy 向量化模拟
+
+    每批按权重抽取各对手的组合下标，丢弃对手之间有重叠的行后批量评估；
+    公共牌从多抽的牌中去掉对手已用的牌后取前几张
+
+    Args:
+        ranges: 每个对手一个 HandRange
+        generator: numpy.random.Generator，默认新建一个
+
+    Returns:
+        (share_sum, share_sq_sum, trials)
+    """
+    global _combo_arrays
+    from ..core import batch_evaluator
+    np = batch_evaluator.np
+    if np is None:
+        raise RuntimeError("向量化胜率计算需要安装 numpy: pip install numpy")
+    if generator is None:
+        generator = np.random.default_rng()
+    if _combo_arrays is None:
+        _combo_arrays = (np.array([[a.id, b.id] for a, b in COMBOS], dtype=np.uint8),
+                         np.array(COMBO_MASKS, dtype=np.uint64))
+    combo_ids, combo_masks = _combo_arrays
+
+    board = list(board)
+    hole = list(hole)
+    pools = []
+    for indices, weights in _range_pools(hole, board, ranges):
+        probabilities = np.array(weights, dtype=np.float64)
+        pools.append((np.array(indices), probabilities / probabilities.sum()))
+    opponents = len(pools)
+    sampler = DeadCardSampler(hole + board)
+    missing = 5 - len(board)
+    board_ids = np.array([card.id for card in board], dtype=np.uint8)
+    hole_ids = np.array([card.id for card in hole], dtype=np.uint8)
+
+    share_sum = share_sq_sum = 0.0
+    trials = empty_batches = 0
+    while trials < iterations:
+        rows = min(VECTOR_CHUNK, iterations - trials)
+        picks = np.stack([generator.choice(indices, size=rows, p=p) for indices, p in pools], axis=1)
+        masks = combo_masks[picks]
+        valid = np.ones(rows, dtype=bool)
+        for i, j in itertools.combinations(range(opponents), 2):
+            valid &= (masks[:, i] & masks[:, j]) == 0
+        if not valid.any():
+            empty_batches += 1
+            if empty_batches >= 10:
+                raise ValueError("Opponent ranges cannot be dealt without overlapping cards")
+            continue
+        picks, masks = picks[valid], masks[valid]
+        rows = len(picks)
+        used = np.bitwise_or.reduce(masks, axis=1)
+
+        # 与对手底牌冲突的牌排到后面，前 missing 张即为补全的公共牌
+        drawn = sampler.sample_matrix(rows, missing + 2 * opponents, generator)
+        conflict = ((used[:, None] >> drawn.astype(np.uint64)) & np.uint64(1)).astype(bool)
+        order = np.argsort(conflict, axis=1, kind='stable')[:, :missing]
+        full_board = np.hstack([np.broadcast_to(board_ids, (rows, len(board_ids))),
+                                np.take_along_axis(drawn, order, axis=1)])
+
+        hero = batch_evaluator.evaluate_batch(
+            np.hstack([full_board, np.broadcast_to(hole_ids, (rows, 2))]))
+        opponent_keys = np.stack([
+            batch_evaluator.evaluate_batch(np.hstack([full_board, combo_ids[picks[:, i]]]))
+            for i in range(opponents)
+        ])
+
+        best = opponent_keys.max(axis=0)
+        tied = (opponent_keys == hero).sum(axis=0)
+        share = np.where(hero > best, 1.0, np.where(hero == best, 1.0 / (1 + tied), 0.0))
+        share_sum += float(share.sum())
+        share_sq_sum += float((share * share).sum())
+        trials += rows
+
+    return share_sum, share_sq_sum, trials
@@ -0,0 +1,63 @@
+"""
+胜率结果缓存
+按花色同构后的规范键保存计算结果，容量有限，按最近最少使用淘汰
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+
+class EquityCache:
+    """有容量上限的 LRU 缓存，记录命中和未命中次数"""
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Args:
+            maxsize: 最多保存的条目数
+        """
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Hashable, object]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[object]:
+        """查找结果，命中时移到最近使用的位置；未命中返回 None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: Hashable, value: object):
+        """保存结果，超出容量时淘汰最久未使用的条目"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """清空缓存和计数"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> Dict[str, float]:
+        """
+        缓存统计
+
+        Returns:
+            {'hits', 'misses', 'size', 'maxsize', 'hit_rate'}
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,75 @@
+"""
+花色同构规范化
+胜率只与各花色中有哪些点数有关，与花色的名字无关：
+As Ks / Qh Jh 2c 和 Ad Kd / Qs Js 2h 是同一个问题
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+from ..core.card import Card
+
+# 规范化后的花色顺序（第一个花色对应签名最大的原花色）
+_CANONICAL_SUITS = Card.SUIT_ORDER
+
+
+def _suit_signatures(hole: Sequence[Card], board: Sequence[Card]) -> List[Tuple[int, int]]:
+    """每个花色的 (底牌点数位图, 公共牌点数位图)，按花色编号排列"""
+    signatures = [[0, 0], [0, 0], [0, 0], [0, 0]]
+    for card in hole:
+        signatures[card.suit_index][0] |= 1 << card.value
+    for card in board:
+        signatures[card.suit_index][1] |= 1 << card.value
+    return [tuple(signature) for signature in signatures]
+
+
+def canonical_key(hole: Sequence[Card], board: Sequence[Card], opponents: int = 1) -> Tuple:
+    """
+    计算规范键
+
+    底牌、公共牌都视为无序集合；两个局面的规范键相同，
+    当且仅当存在一个花色置换把其中一个变成另一个
+
+    Args:
+        hole: 己方底牌
+        board: 公共牌
+        opponents: 对手数量
+
+    Returns:
+        可哈希的规范键
+    """
+    return (tuple(sorted(_suit_signatures(hole, board), reverse=True)), opponents)
+
+
+def suit_mapping(hole: Sequence[Card], board: Sequence[Card]) -> Dict[str, str]:
+    """
+    canonicalize 使用的花色置换
+
+    Returns:
+        {原花色: 规范花色}，四种花色都有对应
+    """
+    signatures = _suit_signatures(hole, board)
+    order = sorted(range(4), key=lambda suit_index: signatures[suit_index], reverse=True)
+    return {Card.SUIT_ORDER[suit_index]: _CANONICAL_SUITS[position]
+            for position, suit_index in enumerate(order)}
+
+
+def canonicalize(hole: Sequence[Card], board: Sequence[Card]) -> Tuple[List[Card], List[Card]]:
+    """
+    把局面换成规范花色下的代表局面
+
+    签名最大的花色换成红桃，其次方块、梅花、黑桃；
+    签名相同的花色可以互换，结果不受影响
+
+    Args:
+        hole: 己方底牌
+        board: 公共牌
+
+    Returns:
+        (规范底牌, 规范公共牌)，各自按牌编号排序
+    """
+    suit_map = suit_mapping(hole, board)
+
+    def convert(cards):
+        return sorted((Card(suit_map[card.suit], card.rank) for card in cards), key=lambda card: card.id)
+
+    return convert(hole), convert(board)
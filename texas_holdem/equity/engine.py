@@ -0,0 +1,297 @@
+"""
+胜率计算入口
+根据 method 选择后端，返回己方在摊牌中分得底池的期望比例
+"""
+
+import math
+import random
+import time
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Optional, Sequence
+
+from ..core.card import Card
+from . import backends, preflop_table
+from .cache import EquityCache
+from .canonical import canonical_key
+from .ranges import HandRange
+
+# 可选的计算方法
+METHODS = ('auto', 'exact', 'montecarlo', 'vectorized', 'table')
+
+# 未指定 budget 时的模拟次数
+DEFAULT_BUDGET = 1000
+
+# 'auto' 模式下精确枚举的情形数上限（单挑转牌圈为 46×C(45,2)=45,540）
+EXACT_THRESHOLD = 100000
+
+# 对手范围单挑时 'auto' 模式下精确枚举的情形数上限（范围内每个组合都要单独评估，不能按花色合并）
+RANGE_EXACT_THRESHOLD = 10000
+
+# 自适应模拟：每批次的模拟次数、判断停止前至少的模拟次数、未指定 budget 时的上限
+ADAPTIVE_BATCH = {'montecarlo': 100, 'vectorized': 500}
+ADAPTIVE_MIN_TRIALS = 200
+ADAPTIVE_MAX_BUDGET = 20000
+
+# 所有未指定种子的计算共用的结果缓存（按花色同构后的局面）
+EQUITY_CACHE = EquityCache(maxsize=4096)
+
+
+@dataclass(frozen=True)
+class EquityResult:
+    """胜率计算结果"""
+    equity: float      # 己方分得底池的期望比例（0.0-1.0，平局按人数平分）
+    trials: int        # 模拟或枚举的情形数
+    method: str        # 实际使用的后端
+    exact: bool        # 是否为精确枚举结果
+    stderr: float      # 标准误差（精确结果为0）
+
+
+def _numpy_available() -> bool:
+    from ..core import batch_evaluator
+    return batch_evaluator.np is not None
+
+
+def _check_inputs(hole: Sequence[Card], board: Sequence[Card], opponents: int):
+    if len(hole) != 2:
+        raise ValueError(f"Expected 2 hole cards, got {len(hole)}")
+    if len(board) > 5:
+        raise ValueError(f"Board has at most 5 cards, got {len(board)}")
+    if opponents < 1:
+        raise ValueError(f"Need at least 1 opponent, got {opponents}")
+    live = 52 - len(hole) - len(board)
+    if 5 - len(board) + 2 * opponents > live:
+        raise ValueError(f"Not enough cards for {opponents} opponents")
+
+
+def _table_result(hole: Sequence[Card], board: Sequence[Card], opponents: int) -> EquityResult:
+    """查翻牌前胜率表"""
+    if board:
+        raise ValueError("Preflop table only applies before the flop")
+    table = preflop_table.get_table()
+    if table is None:
+        raise FileNotFoundError(f"Preflop table {preflop_table.TABLE_PATH} is missing")
+    return EquityResult(equity=table.vs_random(preflop_table.hand_class(hole), opponents),
+                        trials=table.samples, method='table', exact=False, stderr=table.stderr)
+
+
+def _sample_adaptively(run_batch, batch_size: int, max_trials: int, precision: Optional[float],
+                       time_limit: Optional[float], threshold: Optional[float], z: float):
+    """
+    分批模拟，满足任一条件即停止：
+    置信区间半宽不超过 precision、置信区间不再包含 threshold、用时达到 time_limit、达到 max_trials
+
+    Returns:
+        (share_sum, share_sq_sum, trials, complete)；complete 表示达到了精度或模拟次数上限，
+        而不是因阈值或时间提前停止
+    """
+    start_time = time.perf_counter()
+    share_sum = share_sq_sum = 0.0
+    trials = 0
+    while trials < max_trials:
+        batch_sum, batch_sq_sum, batch_trials = run_batch(min(batch_size, max_trials - trials))
+        share_sum += batch_sum
+        share_sq_sum += batch_sq_sum
+        trials += batch_trials
+        if trials < ADAPTIVE_MIN_TRIALS:
+            continue
+
+        mean = share_sum / trials
+        half_width = z * math.sqrt(max(0.0, share_sq_sum / trials - mean * mean) / (trials - 1))
+        if precision is not None and half_width <= precision:
+            return share_sum, share_sq_sum, trials, True
+        if threshold is not None and abs(mean - threshold) > half_width:
+            break
+        if time_limit is not None and time.perf_counter() - start_time >= time_limit:
+            break
+    return share_sum, share_sq_sum, trials, trials >= max_trials
+
+
+def calculate(hole: Sequence[Card], board: Sequence[Card] = (), opponents: int = 1, *,
+              method: str = 'auto', budget: Optional[int] = None,
+              seed: Optional[int] = None,
+              exact_threshold: Optional[int] = None,
+              cache: bool = True,
+              parallel: bool = False,
+              workers: Optional[int] = None,
+              precision: Optional[float] = None,
+              time_limit: Optional[float] = None,
+              threshold: Optional[float] = None,
+              confidence: float = 0.95,
+              ranges: Optional[Sequence[HandRange]] = None) -> EquityResult:
+    """
+    计算胜率并返回详细结果
+
+    Args:
+        hole: 己方底牌（2张）
+        board: 公共牌（0-5张）
+        opponents: 对手数量（对手底牌视为随机）
+        method: 'auto' | 'exact' | 'montecarlo' | 'vectorized' | 'table'
+                （'table' 查翻牌前胜率表，只适用于没有公共牌、1-7个对手）
+        budget: 模拟次数上限（精确枚举时忽略）
+        seed: 随机种子（指定后结果可复现）
+        exact_threshold: 'auto' 模式下枚举情形数不超过该值时使用精确枚举，
+                         默认 EXACT_THRESHOLD
+        cache: 是否使用结果缓存（指定 seed 时总是重新计算）
+        parallel: 模拟后端是否拆分到进程池并行执行；调用方应事先调用 parallel.start_pool()，
+                  否则第一次请求要承担进程创建和预热的开销
+        workers: 并行进程数，默认沿用已启动的进程池或 CPU 核数
+        precision: 自适应模拟的目标精度（置信区间半宽，如 0.01 表示 ±1%）
+        time_limit: 自适应模拟的时间上限（秒）
+        threshold: 决策阈值（如底池赔率要求的胜率），置信区间不再包含它时提前停止
+        confidence: 置信水平（默认 95%）
+        ranges: 每个对手的手牌范围（HandRange）；指定时对手数量取其长度，
+                对手底牌按范围权重抽取，不查翻牌前胜率表、不使用缓存和并行
+
+    precision、time_limit、threshold 任一指定时模拟后端分批进行，
+    budget 为模拟次数上限（默认 ADAPTIVE_MAX_BUDGET）；并行模式不做自适应
+
+    Returns:
+        EquityResult
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown equity method: {method}. Must be one of {list(METHODS)}")
+    hole, board = list(hole), list(board)
+    if ranges is not None:
+        ranges = list(ranges)
+        opponents = len(ranges)
+        cache = parallel = False
+    _check_inputs(hole, board, opponents)
+    adaptive = not parallel and (precision is not None or time_limit is not None or threshold is not None)
+    budget = budget or (ADAPTIVE_MAX_BUDGET if adaptive else DEFAULT_BUDGET)
+
+    if method == 'auto' and ranges is None and not board and opponents <= preflop_table.MAX_OPPONENTS \
+            and preflop_table.get_table() is not None:
+        method = 'table'
+    if method == 'table':
+        if ranges is not None:
+            raise ValueError("Preflop table assumes random opponent hands, cannot use ranges")
+        return _table_result(hole, board, opponents)
+
+    if method == 'auto':
+        if ranges is not None:
+            if exact_threshold is None:
+                exact_threshold = RANGE_EXACT_THRESHOLD
+            exact = opponents == 1 and backends.range_exact_trials(hole, board, ranges[0]) <= exact_threshold
+        else:
+            if exact_threshold is None:
+                exact_threshold = EXACT_THRESHOLD
+            live_count = 52 - len(hole) - len(board)
+            exact = backends.exact_trials(live_count, 5 - len(board), opponents) <= exact_threshold
+        if exact:
+            method = 'exact'
+        else:
+            method = 'vectorized' if _numpy_available() else 'montecarlo'
+    if method == 'exact' and ranges is not None and opponents > 1:
+        raise ValueError("Exact range equity only supports a single opponent")
+
+    # 花色同构的局面共用一个缓存条目；精确结果与模拟次数无关。
+    # 自适应结果只按精度目标区分：达到精度（或用满模拟次数）的结果对任何阈值、时间上限都可复用，
+    # 因阈值或时间提前停止的结果不写入缓存
+    cache_key = None
+    if cache and seed is None:
+        if method == 'exact':
+            cache_key = (canonical_key(hole, board, opponents), method)
+        else:
+            cache_key = (canonical_key(hole, board, opponents), method, budget,
+                         (precision, confidence) if adaptive else None)
+        cached = EQUITY_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+    if method == 'exact':
+        if ranges is not None:
+            share_sum, share_sq_sum, trials = backends.range_exact_equity(hole, board, ranges[0])
+        else:
+            share_sum, share_sq_sum, trials = backends.exact_equity(hole, board, opponents)
+    elif parallel:
+        from .parallel import parallel_equity
+        share_sum, share_sq_sum, trials = parallel_equity(hole, board, opponents, budget, method, seed, workers)
+    else:
+        if method == 'vectorized':
+            from ..core import batch_evaluator
+            generator = batch_evaluator.np.random.default_rng(seed) if _numpy_available() else None
+
+            def run_batch(iterations):
+                if ranges is not None:
+                    return backends.range_vectorized_equity(hole, board, ranges, iterations, generator)
+                return backends.vectorized_equity(hole, board, opponents, iterations, generator)
+        else:
+            rng = random.Random(seed) if seed is not None else None
+
+            def run_batch(iterations):
+                if ranges is not None:
+                    return backends.range_monte_carlo_equity(hole, board, ranges, iterations, rng)
+                return backends.monte_carlo_equity(hole, board, opponents, iterations, rng)
+
+        if adaptive:
+            z = NormalDist().inv_cdf((1 + confidence) / 2)
+            share_sum, share_sq_sum, trials, complete = _sample_adaptively(
+                run_batch, ADAPTIVE_BATCH[method], budget, precision, time_limit, threshold, z)
+            if not complete:
+                cache_key = None
+        else:
+            share_sum, share_sq_sum, trials = run_batch(budget)
+
+    mean = share_sum / trials if trials else 0.0
+    exact = method == 'exact'
+    stderr = 0.0
+    if not exact and trials > 1:
+        variance = max(0.0, share_sq_sum / trials - mean * mean)
+        stderr = math.sqrt(variance / (trials - 1))
+    result = EquityResult(equity=mean, trials=trials, method=method, exact=exact, stderr=stderr)
+    if cache_key is not None:
+        EQUITY_CACHE.put(cache_key, result)
+    return result
+
+
+def equity(hole: Sequence[Card], board: Sequence[Card] = (), opponents: int = 1, *,
+           method: str = 'auto', budget: Optional[int] = None,
+           seed: Optional[int] = None,
+           exact_threshold: Optional[int] = None,
+           cache: bool = True,
+           parallel: bool = False,
+           workers: Optional[int] = None,
+           precision: Optional[float] = None,
+           time_limit: Optional[float] = None,
+           threshold: Optional[float] = None,
+           confidence: float = 0.95,
+           ranges: Optional[Sequence[HandRange]] = None) -> float:
+    """
+    计算胜率（己方在摊牌中分得底池的期望比例，平局按人数平分）
+
+    Args:
+        hole: 己方底牌（2张）
+        board: 公共牌（0-5张）
+        opponents: 对手数量（对手底牌视为随机）
+        method: 'auto' | 'exact' | 'montecarlo' | 'vectorized' | 'table'
+        budget: 模拟次数上限（精确枚举时忽略）
+        seed: 随机种子（指定后结果可复现）
+        exact_threshold: 'auto' 模式下精确枚举的情形数上限，默认 EXACT_THRESHOLD
+        cache: 是否使用结果缓存
+        parallel: 模拟后端是否拆分到进程池并行执行（需事先调用 parallel.start_pool()，见 calculate）
+        workers: 并行进程数
+        precision: 自适应模拟的目标精度（置信区间半宽）
+        time_limit: 自适应模拟的时间上限（秒）
+        threshold: 决策阈值，置信区间不再包含它时提前停止
+        confidence: 置信水平
+        ranges: 每个对手的手牌范围（HandRange），指定时对手数量取其长度
+
+    Returns:
+        胜率（0.0-1.0）
+    """
+    return calculate(hole, board, opponents, method=method, budget=budget, seed=seed,
+                     exact_threshold=exact_threshold, cache=cache,
+                     parallel=parallel, workers=workers, precision=precision,
+                     time_limit=time_limit, threshold=threshold, confidence=confidence,
+                     ranges=ranges).equity
+
+
+def cache_info():
+    """结果缓存的命中统计（见 EquityCache.info）"""
+    return EQUITY_CACHE.info()
+
+
+def clear_cache():
+    """清空结果缓存"""
+    EQUITY_CACHE.clear()
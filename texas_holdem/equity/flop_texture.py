@@ -0,0 +1,307 @@
+"""
+翻牌面结构索引
+22,100 种翻牌在花色置换下只有 1,755 类，每类预先计算牌面结构特征
+（对子、同花色分布、连接度、高牌，以及随机底牌中听同花/听顺子的比例），
+保存为紧凑的二进制文件随代码发布，查询时经花色规范化后一次字典查找即可：
+
+    python -m texas_holdem.equity.flop_texture [--output PATH]
+
+文件格式（小端）：
+    文件头 24 字节: 魔数(8) 版本(4) 类数(4) 保留(8)
+    数据区: 每类一条 21 字节的记录
+            uint8[3]  规范化后代表翻牌的牌编号（升序）
+            uint8[3]  牌面值（从大到小）
+            uint8     标志位：对子、三条、单色、双色、彩虹
+            uint8     连接度（包含全部不同牌面值的顺子窗口数）
+            uint8     该类包含的具体翻牌数
+            uint16[6] 听同花、听顺子、两头顺/双卡顺、已成同花、已成顺子、
+                      任意听牌 的底牌比例 × 65535
+
+文件缺失时在内存中重新计算（约数秒），不影响使用
+"""
+
+import itertools
+import os
+import struct
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..core.card import Card
+from .canonical import canonicalize
+
+INDEX_MAGIC = b'FLOPTEXT'
+INDEX_VERSION = 1
+INDEX_FILENAME = f"flop_texture_v{INDEX_VERSION}.bin"
+INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), INDEX_FILENAME)
+
+NUM_FLOPS = 1755
+_SCALE = 65535
+
+_HEADER = struct.Struct('<8sII8s')
+_RECORD = struct.Struct('<3B3BBBB6H')
+
+# 标志位
+PAIRED = 1
+TRIPS = 2
+MONOTONE = 4
+TWO_TONE = 8
+RAINBOW = 16
+
+# 顺子窗口（13位牌面值掩码），包括 A-2-3-4-5
+_STRAIGHT_WINDOWS = tuple(0b11111 << low for low in range(9)) + (0b1000000001111,)
+
+# 已加载的索引
+_index = None
+
+
+@dataclass(frozen=True)
+class FlopTexture:
+    """一类翻牌的结构特征"""
+    index: int            # 在索引中的编号（0-1754）
+    high: int             # 最大牌面值
+    middle: int           # 中间牌面值
+    low: int              # 最小牌面值
+    paired: bool          # 有对子（含三条）
+    trips: bool           # 三条
+    monotone: bool        # 三张同花色
+    two_tone: bool        # 两张同花色
+    rainbow: bool         # 三种花色
+    connectedness: int    # 包含全部不同牌面值的顺子窗口数（0 表示不可能成顺）
+    combos: int           # 该类包含的具体翻牌数（1-24）
+    flush_draw: float     # 随机底牌中听同花（差一张）的比例
+    straight_draw: float  # 随机底牌中听顺子的比例
+    oesd: float           # 随机底牌中两头顺或双卡顺（至少两种点数可成顺）的比例
+    made_flush: float     # 随机底牌中已成同花的比例
+    made_straight: float  # 随机底牌中已成顺子的比例
+    any_draw: float       # 随机底牌中听同花或听顺子的比例
+
+    @property
+    def wetness(self) -> float:
+        """湿润度：已成或听同花/顺子的底牌比例"""
+        return min(1.0, self.any_draw + self.made_flush + self.made_straight)
+
+    @property
+    def dry(self) -> bool:
+        """干燥牌面：彩虹或对子牌面，且几乎没有底牌听顺子"""
+        return (self.rainbow or self.paired) and self.straight_draw < 0.15
+
+
+def _straight_outs_table(straight_high: Sequence[int]) -> List[int]:
+    """13位牌面值掩码 -> 再来一种点数即可成顺的点数个数（已成顺为 -1）"""
+    table = []
+    for mask in range(1 << 13):
+        if straight_high[mask]:
+            table.append(-1)
+        else:
+            table.append(sum(1 for r in range(13) if not mask >> r & 1 and straight_high[mask | 1 << r]))
+    return table
+
+
+def _flop_features(flop: Sequence[Card], straight_outs: Sequence[int]) -> Tuple:
+    """计算一个翻牌的特征（记录中除代表牌和组合数以外的字段）"""
+    values = sorted((card.value for card in flop), reverse=True)
+    suit_counts = [0, 0, 0, 0]
+    rank_mask = 0
+    flop_mask = 0
+    for card in flop:
+        suit_counts[card.suit_index] += 1
+        rank_mask |= 1 << (card.value - 2)
+        flop_mask |= card.mask
+
+    flags = 0
+    distinct = len(set(values))
+    if distinct < 3:
+        flags |= PAIRED
+    if distinct == 1:
+        flags |= TRIPS
+    flags |= {3: MONOTONE, 2: TWO_TONE, 1: RAINBOW}[max(suit_counts)]
+    connectedness = sum(1 for window in _STRAIGHT_WINDOWS if rank_mask & window == rank_mask)
+
+    counts = [0] * 6
+    live = [card for card in Card.all_cards() if not flop_mask & card.mask]
+    total = 0
+    for card_a, card_b in itertools.combinations(live, 2):
+        total += 1
+        suited = suit_counts[:]
+        suited[card_a.suit_index] += 1
+        suited[card_b.suit_index] += 1
+        best_suit = max(suited)
+        mask = rank_mask | 1 << (card_a.value - 2) | 1 << (card_b.value - 2)
+
+        flush_draw = best_suit == 4
+        outs = straight_outs[mask]
+        straight_draw = outs >= 1
+        oesd = outs >= 2
+        if best_suit >= 5:
+            counts[3] += 1
+        if outs < 0:
+            counts[4] += 1
+        counts[0] += flush_draw
+        counts[1] += straight_draw
+        counts[2] += oesd
+        counts[5] += flush_draw or straight_draw
+
+    fractions = [count / total for count in counts]
+    return values, flags, connectedness, fractions
+
+
+def compute_textures() -> List[Tuple]:
+    """
+    枚举全部翻牌，按花色同构分类并计算特征
+
+    Returns:
+        按代表翻牌排序的记录元组列表（与 _RECORD 字段一致，比例为浮点数）
+    """
+    from ..core.draw_analyzer import straight_table
+
+    straight_outs = _straight_outs_table(straight_table())
+    classes: Dict[Tuple[int, int, int], int] = {}
+    for flop in itertools.combinations(Card.all_cards(), 3):
+        _, canonical = canonicalize((), flop)
+        ids = tuple(card.id for card in canonical)
+        classes[ids] = classes.get(ids, 0) + 1
+
+    records = []
+    for ids in sorted(classes):
+        values, flags, connectedness, fractions = _flop_features(
+            [Card.from_id(card_id) for card_id in ids], straight_outs)
+        records.append((*ids, *values, flags, connectedness, classes[ids], *fractions))
+    return records
+
+
+class FlopTextureIndex:
+    """已加载的翻牌面结构索引（只读）"""
+
+    def __init__(self, records: Sequence[Tuple], path: Optional[str] = None):
+        """
+        Args:
+            records: 每类一条记录，字段顺序同 _RECORD（比例为 0.0-1.0）
+            path: 来源文件，在内存中计算时为 None
+        """
+        self.path = path
+        self._positions: Dict[Tuple[int, int, int], int] = {}
+        self.textures: List[FlopTexture] = []
+        for index, record in enumerate(records):
+            self._positions[tuple(record[:3])] = index
+            high, middle, low, flags, connectedness, combos = record[3:9]
+            self.textures.append(FlopTexture(
+                index, high, middle, low,
+                bool(flags & PAIRED), bool(flags & TRIPS), bool(flags & MONOTONE),
+                bool(flags & TWO_TONE), bool(flags & RAINBOW),
+                connectedness, combos, *record[9:]))
+
+    def index_of(self, flop: Sequence[Card]) -> int:
+        """翻牌（任意3张，顺序不限）所属类的编号"""
+        _, canonical = canonicalize((), flop)
+        return self._positions[tuple(card.id for card in canonical)]
+
+    def texture(self, flop: Sequence[Card]) -> FlopTexture:
+        """翻牌的结构特征"""
+        return self.textures[self.index_of(flop)]
+
+    def __len__(self):
+        return len(self.textures)
+
+
+def write_index(records: Sequence[Tuple], path: Optional[str] = None) -> str:
+    """把记录写入索引文件（比例量化为 uint16）"""
+    path = path or INDEX_PATH
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(records), b'\0' * 8))
+        for record in records:
+            f.write(_RECORD.pack(*record[:9], *(round(value * _SCALE) for value in record[9:])))
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_index(path: Optional[str] = None) -> FlopTextureIndex:
+    """
+    读取索引文件
+
+    Args:
+        path: 文件路径，默认 INDEX_PATH
+
+    Returns:
+        FlopTextureIndex
+
+    Raises:
+        FileNotFoundError: 文件不存在
+        ValueError: 文件格式或版本不符
+    """
+    path = path or INDEX_PATH
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if len(data) < _HEADER.size:
+        raise ValueError(f"Flop texture index {path} is truncated")
+    magic, version, count, _ = _HEADER.unpack_from(data)
+    if magic != INDEX_MAGIC or version != INDEX_VERSION:
+        raise ValueError(f"Flop texture index {path} has an unsupported format")
+    if count != NUM_FLOPS or len(data) != _HEADER.size + count * _RECORD.size:
+        raise ValueError(f"Flop texture index {path} has the wrong size")
+
+    records = []
+    for fields in _RECORD.iter_unpack(data[_HEADER.size:]):
+        records.append(fields[:9] + tuple(value / _SCALE for value in fields[9:]))
+    return FlopTextureIndex(records, path)
+
+
+def get_index() -> FlopTextureIndex:
+    """
+    获取翻牌面结构索引（首次调用时加载，文件缺失时在内存中计算）
+    """
+    global _index
+    if _index is None:
+        try:
+            _index = load_index()
+        except FileNotFoundError:
+            _index = FlopTextureIndex(compute_textures())
+    return _index
+
+
+def board_texture(community_cards: Sequence[Card]) -> FlopTexture:
+    """
+    查询翻牌面结构
+
+    Args:
+        community_cards: 公共牌（至少3张，只使用前三张即翻牌）
+
+    Returns:
+        FlopTexture
+    """
+    if len(community_cards) < 3:
+        raise ValueError(f"Need at least 3 community cards, got {len(community_cards)}")
+    return get_index().texture(community_cards[:3])
+
+
+def generate(path: Optional[str] = None, verbose: bool = True) -> str:
+    """
+    计算全部翻牌类的特征并写入索引文件
+
+    Args:
+        path: 输出路径，默认 INDEX_PATH
+        verbose: 是否打印耗时
+
+    Returns:
+        写入的文件路径
+    """
+    start_time = time.perf_counter()
+    records = compute_textures()
+    path = write_index(records, path)
+
+    global _index
+    _index = None
+    if verbose:
+        print(f"已写入 {path}（{len(records)} 类，{time.perf_counter() - start_time:.1f}s）")
+    return path
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="生成翻牌面结构索引")
+    parser.add_argument('--output', default=None, help="输出路径")
+    args = parser.parse_args()
+    generate(args.output)
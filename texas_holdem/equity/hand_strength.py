@@ -0,0 +1,466 @@
+"""
+手牌强度（HS）与期望强度平方（EHS²）
+HS 为当前公共牌下己方牌力超过随机一手牌的比例（平局算一半），
+EHS² 为发完全部公共牌后 HS 平方的期望，同时反映当前牌力和听牌潜力。
+
+翻牌圈：1,755 类翻牌 × 1,176 种底牌全部精确枚举，离线生成后随代码发布，
+        以只读 mmap 方式按需映射，查询时经花色规范化后直接按偏移读取：
+
+    python -m texas_holdem.equity.hand_strength [--output PATH]
+
+转牌圈：完整的表约有 1,850 万项，不适合随代码发布，改为查询时精确枚举
+        （46 种河牌 × 990 种对手底牌），有 numpy 时一次批量评估（约4毫秒），
+        结果按花色同构的规范键缓存
+河牌圈：直接精确枚举 990 种对手底牌，EHS² 即 HS²
+
+文件格式（小端）：
+    文件头 24 字节: 魔数(8) 版本(4) 翻牌类数(4) 每类底牌组合数(4) 保留(4)
+    数据区: uint8[1755][1176][2] 每类翻牌（顺序同 flop_texture 索引）下
+            每组底牌（剩余49张牌中的组合，按牌编号顺序）的 HS、EHS² × 255
+"""
+
+import itertools
+import mmap
+import os
+import struct
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from ..core.card import Card
+from ..core.lookup_evaluator import BoardEvaluator
+from .cache import EquityCache
+from .canonical import canonical_key, suit_mapping
+
+TABLE_MAGIC = b'EHSFLOP\0'
+TABLE_VERSION = 1
+TABLE_FILENAME = f"ehs_flop_v{TABLE_VERSION}.bin"
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), TABLE_FILENAME)
+
+FLOP_COMBOS = 1176  # C(49, 2)
+_SCALE = 255
+
+_HEADER = struct.Struct('<8sIII4s')
+
+# 转牌、河牌的精确结果（按花色同构的规范键）
+STRENGTH_CACHE = EquityCache(maxsize=4096)
+
+# 已映射的翻牌表（None 表示尚未加载，False 表示文件不存在或格式不符）
+_flop_table = None
+
+
+@dataclass(frozen=True)
+class HandStrength:
+    """手牌强度"""
+    hs: float      # 当前牌力超过随机一手牌的比例（0.0-1.0）
+    ehs2: float    # 发完公共牌后 HS² 的期望（0.0-1.0）
+
+    @property
+    def potential(self) -> float:
+        """综合强度 sqrt(EHS²)：成牌接近 HS，听牌会高于当前 HS"""
+        return self.ehs2 ** 0.5
+
+
+def _pair_index(i: int, j: int, n: int) -> int:
+    """n 张牌中第 i、j 张（i < j）组成的组合在 combinations 顺序中的下标"""
+    return i * (2 * n - i - 1) // 2 + (j - i - 1)
+
+
+class _PairLayout:
+    """n 张剩余牌的所有两张组合（按 combinations 顺序）及每张牌所在的组合"""
+
+    def __init__(self, n: int):
+        import numpy as np
+
+        self.n = n
+        self.first, self.second = np.triu_indices(n, 1)
+        index = np.zeros((n, n), dtype=np.intp)
+        index[self.first, self.second] = np.arange(len(self.first))
+        index[self.second, self.first] = np.arange(len(self.first))
+        self.index = index
+        # rows[p]: 包含第 p 张牌的 n-1 个组合
+        self.rows = index[~np.eye(n, dtype=bool)].reshape(n, n - 1)
+        self.row_offsets = np.arange(n, dtype=np.int64)[:, None] << 32
+        self.opponents = (n - 2) * (n - 3) // 2
+
+
+def _all_strengths(board_ids: Sequence[int], live_ids, layout: _PairLayout):
+    """
+    公共牌固定时，剩余牌中每组底牌的 HS（对所有不冲突的对手组合）
+
+    先对全部组合的牌力键排序得到比自己小/相等的个数，
+    再减去与自己共用一张牌的组合中的个数（用按牌分行的有序数组计数）
+
+    Returns:
+        [C(n,2)] 的 float64 数组，顺序同 layout
+    """
+    import numpy as np
+    from ..core import batch_evaluator
+
+    pow5, bits = batch_evaluator.card_weights()
+    board_q = int(pow5[list(board_ids)].sum())
+    board_bits = int(bits[list(board_ids)].sum())
+    first = live_ids[layout.first]
+    second = live_ids[layout.second]
+    keys = batch_evaluator.evaluate_sums(board_q + pow5[first] + pow5[second],
+                                         board_bits + bits[first] + bits[second]).astype(np.int64)
+
+    ordered = np.sort(keys)
+    less_all = np.searchsorted(ordered, keys, 'left')
+    equal_all = np.searchsorted(ordered, keys, 'right') - less_all
+
+    # 每行加上行号偏移后整体有序，一次 searchsorted 即可分别统计各行
+    rows = np.sort(keys[layout.rows] | layout.row_offsets, axis=1).ravel()
+    row_size = layout.n - 1
+
+    def count_in_row(positions):
+        target = (positions.astype(np.int64) << 32) | keys
+        base = positions * row_size
+        less = np.searchsorted(rows, target, 'left') - base
+        equal = np.searchsorted(rows, target, 'right') - base - less
+        return less, equal
+
+    less_a, equal_a = count_in_row(layout.first)
+    less_b, equal_b = count_in_row(layout.second)
+    less = less_all - less_a - less_b
+    # 自己同时计入了全体和两行，相互抵消后剩下不冲突的相等组合
+    equal = equal_all - equal_a - equal_b + 1
+    return (less + 0.5 * equal) / layout.opponents
+
+
+def _flop_rows(flop_ids: Sequence[int], layouts) -> 'np.ndarray':
+    """一类翻牌下所有底牌组合的 (HS, EHS²)，形状 [1176, 2]"""
+    import numpy as np
+
+    layout49, layout47 = layouts
+    flop_mask = 0
+    for card_id in flop_ids:
+        flop_mask |= 1 << card_id
+    live = np.array([card_id for card_id in range(52) if not flop_mask >> card_id & 1], dtype=np.intp)
+
+    result = np.zeros((FLOP_COMBOS, 2))
+    result[:, 0] = _all_strengths(flop_ids, live, layout49)
+
+    # 每种转牌+河牌：剩余47张牌中的每组底牌累加 HS²，映射回49张牌的组合下标
+    positions = np.arange(49)
+    squares = np.zeros(FLOP_COMBOS)
+    for turn, river in itertools.combinations(range(49), 2):
+        rest = np.delete(positions, (turn, river))
+        strengths = _all_strengths(list(flop_ids) + [live[turn], live[river]], live[rest], layout47)
+        squares[layout49.index[rest[layout47.first], rest[layout47.second]]] += strengths * strengths
+    # 每组底牌恰有 C(47,2) 种不冲突的补全
+    result[:, 1] = squares / len(layout47.first)
+    return result
+
+
+class FlopStrengthTable:
+    """已映射的翻牌圈 HS/EHS² 表（只读）"""
+
+    def __init__(self, data, path: Optional[str] = None):
+        """
+        Args:
+            data: 整个文件的内容（mmap 或 bytes）
+            path: 来源文件
+        """
+        self._data = data
+        self.path = path
+
+    def lookup(self, flop_index: int, combo: int) -> HandStrength:
+        """第 flop_index 类翻牌下第 combo 组底牌的强度"""
+        offset = _HEADER.size + (flop_index * FLOP_COMBOS + combo) * 2
+        return HandStrength(self._data[offset] / _SCALE, self._data[offset + 1] / _SCALE)
+
+
+def load_table(path: Optional[str] = None) -> FlopStrengthTable:
+    """
+    以只读 mmap 方式映射翻牌圈强度表
+
+    Args:
+        path: 文件路径，默认 TABLE_PATH
+
+    Returns:
+        FlopStrengthTable
+
+    Raises:
+        FileNotFoundError: 文件不存在
+        ValueError: 文件格式或版本不符
+    """
+    from .flop_texture import NUM_FLOPS
+
+    path = path or TABLE_PATH
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _HEADER.size:
+            raise ValueError(f"Hand strength table {path} is truncated")
+        # 映射在文件关闭后仍然有效
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, flops, combos, _ = _HEADER.unpack_from(data)
+    if magic != TABLE_MAGIC or version != TABLE_VERSION:
+        raise ValueError(f"Hand strength table {path} has an unsupported format")
+    if flops != NUM_FLOPS or combos != FLOP_COMBOS or size != _HEADER.size + flops * combos * 2:
+        raise ValueError(f"Hand strength table {path} has the wrong size")
+    return FlopStrengthTable(data, path)
+
+
+def get_flop_table() -> Optional[FlopStrengthTable]:
+    """
+    获取翻牌圈强度表（首次调用时映射）
+
+    Returns:
+        FlopStrengthTable；表文件不存在时返回 None
+    """
+    global _flop_table
+    if _flop_table is None:
+        try:
+            _flop_table = load_table()
+        except FileNotFoundError:
+            _flop_table = False
+    return _flop_table or None
+
+
+def _current_strength(hole: Sequence[Card], board: Sequence[Card], unseen: List[Card]) -> float:
+    """当前公共牌下的 HS（对 unseen 中所有两张组合，只比较当前牌力）"""
+    evaluator = BoardEvaluator(board)
+    hero = evaluator.evaluate_key(hole)
+    score = 0.0
+    total = 0
+    for opponent in itertools.combinations(unseen, 2):
+        key = evaluator.evaluate_key(opponent)
+        score += 1.0 if hero > key else 0.5 if hero == key else 0.0
+        total += 1
+    return score / total
+
+
+def _turn_strength(hole: Sequence[Card], board: Sequence[Card], unseen: List[Card]) -> HandStrength:
+    """转牌圈精确枚举：当前 HS，以及每张河牌下 HS² 的平均"""
+    from ..core import batch_evaluator
+
+    if batch_evaluator.np is not None:
+        return _turn_strength_batch(hole, board, unseen)
+
+    squares = 0.0
+    for river in unseen:
+        rest = [card for card in unseen if card != river]
+        strength = _current_strength(hole, list(board) + [river], rest)
+        squares += strength * strength
+    return HandStrength(_current_strength(hole, board, unseen), squares / len(unseen))
+
+
+def _turn_strength_batch(hole: Sequence[Card], board: Sequence[Card], unseen: List[Card]) -> HandStrength:
+    """
+    _turn_strength 的 numpy 版本：所有河牌 × 对手组合一次批量评估
+
+    对手组合取 unseen 中的全部两张组合，每张河牌下去掉包含该河牌的组合
+    """
+    import numpy as np
+    from ..core import batch_evaluator
+
+    pow5, bits = batch_evaluator.card_weights()
+    board_ids = [card.id for card in board]
+    hole_ids = [card.id for card in hole]
+    board_q = int(pow5[board_ids].sum())
+    board_bits = int(bits[board_ids].sum())
+    hero_q = board_q + int(pow5[hole_ids].sum())
+    hero_bits = board_bits + int(bits[hole_ids].sum())
+
+    live = np.array([card.id for card in unseen], dtype=np.intp)
+    first, second = np.triu_indices(len(live), 1)
+    pair_q = pow5[live[first]] + pow5[live[second]]
+    pair_bits = bits[live[first]] + bits[live[second]]
+
+    def strength(hero, opponents, valid=None):
+        score = (hero > opponents) + 0.5 * (hero == opponents)
+        if valid is None:
+            return score.mean(axis=-1)
+        return (score * valid).sum(axis=-1) / valid.sum(axis=-1)
+
+    # 当前 HS
+    hero_now = batch_evaluator.evaluate_sums(np.array([hero_q]), np.array([hero_bits]))[0]
+    current = strength(hero_now, batch_evaluator.evaluate_sums(board_q + pair_q, board_bits + pair_bits))
+
+    # [河牌, 对手组合]：河牌与对手底牌冲突的位置不计，只评估公共牌以免出现不存在的牌型
+    river_q = pow5[live][:, None]
+    river_bits = bits[live][:, None]
+    positions = np.arange(len(live))[:, None]
+    valid = (first != positions) & (second != positions)
+    hero_river = batch_evaluator.evaluate_sums(hero_q + river_q[:, 0], hero_bits + river_bits[:, 0])
+    opponents = batch_evaluator.evaluate_sums((board_q + river_q + np.where(valid, pair_q, 0)).ravel(),
+                                              (board_bits + river_bits + np.where(valid, pair_bits, 0)).ravel())
+    river_strength = strength(hero_river[:, None], opponents.reshape(valid.shape), valid)
+    return HandStrength(float(current), float((river_strength * river_strength).mean()))
+
+
+def _flop_strength(hole: Sequence[Card], board: Sequence[Card], unseen: List[Card]) -> HandStrength:
+    """
+    没有翻牌表时的翻牌圈强度
+
+    有 numpy 时精确计算整类翻牌（约1秒，按翻牌类缓存）；
+    否则 EHS² 近似为转牌后 HS² 的平均（只向前看一张牌）
+    """
+    from ..core import batch_evaluator
+
+    if batch_evaluator.np is not None:
+        from .flop_texture import get_index
+
+        flop_index, combo = _flop_position(hole, board)
+        cache_key = ('flop', flop_index)
+        rows = STRENGTH_CACHE.get(cache_key)
+        if rows is None:
+            flop_ids = _flop_records(get_index())[flop_index]
+            rows = _flop_rows(flop_ids, (_PairLayout(49), _PairLayout(47)))
+            STRENGTH_CACHE.put(cache_key, rows)
+        return HandStrength(float(rows[combo, 0]), float(rows[combo, 1]))
+
+    squares = 0.0
+    for turn in unseen:
+        rest = [card for card in unseen if card != turn]
+        strength = _current_strength(hole, list(board) + [turn], rest)
+        squares += strength * strength
+    return HandStrength(_current_strength(hole, board, unseen), squares / len(unseen))
+
+
+def _flop_position(hole: Sequence[Card], flop: Sequence[Card]):
+    """
+    底牌和翻牌在表中的位置
+
+    Returns:
+        (翻牌类编号, 底牌在代表翻牌剩余49张牌中的组合下标)
+    """
+    from .flop_texture import get_index
+
+    suit_map = suit_mapping((), flop)
+    flop_ids = sorted(Card(suit_map[card.suit], card.rank).id for card in flop)
+    flop_index = get_index()._positions[tuple(flop_ids)]
+    # 剩余牌中的位置 = 牌编号 - 编号更小的翻牌张数
+    positions = sorted(card_id - sum(1 for flop_id in flop_ids if flop_id < card_id)
+                       for card_id in (Card(suit_map[card.suit], card.rank).id for card in hole))
+    return flop_index, _pair_index(positions[0], positions[1], 49)
+
+
+def postflop_strength(hole_cards: Sequence[Card], community_cards: Sequence[Card]) -> HandStrength:
+    """
+    查询手牌强度（HS 与 EHS²，对一个随机对手）
+
+    翻牌圈查表（量化误差不超过 0.002），转牌圈、河牌圈精确枚举并缓存
+
+    Args:
+        hole_cards: 底牌（2张）
+        community_cards: 公共牌（3-5张）
+
+    Returns:
+        HandStrength
+    """
+    hole, board = list(hole_cards), list(community_cards)
+    if len(hole) != 2:
+        raise ValueError(f"Expected 2 hole cards, got {len(hole)}")
+    if not 3 <= len(board) <= 5:
+        raise ValueError(f"Hand strength needs 3-5 community cards, got {len(board)}")
+
+    if len(board) == 3:
+        table = get_flop_table()
+        if table is not None:
+            return table.lookup(*_flop_position(hole, board))
+
+    cache_key = canonical_key(hole, board)
+    cached = STRENGTH_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    dead = {card.id for card in hole + board}
+    unseen = [card for card in Card.all_cards() if card.id not in dead]
+    if len(board) == 5:
+        strength = _current_strength(hole, board, unseen)
+        result = HandStrength(strength, strength * strength)
+    elif len(board) == 4:
+        result = _turn_strength(hole, board, unseen)
+    else:
+        result = _flop_strength(hole, board, unseen)
+    STRENGTH_CACHE.put(cache_key, result)
+    return result
+
+
+def cached_strength(hole_cards: Sequence[Card], community_cards: Sequence[Card]) -> Optional[HandStrength]:
+    """
+    不做计算、只查表和缓存的手牌强度
+
+    Returns:
+        翻牌圈有表或局面已缓存时返回 HandStrength，否则返回 None
+    """
+    hole, board = list(hole_cards), list(community_cards)
+    if len(board) == 3:
+        table = get_flop_table()
+        if table is not None:
+            return table.lookup(*_flop_position(hole, board))
+    return STRENGTH_CACHE.get(canonical_key(hole, board))
+
+
+def current_strength(hole_cards: Sequence[Card], community_cards: Sequence[Card]) -> float:
+    """
+    当前牌力 HS（只比较当前公共牌下的牌力，不计听牌潜力，约1毫秒）
+
+    Args:
+        hole_cards: 底牌（2张）
+        community_cards: 公共牌（3-5张）
+
+    Returns:
+        HS（0.0-1.0）
+    """
+    hole, board = list(hole_cards), list(community_cards)
+    dead = {card.id for card in hole + board}
+    unseen = [card for card in Card.all_cards() if card.id not in dead]
+    return _current_strength(hole, board, unseen)
+
+
+def generate(path: Optional[str] = None, verbose: bool = True) -> str:
+    """
+    精确计算翻牌圈 HS/EHS² 表并写入文件（需要 numpy）
+
+    Args:
+        path: 输出路径，默认 TABLE_PATH
+        verbose: 是否打印进度
+
+    Returns:
+        写入的文件路径
+    """
+    from ..core import batch_evaluator
+    from .flop_texture import get_index
+
+    np = batch_evaluator.np
+    if np is None:
+        raise RuntimeError("生成手牌强度表需要安装 numpy: pip install numpy")
+
+    path = path or TABLE_PATH
+    start_time = time.perf_counter()
+    flops = [record[:3] for record in _flop_records(get_index())]
+    layouts = (_PairLayout(49), _PairLayout(47))
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, len(flops), FLOP_COMBOS, b'\0' * 4))
+        for number, flop_ids in enumerate(flops):
+            rows = _flop_rows(flop_ids, layouts)
+            f.write(np.rint(np.clip(rows, 0.0, 1.0) * _SCALE).astype(np.uint8).tobytes())
+            if verbose and number % 100 == 99:
+                print(f"  {number + 1}/{len(flops)}  {time.perf_counter() - start_time:.0f}s")
+    os.replace(tmp_path, path)
+
+    global _flop_table
+    _flop_table = None
+    if verbose:
+        print(f"已写入 {path}（{time.perf_counter() - start_time:.0f}s）")
+    return path
+
+
+def _flop_records(index):
+    """翻牌索引中各类的代表牌编号（按索引顺序）"""
+    return sorted(index._positions, key=index._positions.get)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="生成翻牌圈手牌强度（HS/EHS²）表")
+    parser.add_argument('--output', default=None, help="输出路径")
+    args = parser.parse_args()
+    generate(args.output)
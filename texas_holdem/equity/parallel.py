@@ -0,0 +1,146 @@
+"""
+多进程胜率计算
+把模拟次数拆给常驻的进程池，每个分块使用由同一个种子派生的独立随机流，
+最后合并各分块的分成累计值。进程池启动时预热（导入模块、加载查找表），
+之后的请求不再承担进程创建和导入的开销
+
+进程池需要由调用方在开始决策之前显式调用 start_pool() 启动；未启动时，
+第一次 parallel=True 的请求会在请求内创建并预热进程池（数秒）。
+游戏本身（main.py、CLI、AI）不使用并行模式，因此启动时不创建进程池
+"""
+
+import atexit
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+from ..core.card import Card
+
+# 每个分块至少的模拟次数，分得更细时进程间通信的开销会超过收益
+MIN_CHUNK = 2000
+
+_executor: Optional[ProcessPoolExecutor] = None
+_workers = 0
+
+
+def _warm_worker():
+    """子进程初始化：导入评估模块并加载查找表"""
+    from ..core import lookup_evaluator, batch_evaluator
+    lookup_evaluator.build_tables()
+    if batch_evaluator.np is not None:
+        batch_evaluator.evaluate_batch(batch_evaluator.np.arange(7, dtype=batch_evaluator.np.uint8)[None, :])
+
+
+def _ping(_) -> int:
+    # 稍作停留，让任务分散到不同的子进程
+    time.sleep(0.01)
+    return os.getpid()
+
+
+def start_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    启动（或返回已启动的）进程池并等待所有子进程完成预热
+
+    Args:
+        workers: 进程数，默认 CPU 核数
+
+    Returns:
+        ProcessPoolExecutor
+    """
+    global _executor, _workers
+    workers = workers or os.cpu_count() or 1
+    if _executor is not None and _workers == workers:
+        return _executor
+    shutdown_pool()
+
+    _executor = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker)
+    _workers = workers
+    # 每个子进程至少执行一个任务，确保创建和预热都在这里完成
+    list(_executor.map(_ping, range(workers * 2)))
+    return _executor
+
+
+def shutdown_pool():
+    """关闭进程池"""
+    global _executor, _workers
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+        _workers = 0
+
+
+atexit.register(shutdown_pool)
+
+
+def pool_workers() -> int:
+    """当前进程池的进程数（未启动时为0）"""
+    return _workers
+
+
+def spawn_seeds(seed: Optional[int], count: int) -> List[int]:
+    """
+    由一个种子派生 count 个互相独立的子种子
+
+    安装了 numpy 时使用 SeedSequence.spawn，否则用字符串种子区分（与 Deck.streams 相同）；
+    seed 为 None 时每次得到不同的子种子
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return [random.Random(f"{seed}:{i}").getrandbits(64) if seed is not None
+                else random.getrandbits(64) for i in range(count)]
+    children = np.random.SeedSequence(seed).spawn(count)
+    return [int(child.generate_state(2, dtype=np.uint64)[0]) for child in children]
+
+
+def _run_chunk(task: Tuple[str, List[int], List[int], int, int, int]) -> Tuple[float, float, int]:
+    """在子进程中执行一个分块的模拟"""
+    from . import backends
+
+    method, hole_ids, board_ids, opponents, iterations, seed = task
+    hole = [Card.from_id(card_id) for card_id in hole_ids]
+    board = [Card.from_id(card_id) for card_id in board_ids]
+    if method == 'vectorized':
+        from ..core import batch_evaluator
+        generator = batch_evaluator.np.random.default_rng(seed)
+        return backends.vectorized_equity(hole, board, opponents, iterations, generator)
+    return backends.monte_carlo_equity(hole, board, opponents, iterations, random.Random(seed))
+
+
+def parallel_equity(hole: Sequence[Card], board: Sequence[Card], opponents: int, iterations: int,
+                    method: str = 'montecarlo', seed: Optional[int] = None,
+                    workers: Optional[int] = None) -> Tuple[float, float, int]:
+    """
+    把模拟拆分到进程池中执行（进程池未启动时在此启动，见模块说明）
+
+    Args:
+        hole: 己方底牌
+        board: 公共牌
+        opponents: 对手数量
+        iterations: 总模拟次数
+        method: 'montecarlo' 或 'vectorized'
+        seed: 随机种子（同一种子、同一进程数下结果可复现）
+        workers: 进程数，默认沿用已启动的进程池或 CPU 核数
+
+    Returns:
+        (share_sum, share_sq_sum, trials)
+    """
+    executor = _executor if _executor is not None and workers in (None, _workers) else start_pool(workers)
+    chunks = max(1, min(_workers, iterations // MIN_CHUNK))
+    seeds = spawn_seeds(seed, chunks)
+
+    hole_ids = [card.id for card in hole]
+    board_ids = [card.id for card in board]
+    base, extra = divmod(iterations, chunks)
+    tasks = [(method, hole_ids, board_ids, opponents, base + (1 if i < extra else 0), seeds[i])
+             for i in range(chunks)]
+
+    share_sum = share_sq_sum = 0.0
+    trials = 0
+    for chunk_sum, chunk_sq_sum, chunk_trials in executor.map(_run_chunk, tasks):
+        share_sum += chunk_sum
+        share_sq_sum += chunk_sq_sum
+        trials += chunk_trials
+    return share_sum, share_sq_sum, trials
@@ -0,0 +1,363 @@
+"""
+翻牌前全下胜率表
+169种起手牌两两之间的单挑胜率（考虑两手牌互相占用的牌），以及每种起手牌对 1-7 个随机对手的胜率。
+表由本模块离线生成，保存为二进制文件随代码发布，首次查询时才加载：
+
+    python -m texas_holdem.equity.preflop_table [--samples N] [--seed S] [--workers W]
+
+文件格式（小端）：
+    文件头 32 字节: 魔数(8) 版本(4) 起手牌种类数(4) 最大对手数(4) 每格采样数(4) 保留(8)
+    数据区: uint16[169*169] 行对列的单挑胜率 × 65535
+            uint16[169*7]   行对 1-7 个随机对手的胜率 × 65535
+
+起手牌编号按 13×13 网格排列（行列均为 A K Q ... 2）：
+对角线为对子，右上三角为同花，左下三角为不同花
+"""
+
+import math
+import os
+import struct
+import sys
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 为可选依赖，未安装时用 array 读取，生成表则需要 numpy
+    np = None
+
+from ..core.card import Card
+
+TABLE_MAGIC = b'PFEQUITY'
+TABLE_VERSION = 1
+TABLE_FILENAME = f"preflop_equity_v{TABLE_VERSION}.bin"
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), TABLE_FILENAME)
+
+NUM_CLASSES = 169
+MAX_OPPONENTS = 7
+_SCALE = 65535
+
+_HEADER = struct.Struct('<8sIIII8s')
+
+# 网格行列对应的牌面值（A 在前）
+_GRID_VALUES = tuple(range(14, 1, -1))
+_RANK_LABELS = 'AKQJT98765432'
+_RANK_NAMES = {14: 'A', 13: 'K', 12: 'Q', 11: 'J', 10: '10', 9: '9', 8: '8',
+               7: '7', 6: '6', 5: '5', 4: '4', 3: '3', 2: '2'}
+
+# 已加载的表（None 表示尚未加载，False 表示文件不存在）
+_table = None
+
+
+def hand_class(hole_cards: Sequence[Card]) -> int:
+    """
+    起手牌所属的类别编号（0-168）
+
+    Args:
+        hole_cards: 两张底牌
+
+    Returns:
+        网格编号 row * 13 + col
+    """
+    card1, card2 = hole_cards
+    high, low = (card1, card2) if card1.value >= card2.value else (card2, card1)
+    high_index, low_index = 14 - high.value, 14 - low.value
+    if high_index == low_index or high.suit != low.suit:
+        return low_index * 13 + high_index
+    return high_index * 13 + low_index
+
+
+def class_label(index: int) -> str:
+    """类别编号对应的名称，如 'AA'、'AKs'、'T9o'"""
+    row, col = divmod(index, 13)
+    if row == col:
+        return _RANK_LABELS[row] * 2
+    if row < col:
+        return f"{_RANK_LABELS[row]}{_RANK_LABELS[col]}s"
+    return f"{_RANK_LABELS[col]}{_RANK_LABELS[row]}o"
+
+
+def class_combos(index: int) -> List[Tuple[Card, Card]]:
+    """
+    类别包含的所有具体组合（对子6个，同花4个，不同花12个）
+
+    Args:
+        index: 类别编号
+
+    Returns:
+        (高牌, 低牌) 列表
+    """
+    row, col = divmod(index, 13)
+    high = _RANK_NAMES[_GRID_VALUES[min(row, col)]]
+    low = _RANK_NAMES[_GRID_VALUES[max(row, col)]]
+    suits = Card.SUIT_ORDER
+    if row == col:
+        return [(Card(suits[a], high), Card(suits[b], low))
+                for a in range(4) for b in range(a + 1, 4)]
+    if row < col:
+        return [(Card(suit, high), Card(suit, low)) for suit in suits]
+    return [(Card(a, high), Card(b, low)) for a in suits for b in suits if a != b]
+
+
+class PreflopTable:
+    """已加载的翻牌前胜率表（只读）"""
+
+    def __init__(self, matchups, vs_random, samples: int, path: Optional[str] = None):
+        self._matchups = matchups
+        self._vs_random = vs_random
+        self.samples = samples
+        self.path = path
+
+    def matchup(self, class_a: int, class_b: int) -> float:
+        """类别 a 对类别 b 的单挑全下胜率（平局算一半）"""
+        return self._matchups[class_a * NUM_CLASSES + class_b] / _SCALE
+
+    def vs_random(self, class_index: int, opponents: int = 1) -> float:
+        """类别对 opponents 个随机对手的全下胜率（平局按人数平分）"""
+        if not 1 <= opponents <= MAX_OPPONENTS:
+            raise ValueError(f"Preflop table covers 1-{MAX_OPPONENTS} opponents, got {opponents}")
+        return self._vs_random[class_index * MAX_OPPONENTS + opponents - 1] / _SCALE
+
+    @property
+    def stderr(self) -> float:
+        """单格结果的标准误差上限（每次全下的分成在 0-1 之间）"""
+        return 0.5 / math.sqrt(self.samples)
+
+
+def load_table(path: Optional[str] = None) -> PreflopTable:
+    """
+    读取胜率表文件
+
+    Args:
+        path: 文件路径，默认 TABLE_PATH
+
+    Returns:
+        PreflopTable
+
+    Raises:
+        FileNotFoundError: 文件不存在
+        ValueError: 文件格式或版本不符
+    """
+    path = path or TABLE_PATH
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if len(data) < _HEADER.size:
+        raise ValueError(f"Preflop table {path} is truncated")
+    magic, version, classes, max_opponents, samples, _ = _HEADER.unpack_from(data)
+    if magic != TABLE_MAGIC or version != TABLE_VERSION:
+        raise ValueError(f"Preflop table {path} has an unsupported format")
+    if classes != NUM_CLASSES or max_opponents != MAX_OPPONENTS:
+        raise ValueError(f"Preflop table {path} has unexpected dimensions")
+
+    matchup_count = NUM_CLASSES * NUM_CLASSES
+    random_count = NUM_CLASSES * MAX_OPPONENTS
+    if len(data) != _HEADER.size + 2 * (matchup_count + random_count):
+        raise ValueError(f"Preflop table {path} has the wrong size")
+
+    if np is not None:
+        values = np.frombuffer(data, dtype='<u2', offset=_HEADER.size)
+        # 转成 Python int 列表，查询时避免 numpy 标量开销
+        values = values.tolist()
+    else:
+        values = array('H', data[_HEADER.size:])
+        if sys.byteorder != 'little':
+            values.byteswap()
+    return PreflopTable(values[:matchup_count], values[matchup_count:], samples, path)
+
+
+def get_table() -> Optional[PreflopTable]:
+    """
+    获取胜率表（首次调用时加载）
+
+    Returns:
+        PreflopTable；表文件不存在时返回 None
+    """
+    global _table
+    if _table is None:
+        try:
+            _table = load_table()
+        except FileNotFoundError:
+            _table = False
+    return _table or None
+
+
+def preflop_equity(hole_cards: Sequence[Card], opponents: int = 1) -> float:
+    """
+    查表得到起手牌对随机对手的全下胜率
+
+    Args:
+        hole_cards: 两张底牌
+        opponents: 对手数量（1-7）
+
+    Returns:
+        胜率（0.0-1.0）
+    """
+    table = get_table()
+    if table is None:
+        raise FileNotFoundError(
+            f"Preflop table {TABLE_PATH} is missing, run: python -m texas_holdem.equity.preflop_table")
+    return table.vs_random(hand_class(hole_cards), opponents)
+
+
+def matchup_equity(hole_a: Sequence[Card], hole_b: Sequence[Card]) -> float:
+    """
+    查表得到两类起手牌的单挑全下胜率（按类别平均，不区分具体花色）
+
+    Args:
+        hole_a: 己方底牌
+        hole_b: 对手底牌
+
+    Returns:
+        己方胜率（0.0-1.0）
+    """
+    table = get_table()
+    if table is None:
+        raise FileNotFoundError(
+            f"Preflop table {TABLE_PATH} is missing, run: python -m texas_holdem.equity.preflop_table")
+    return table.matchup(hand_class(hole_a), hand_class(hole_b))
+
+
+def _matchup_groups(class_a: int, class_b: int) -> List[Tuple[Tuple[Card, Card], Tuple[Card, Card], int]]:
+    """两类起手牌的所有不冲突组合，按花色同构合并为 [(代表a, 代表b, 组合数), ...]"""
+    from .canonical import canonical_key
+
+    groups: Dict[tuple, list] = {}
+    for combo_a in class_combos(class_a):
+        mask_a = combo_a[0].mask | combo_a[1].mask
+        for combo_b in class_combos(class_b):
+            if mask_a & (combo_b[0].mask | combo_b[1].mask):
+                continue
+            key = canonical_key(combo_a, combo_b)
+            group = groups.get(key)
+            if group is None:
+                groups[key] = [combo_a, combo_b, 1]
+            else:
+                group[2] += 1
+    return [tuple(group) for group in groups.values()]
+
+
+def _matchup_row(task: Tuple[int, int, int]) -> List[Tuple[int, float, int]]:
+    """
+    计算类别 class_a 对所有编号不小于它的类别的单挑胜率（可在子进程中执行）
+
+    Returns:
+        [(class_b, 胜率, 不冲突组合数), ...]
+    """
+    from ..core import batch_evaluator
+    from ..core.sampler import DeadCardSampler
+
+    class_a, samples, seed = task
+    generator = np.random.default_rng(seed)
+    row = []
+    for class_b in range(class_a, NUM_CLASSES):
+        groups = _matchup_groups(class_a, class_b)
+        total = sum(count for _, _, count in groups)
+        if class_a == class_b:
+            row.append((class_b, 0.5, total))  # 同类对同类完全对称，胜率恰为 0.5
+            continue
+
+        share_sum = 0.0
+        for combo_a, combo_b, count in groups:
+            rows = max(16, round(samples * count / total))
+            boards = DeadCardSampler(combo_a + combo_b).sample_matrix(rows, 5, generator)
+            ids_a = np.broadcast_to(np.array([c.id for c in combo_a], dtype=np.uint8), (rows, 2))
+            ids_b = np.broadcast_to(np.array([c.id for c in combo_b], dtype=np.uint8), (rows, 2))
+            keys_a = batch_evaluator.evaluate_batch(np.hstack([boards, ids_a]))
+            keys_b = batch_evaluator.evaluate_batch(np.hstack([boards, ids_b]))
+            share = (keys_a > keys_b).mean() + 0.5 * (keys_a == keys_b).mean()
+            share_sum += count * share
+        row.append((class_b, share_sum / total, total))
+    return row
+
+
+def _multiway_row(task: Tuple[int, int, int]) -> List[float]:
+    """计算类别对 2-7 个随机对手的胜率（可在子进程中执行）"""
+    from .backends import vectorized_equity
+
+    class_index, samples, seed = task
+    generator = np.random.default_rng(seed)
+    hole = list(class_combos(class_index)[0])
+    row = []
+    for opponents in range(2, MAX_OPPONENTS + 1):
+        share_sum, _, trials = vectorized_equity(hole, [], opponents, samples, generator)
+        row.append(share_sum / trials)
+    return row
+
+
+def generate(samples: int = 10000, seed: int = 0, path: Optional[str] = None,
+             verbose: bool = True, workers: int = 1) -> str:
+    """
+    生成胜率表并写入文件（需要 numpy）
+
+    单挑胜率按花色同构把组合分层，每层按组合数分配采样次数；
+    对随机单个对手的胜率由单挑矩阵按不冲突组合数加权得到，
+    多个对手的胜率直接模拟。每一行使用由 seed 派生的独立随机流，
+    因此结果与进程数无关
+
+    Args:
+        samples: 每格的模拟次数
+        seed: 随机种子
+        path: 输出路径，默认 TABLE_PATH
+        verbose: 是否打印进度
+        workers: 进程数，大于1时各行分给进程池并行计算
+
+    Returns:
+        写入的文件路径
+    """
+    if np is None:
+        raise RuntimeError("生成翻牌前胜率表需要安装 numpy: pip install numpy")
+    from .parallel import spawn_seeds, start_pool
+
+    path = path or TABLE_PATH
+    start_time = time.perf_counter()
+    seeds = spawn_seeds(seed, 2 * NUM_CLASSES)
+    row_map = start_pool(workers).map if workers > 1 else map
+
+    matchups = np.full((NUM_CLASSES, NUM_CLASSES), 0.5)
+    compatible = np.zeros((NUM_CLASSES, NUM_CLASSES))
+    tasks = [(class_a, samples, seeds[class_a]) for class_a in range(NUM_CLASSES)]
+    for class_a, row in enumerate(row_map(_matchup_row, tasks)):
+        for class_b, share, total in row:
+            matchups[class_a, class_b] = share
+            matchups[class_b, class_a] = 1.0 - share
+            compatible[class_a, class_b] = compatible[class_b, class_a] = total
+        if verbose and class_a % 13 == 12:
+            print(f"  单挑矩阵 {class_a + 1}/{NUM_CLASSES}  {time.perf_counter() - start_time:.0f}s")
+
+    vs_random = np.zeros((NUM_CLASSES, MAX_OPPONENTS))
+    vs_random[:, 0] = (matchups * compatible).sum(axis=1) / compatible.sum(axis=1)
+    tasks = [(class_index, samples, seeds[NUM_CLASSES + class_index]) for class_index in range(NUM_CLASSES)]
+    for class_index, row in enumerate(row_map(_multiway_row, tasks)):
+        vs_random[class_index, 1:] = row
+        if verbose and class_index % 13 == 12:
+            print(f"  多人胜率 {class_index + 1}/{NUM_CLASSES}  {time.perf_counter() - start_time:.0f}s")
+
+    header = _HEADER.pack(TABLE_MAGIC, TABLE_VERSION, NUM_CLASSES, MAX_OPPONENTS, samples, b'\0' * 8)
+    payload = np.concatenate([matchups.ravel(), vs_random.ravel()])
+    quantized = np.rint(payload * _SCALE).astype('<u2')
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(quantized.tobytes())
+    os.replace(tmp_path, path)
+
+    global _table
+    _table = None
+    if verbose:
+        print(f"已写入 {path}（{time.perf_counter() - start_time:.0f}s）")
+    return path
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="生成翻牌前全下胜率表")
+    parser.add_argument('--samples', type=int, default=10000, help="每格的模拟次数")
+    parser.add_argument('--seed', type=int, default=0, help="随机种子")
+    parser.add_argument('--output', default=None, help="输出路径")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="并行进程数")
+    args = parser.parse_args()
+    generate(args.samples, args.seed, args.output, workers=args.workers)
@@ -0,0 +1,351 @@
+"""
+全押或弃牌（push/fold）均衡图表
+筹码 1-25 个大盲时，单挑和三人桌翻牌前只有全押和弃牌两种选择，
+用 NumPy 向量化的虚拟对弈（fictitious play）在 169 类起手牌上求均衡，
+离线生成后随代码发布，查询时按 (图表, 筹码, 起手牌类别) 直接索引：
+
+    python -m texas_holdem.equity.push_fold [--output PATH]
+
+图表（盲注 0.5/1，各家筹码相同，没有前注）：
+    hu_push      单挑小盲（先行动）全押
+    hu_call      单挑大盲跟注小盲的全押
+    btn_push     三人桌按钮位全押（按钮弃牌后即为单挑图表）
+    sb_call      三人桌小盲跟注按钮位的全押
+    bb_call      三人桌大盲跟注按钮位的全押（小盲已弃牌）
+    bb_overcall  三人桌大盲在按钮位全押、小盲跟注后再跟注
+
+两两对抗的胜率取自翻牌前胜率表，计入死牌对组合数的影响；
+三人全押的胜率由两两胜率近似：己方分额 ∝ 己方对另外两家胜率之积
+
+文件格式（小端）：
+    文件头 28 字节: 魔数(8) 版本(4) 图表数(4) 最大筹码(4) 类别数(4) 保留(4)
+    数据区: uint8[图表数][最大筹码][169] 全押/跟注频率 × 255
+"""
+
+import os
+import struct
+import time
+from typing import Optional, Sequence
+
+from ..core.card import Card
+from .preflop_table import NUM_CLASSES, hand_class
+
+TABLE_MAGIC = b'PUSHFOLD'
+TABLE_VERSION = 1
+TABLE_FILENAME = f"push_fold_v{TABLE_VERSION}.bin"
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), TABLE_FILENAME)
+
+CHARTS = ('hu_push', 'hu_call', 'btn_push', 'sb_call', 'bb_call', 'bb_overcall')
+MAX_STACK = 25
+
+# 虚拟对弈的迭代次数
+HEADS_UP_ITERATIONS = 2000
+THREE_WAY_ITERATIONS = 400
+
+_SCALE = 255
+_HEADER = struct.Struct('<8sIIII4s')
+
+# 已加载的表（None 表示尚未加载，False 表示文件不存在）
+_table = None
+
+
+def _class_data():
+    """
+    起手牌类别之间的对抗数据
+
+    Returns:
+        (E, D, counts)：E[a, b] 为 a 对 b 的全下胜率，
+        D[a, b] 为两类之间不冲突的具体组合对数，counts[a] 为类别的组合数
+    """
+    import numpy as np
+    from .preflop_table import get_table
+    from .ranges import COMBO_CLASSES, COMBO_MASKS
+
+    table = get_table()
+    if table is None:
+        raise FileNotFoundError("Push/fold solver needs the preflop equity table")
+    equity = np.array([[table.matchup(a, b) for b in range(NUM_CLASSES)] for a in range(NUM_CLASSES)])
+
+    masks = np.array(COMBO_MASKS, dtype=np.uint64)
+    disjoint = (masks[:, None] & masks[None, :]) == 0
+    onehot = np.zeros((len(COMBO_CLASSES), NUM_CLASSES))
+    onehot[np.arange(len(COMBO_CLASSES)), COMBO_CLASSES] = 1.0
+    pairs = onehot.T @ disjoint.astype(np.float64) @ onehot
+    return equity, pairs, onehot.sum(axis=0)
+
+
+def _solve_heads_up(stack: float, equity, pairs, iterations: int):
+    """
+    单挑虚拟对弈
+
+    Returns:
+        (小盲全押频率, 大盲跟注频率)，各为 [169] 数组
+    """
+    import numpy as np
+
+    push = np.ones(NUM_CLASSES)
+    call = np.zeros(NUM_CLASSES)
+    # 全押被跟注时的收益（以开局前的筹码为基准，单位大盲）
+    showdown = 2 * stack * equity - stack
+    push_weights = pairs.sum(axis=1)
+    for step in range(1, iterations + 1):
+        # 大盲：跟注收益高于弃牌的 -1 即跟注
+        call_gain = (pairs * (showdown + 1.0)) @ push
+        best_call = (call_gain > 0).astype(np.float64)
+        # 小盲：全押收益高于弃牌的 -0.5 即全押
+        push_value = (pairs @ (1.0 - call) + (pairs * showdown) @ call) / push_weights
+        best_push = (push_value > -0.5).astype(np.float64)
+        # 平均的是各轮的最优反应，不含初始策略
+        push += (best_push - push) / step
+        call += (best_call - call) / step
+    return push, call
+
+
+def _three_way_tensors(equity, pairs, counts):
+    """
+    三人对抗的组合权重 W[a, b, c] 与 W × 第一家的分额
+
+    W 近似为三家组合两两不冲突的概率之积乘以组合数，对三个下标对称
+    """
+    import numpy as np
+
+    disjoint = pairs / np.outer(counts, counts)
+    weights = (counts[:, None, None] * counts[None, :, None] * counts[None, None, :]
+               * disjoint[:, :, None] * disjoint[:, None, :] * disjoint[None, :, :])
+    first = equity[:, :, None] * equity[:, None, :]
+    second = equity.T[:, :, None] * equity[None, :, :]
+    third = equity.T[:, None, :] * equity.T[None, :, :]
+    share = first / (first + second + third)
+    return weights, weights * share
+
+
+def _solve_three_way(stack: float, equity, pairs, counts, tensors, iterations: int):
+    """
+    三人桌按钮位先行动时的虚拟对弈
+
+    Returns:
+        (按钮全押, 小盲跟注, 大盲跟注, 大盲再跟注) 频率，各为 [169] 数组
+    """
+    import numpy as np
+
+    weights, weighted_share = tensors
+    flat = weights.reshape(NUM_CLASSES * NUM_CLASSES, NUM_CLASSES)
+    flat_share = weighted_share.reshape(NUM_CLASSES * NUM_CLASSES, NUM_CLASSES)
+
+    def inner(values, y):
+        """Σ_c values[a, b, c] · y[c]，形状 [169, 169]"""
+        return (values @ y).reshape(NUM_CLASSES, NUM_CLASSES)
+
+    # 单挑全押被跟注的收益：小盲已弃牌（底池多 0.5）、大盲已弃牌（底池多 1）
+    blind_out_sb = (2 * stack + 0.5) * equity - stack
+    blind_out_bb = (2 * stack + 1.0) * equity - stack
+    ones = np.ones(NUM_CLASSES)
+
+    # 初始策略只用来求第一轮最优反应：跟注取一半频率，保证每个决策点的对手范围都非空
+    push = np.ones(NUM_CLASSES)
+    sb_call = np.full(NUM_CLASSES, 0.5)
+    bb_call = np.full(NUM_CLASSES, 0.5)
+    overcall = np.full(NUM_CLASSES, 0.5)
+    for step in range(1, iterations + 1):
+        # 按钮：全押收益高于弃牌的 0
+        w_no_call = inner(flat, 1.0 - sb_call)
+        w_no_overcall = inner(flat, 1.0 - overcall)
+        w_overcall = inner(flat, overcall)
+        push_value = (1.5 * (w_no_call @ (1.0 - bb_call))
+                      + (w_no_call * blind_out_sb) @ bb_call
+                      + (w_no_overcall * blind_out_bb) @ sb_call
+                      + 3 * stack * (inner(flat_share, overcall) @ sb_call)
+                      - stack * (w_overcall @ sb_call))
+        best_push = (push_value > 0).astype(np.float64)
+
+        # 小盲面对按钮全押：跟注收益高于弃牌的 -0.5
+        sb_gain = ((w_no_overcall * blind_out_bb) @ push
+                   + 3 * stack * (inner(flat_share, overcall) @ push)
+                   - stack * (w_overcall @ push)
+                   + 0.5 * (inner(flat, ones) @ push))
+        best_sb = (sb_gain > 0).astype(np.float64)
+
+        # 大盲（小盲已弃牌）：跟注收益高于弃牌的 -1
+        bb_gain = (w_no_call * (blind_out_sb + 1.0)) @ push
+        best_bb = (bb_gain > 0).astype(np.float64)
+
+        # 大盲（小盲已跟注）：三人全押收益高于弃牌的 -1
+        w_sb_call = inner(flat, sb_call)
+        overcall_gain = (3 * stack * (inner(flat_share, sb_call) @ push)
+                         + (1.0 - stack) * (w_sb_call @ push))
+        best_overcall = (overcall_gain > 0).astype(np.float64)
+
+        rate = 1.0 / step
+        push += (best_push - push) * rate
+        sb_call += (best_sb - sb_call) * rate
+        bb_call += (best_bb - bb_call) * rate
+        overcall += (best_overcall - overcall) * rate
+    return push, sb_call, bb_call, overcall
+
+
+def solve(max_stack: int = MAX_STACK, heads_up_iterations: int = HEADS_UP_ITERATIONS,
+          three_way_iterations: int = THREE_WAY_ITERATIONS, verbose: bool = False):
+    """
+    求解全部图表（需要 numpy 和翻牌前胜率表）
+
+    Args:
+        max_stack: 最大筹码（大盲数），求解 1..max_stack
+        heads_up_iterations: 单挑虚拟对弈迭代次数
+        three_way_iterations: 三人桌虚拟对弈迭代次数
+        verbose: 是否打印进度
+
+    Returns:
+        [len(CHARTS), max_stack, 169] 的频率数组
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise RuntimeError("求解全押或弃牌图表需要安装 numpy: pip install numpy")
+
+    equity, pairs, counts = _class_data()
+    tensors = _three_way_tensors(equity, pairs, counts)
+    charts = np.zeros((len(CHARTS), max_stack, NUM_CLASSES))
+    start_time = time.perf_counter()
+    for stack in range(1, max_stack + 1):
+        charts[0:2, stack - 1] = _solve_heads_up(stack, equity, pairs, heads_up_iterations)
+        charts[2:6, stack - 1] = _solve_three_way(stack, equity, pairs, counts, tensors,
+                                                   three_way_iterations)
+        if verbose:
+            print(f"  {stack}BB  {time.perf_counter() - start_time:.0f}s")
+    return charts
+
+
+class PushFoldTable:
+    """已加载的全押或弃牌图表（只读）"""
+
+    def __init__(self, values, max_stack: int, path: Optional[str] = None):
+        self._values = values
+        self.max_stack = max_stack
+        self.path = path
+
+    def frequency(self, chart: str, stack_bb: float, class_index: int) -> float:
+        """
+        查询全押/跟注频率
+
+        Args:
+            chart: CHARTS 中的图表名
+            stack_bb: 有效筹码（大盲数），取最接近的整数并限制在 1..max_stack
+            class_index: 起手牌类别编号（0-168）
+
+        Returns:
+            频率（0.0-1.0）
+        """
+        if chart not in CHARTS:
+            raise ValueError(f"Unknown push/fold chart: {chart}. Must be one of {list(CHARTS)}")
+        stack = min(self.max_stack, max(1, int(stack_bb + 0.5)))
+        offset = (CHARTS.index(chart) * self.max_stack + stack - 1) * NUM_CLASSES + class_index
+        return self._values[offset] / _SCALE
+
+
+def write_table(charts, path: Optional[str] = None) -> str:
+    """把 solve() 的结果量化为 uint8 写入文件"""
+    import numpy as np
+
+    path = path or TABLE_PATH
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, charts.shape[0], charts.shape[1],
+                             NUM_CLASSES, b'\0' * 4))
+        f.write(np.rint(np.clip(charts, 0.0, 1.0) * _SCALE).astype(np.uint8).tobytes())
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_table(path: Optional[str] = None) -> PushFoldTable:
+    """
+    读取图表文件
+
+    Args:
+        path: 文件路径，默认 TABLE_PATH
+
+    Returns:
+        PushFoldTable
+
+    Raises:
+        FileNotFoundError: 文件不存在
+        ValueError: 文件格式或版本不符
+    """
+    path = path or TABLE_PATH
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if len(data) < _HEADER.size:
+        raise ValueError(f"Push/fold table {path} is truncated")
+    magic, version, charts, max_stack, classes, _ = _HEADER.unpack_from(data)
+    if magic != TABLE_MAGIC or version != TABLE_VERSION:
+        raise ValueError(f"Push/fold table {path} has an unsupported format")
+    if charts != len(CHARTS) or classes != NUM_CLASSES or max_stack < 1:
+        raise ValueError(f"Push/fold table {path} has unexpected dimensions")
+    if len(data) != _HEADER.size + charts * max_stack * classes:
+        raise ValueError(f"Push/fold table {path} has the wrong size")
+    return PushFoldTable(data[_HEADER.size:], max_stack, path)
+
+
+def get_table() -> Optional[PushFoldTable]:
+    """
+    获取全押或弃牌图表（首次调用时加载）
+
+    Returns:
+        PushFoldTable；文件不存在时返回 None
+    """
+    global _table
+    if _table is None:
+        try:
+            _table = load_table()
+        except FileNotFoundError:
+            _table = False
+    return _table or None
+
+
+def push_fold_frequency(hole_cards: Sequence[Card], stack_bb: float, chart: str) -> float:
+    """
+    查表得到起手牌的全押/跟注频率
+
+    Args:
+        hole_cards: 两张底牌
+        stack_bb: 有效筹码（大盲数）
+        chart: CHARTS 中的图表名
+
+    Returns:
+        频率（0.0-1.0）
+    """
+    table = get_table()
+    if table is None:
+        raise FileNotFoundError(
+            f"Push/fold table {TABLE_PATH} is missing, run: python -m texas_holdem.equity.push_fold")
+    return table.frequency(chart, stack_bb, hand_class(hole_cards))
+
+
+def generate(path: Optional[str] = None, verbose: bool = True) -> str:
+    """
+    求解全部图表并写入文件
+
+    Args:
+        path: 输出路径，默认 TABLE_PATH
+        verbose: 是否打印进度
+
+    Returns:
+        写入的文件路径
+    """
+    start_time = time.perf_counter()
+    path = write_table(solve(verbose=verbose), path)
+
+    global _table
+    _table = None
+    if verbose:
+        print(f"已写入 {path}（{time.perf_counter() - start_time:.0f}s）")
+    return path
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="生成全押或弃牌均衡图表")
+    parser.add_argument('--output', default=None, help="输出路径")
+    args = parser.parse_args()
+    generate(args.output)
@@ -0,0 +1,156 @@
+"""
+对手手牌范围
+范围是 1326 个具体底牌组合上的权重分布；按 preflop_strength 的起手牌排序，
+可以由 VPIP/PFR 这类百分比统计直接构造
+"""
+
+import itertools
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ..core.card import Card
+from .preflop_table import NUM_CLASSES, class_label, hand_class
+
+# 所有底牌组合，按牌编号升序排列（组合下标即在此元组中的位置）
+COMBOS: Tuple[Tuple[Card, Card], ...] = tuple(itertools.combinations(Card.all_cards(), 2))
+NUM_COMBOS = len(COMBOS)
+COMBO_MASKS: Tuple[int, ...] = tuple(a.mask | b.mask for a, b in COMBOS)
+COMBO_CLASSES: Tuple[int, ...] = tuple(hand_class(combo) for combo in COMBOS)
+
+# 没有统计数据（或 VPIP 过低）时范围的最小比例，避免范围为空
+MIN_FRACTION = 0.02
+
+# 只跟注的玩家范围中，本会加注的强牌仍保留的权重（慢打）
+TRAP_WEIGHT = 0.25
+
+# 起手牌类别从强到弱的顺序（首次使用时生成）
+_class_order: Optional[List[int]] = None
+
+
+def class_order() -> List[int]:
+    """
+    169 类起手牌从强到弱的顺序
+
+    按 preflop_strength.PREFLOP_STRENGTH 排序（未列出的按 0.30 处理），
+    牌力相同时按对随机一手牌的胜率区分
+    """
+    global _class_order
+    if _class_order is None:
+        from ..preflop_strength import PREFLOP_STRENGTH
+        from .preflop_table import get_table
+
+        table = get_table()
+
+        def sort_key(index):
+            equity = table.vs_random(index) if table is not None else 0.0
+            return (PREFLOP_STRENGTH.get(class_label(index), 0.30), equity)
+
+        _class_order = sorted(range(NUM_CLASSES), key=sort_key, reverse=True)
+    return _class_order
+
+
+class HandRange:
+    """1326 个底牌组合上的权重分布（权重无需归一化）"""
+
+    def __init__(self, weights: Optional[Sequence[float]] = None):
+        """
+        Args:
+            weights: 按 COMBOS 顺序排列的 1326 个权重，默认全为1（随机手牌）
+        """
+        if weights is None:
+            weights = [1.0] * NUM_COMBOS
+        elif len(weights) != NUM_COMBOS:
+            raise ValueError(f"Expected {NUM_COMBOS} combo weights, got {len(weights)}")
+        self.weights: List[float] = [float(weight) for weight in weights]
+
+    @classmethod
+    def uniform(cls) -> 'HandRange':
+        """随机手牌"""
+        return cls()
+
+    @classmethod
+    def from_classes(cls, class_weights: Dict[str, float]) -> 'HandRange':
+        """
+        按起手牌类别设置权重
+
+        Args:
+            class_weights: {'AA': 1.0, 'AKs': 0.5, ...}，未列出的类别权重为0
+        """
+        by_index = {index: class_weights.get(class_label(index), 0.0) for index in range(NUM_CLASSES)}
+        return cls([by_index[index] for index in COMBO_CLASSES])
+
+    @classmethod
+    def top(cls, fraction: float) -> 'HandRange':
+        """
+        最强的 fraction 比例的组合（按组合数计算，临界类别取部分权重）
+
+        Args:
+            fraction: 0.0-1.0，如 0.2 表示前 20% 的起手牌
+        """
+        fraction = min(1.0, max(MIN_FRACTION, fraction))
+        remaining = fraction * NUM_COMBOS
+        class_size = [0] * NUM_CLASSES
+        for index in COMBO_CLASSES:
+            class_size[index] += 1
+
+        class_weight = [0.0] * NUM_CLASSES
+        for index in class_order():
+            if remaining <= 0:
+                break
+            class_weight[index] = min(1.0, remaining / class_size[index])
+            remaining -= class_size[index]
+        return cls([class_weight[index] for index in COMBO_CLASSES])
+
+    @classmethod
+    def from_stats(cls, vpip: float, pfr: float = 0.0, raised: bool = False) -> 'HandRange':
+        """
+        由对手的 VPIP/PFR 构造范围
+
+        Args:
+            vpip: 主动入池率（0.0-1.0），为0表示没有数据，返回随机手牌
+            pfr: 翻牌前加注率（0.0-1.0）
+            raised: 对手本手牌翻牌前是否加注过；加注时范围为前 PFR，
+                    否则为前 VPIP，其中本会加注的强牌只保留 TRAP_WEIGHT 的权重
+
+        Returns:
+            HandRange
+        """
+        if vpip <= 0:
+            return cls.uniform()
+        if raised:
+            return cls.top(pfr if pfr > 0 else vpip)
+        calling = cls.top(vpip)
+        if 0 < pfr < vpip:
+            raising = cls.top(pfr)
+            calling.weights = [call - (1.0 - TRAP_WEIGHT) * min(call, raise_)
+                               for call, raise_ in zip(calling.weights, raising.weights)]
+        return calling
+
+    @property
+    def fraction(self) -> float:
+        """范围占全部组合的比例（按权重）"""
+        return sum(self.weights) / NUM_COMBOS
+
+    def live(self, dead_cards: Sequence[Card]) -> List[Tuple[int, float]]:
+        """
+        去掉与死牌冲突的组合
+
+        Returns:
+            [(组合下标, 权重), ...]，只含权重大于0的组合
+        """
+        dead_mask = 0
+        for card in dead_cards:
+            dead_mask |= card.mask
+        return [(index, weight) for index, weight in enumerate(self.weights)
+                if weight > 0 and not COMBO_MASKS[index] & dead_mask]
+
+    def combos(self) -> Iterator[Tuple[Tuple[Card, Card], float]]:
+        """遍历权重大于0的 (组合, 权重)"""
+        for combo, weight in zip(COMBOS, self.weights):
+            if weight > 0:
+                yield combo, weight
+
+    def __len__(self):
+        return sum(1 for weight in self.weights if weight > 0)
+
+    def __repr__(self):
+        return f"HandRange({len(self)} combos, {self.fraction:.1%})"
@@ -9,33 +9,39 @@ from ..core.deck import Deck
 from ..core.player import Player
 from ..core.table import Table
 from ..core.evaluator import PokerEvaluator
+from ..core.card_render import render_cards
 from .game_state import GameStateManager
 from .betting import BettingRound
 from ..utils.constants import GameState
 from ..utils import constants as _constants
 
 class GameEngine:
-    def __init__(self, player_names: List[str], initial_chips: int = 1000):
+    def __init__(self, player_names: List[str], initial_chips: int = 1000, seed: Optional[int] = None):
         """
         初始化游戏引擎
 
         Args:
             player_names: 玩家名称列表
             initial_chips: 初始筹码数量
+            seed: 牌组随机种子（指定后发牌顺序可复现）
         """
         if len(player_names) < 2 or len(player_names) > 8:
             raise ValueError("目前支持2-8人游戏")
 
         self.players = [Player(name, initial_chips) for name in player_names]
         self.game_state = GameStateManager(self.players)
-        self.deck = Deck()
+        self.deck = Deck(seed=seed)
         self.betting_round = BettingRound(self.game_state)
         self.is_running = False
+        self.showdown_tiers = []  # 最近一次摊牌的排名分组
+        self.showdown_keys = {}   # 最近一次摊牌每位玩家的牌力键
 
     def start_new_hand(self):
         """开始新的一手牌"""
         # 重置游戏状态
         self.game_state.reset_for_new_hand()
+        self.showdown_tiers = []
+        self.showdown_keys = {}
         self.deck.reset()
         self.deck.shuffle()
 
@@ -67,16 +73,16 @@ class GameEngine:
     def deal_flop(self):
         """发翻牌（3张公共牌）"""
         # 烧一张牌
-        self.deck.draw(1)
+        self.deck.burn()
         # 发3张翻牌
         flop_cards = self.deck.draw(3)
         self.game_state.table.add_community_cards(flop_cards)
-        print(f"\n翻牌: {' '.join(str(card) for card in flop_cards)}")
+        print(f"\n翻牌: {render_cards(flop_cards)}")
 
     def deal_turn(self):
         """发转牌（第4张公共牌）"""
         # 烧一张牌
-        self.deck.draw(1)
+        self.deck.burn()
         # 发转牌
         turn_card = self.deck.draw(1)
         self.game_state.table.add_community_card(turn_card)
@@ -85,7 +91,7 @@ class GameEngine:
     def deal_river(self):
         """发河牌（第5张公共牌）"""
         # 烧一张牌
-        self.deck.draw(1)
+        self.deck.burn()
         # 发河牌
         river_card = self.deck.draw(1)
         self.game_state.table.add_community_card(river_card)
@@ -225,70 +231,50 @@ class GameEngine:
         # 默认全押
         return "all_in", 0
 
-    def determine_showdown_winners(self) -> List[Player]:
+    def rank_showdown(self) -> List[List[Player]]:
         """
-        确定摊牌赢家
+        摊牌排名
 
         Returns:
-            赢家列表
+            活动玩家按牌力从高到低的分组列表
         """
         active_players = self.game_state.get_active_players()
         community_cards = self.game_state.table.get_community_cards()
 
-        if len(active_players) == 1:
+        if len(active_players) <= 1:
             # 只剩一个玩家，自动获胜
-            return active_players
+            self.showdown_keys = {}
+            self.showdown_tiers = [active_players] if active_players else []
+            return self.showdown_tiers
 
-        # 比较所有活动玩家的手牌
-        player_hands = {}
-        for player in active_players:
-            all_cards = player.hand.get_cards() + community_cards
-            player_hands[player] = all_cards
+        # 公共牌只处理一次，每位玩家只评估一次
+        keys, tiers = PokerEvaluator.rank_hands(
+            [player.hand.get_cards() for player in active_players], community_cards)
+        self.showdown_keys = dict(zip(active_players, keys))
+        self.showdown_tiers = [[active_players[i] for i in tier] for tier in tiers]
+        return self.showdown_tiers
 
-        # 找到最佳手牌
-        best_players = []
-        best_result = None
-
-        for player, cards in player_hands.items():
-            rank, values = PokerEvaluator.evaluate_hand(cards)
-
-            if best_result is None:
-                best_result = (rank, values)
-                best_players = [player]
-            else:
-                comparison = PokerEvaluator.compare_hands(cards, player_hands[best_players[0]])
-                if comparison == 1:  # 当前玩家更强
-                    best_result = (rank, values)
-                    best_players = [player]
-                elif comparison == 0:  # 平局
-                    best_players.append(player)
+    def determine_showdown_winners(self) -> List[Player]:
+        """
+        确定摊牌赢家
 
-        return best_players
+        Returns:
+            赢家列表
+        """
+        tiers = self.rank_showdown()
+        return tiers[0] if tiers else []
 
     def award_pots(self, winners: List[Player]):
-        """分配底池给赢家"""
+        """分配底池给赢家（主池和边池分别按摊牌排名确定赢家）"""
         if not winners:
             return
 
-        # 确定每个底池的赢家
-        winners_by_pot = {}
-
-        # 主池赢家
-        main_pot_winners = []
-        for winner in winners:
-            if winner in self.game_state.table.main_pot.eligible_players:
-                main_pot_winners.append(winner)
-        if main_pot_winners:
-            winners_by_pot[self.game_state.table.main_pot] = main_pot_winners
-
-        # 边池赢家
-        for side_pot in self.game_state.table.side_pots:
-            side_pot_winners = []
-            for winner in winners:
-                if winner in side_pot.eligible_players:
-                    side_pot_winners.append(winner)
-            if side_pot_winners:
-                winners_by_pot[side_pot] = side_pot_winners
+        # 沿用 determine_showdown_winners 的排名；调用方指定了其他赢家时按指定赢家分配
+        tiers = self.showdown_tiers
+        if not tiers or set(tiers[0]) != set(winners):
+            tiers = [list(winners)]
+            self.showdown_keys = {}
+        winners_by_pot = self.game_state.table.resolve_pot_winners(tiers)
 
         # 分配筹码
         winnings = self.game_state.table.award_pots(winners_by_pot)
@@ -296,12 +282,13 @@ class GameEngine:
         # 显示赢家信息
         print("\n=== 摊牌结果 ===")
         community_cards = self.game_state.table.get_community_cards()
-        print(f"公共牌: {' '.join(str(card) for card in community_cards)}")
+        print(f"公共牌: {render_cards(community_cards)}")
 
         for player in self.game_state.get_active_players():
-            all_cards = player.hand.get_cards() + community_cards
-            hand_desc = PokerEvaluator.get_best_hand_description(all_cards)
-            print(f"{player.name}: {player.hand} - {hand_desc}")
+            key = self.showdown_keys.get(player)
+            if key is None:
+                key = PokerEvaluator.evaluate_key(player.hand.get_cards() + community_cards)
+            print(f"{player.name}: {player.hand} - {PokerEvaluator.describe_key(key)}")
 
         print(f"\n赢家: {', '.join(w.name for w in winners)}")
 
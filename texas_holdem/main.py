@@ -79,4 +79,8 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # 打包成 exe 后，胜率计算的进程池子进程需要由此识别。
+    # 游戏本身不使用并行胜率计算，不在此启动进程池；需要并行的调用方自行调用 parallel.start_pool()
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
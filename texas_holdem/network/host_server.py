@@ -159,7 +159,7 @@ class HostServer:
             if p.name in self.players and not p.is_ai:
                 hand_msg = GameMessage(
                     MessageType.PLAYER_HAND,
-                    {'hand': [c.__dict__ if hasattr(c, '__dict__') else str(c) for c in p.hand.get_cards()]},
+                    {'hand': [c.to_dict() if hasattr(c, 'to_dict') else str(c) for c in p.hand.get_cards()]},
                     p.name
                 )
                 self.players[p.name].send_message(hand_msg)
@@ -2,6 +2,7 @@
 德州扑克起手牌牌力字典
 基于真实在线数据（PokerRoom.com统计）和Sklansky分组
 牌力范围：0.0 - 1.0 (1.0为最强AA)
+查询时按两张牌的编号直接索引预先生成的 52×52 表（牌力、排名、Sklansky分组、类别）
 """
 
 # 169种起手牌的牌力字典
@@ -171,6 +172,61 @@ SKLANSKY_GROUPS = {
 }
 
 
+# 按牌编号（Card.id）索引的 52×52 查找表，下标 id1 * 52 + id2（对称，对角线不用），首次查询时生成
+_STRENGTH_BY_PAIR = None   # 牌力
+_RANK_BY_PAIR = None       # 排名 1-169
+_GROUP_BY_PAIR = None      # Sklansky 分组 1-8
+_CLASS_BY_PAIR = None      # 起手牌类别编号 0-168（见 equity.preflop_table.hand_class）
+_arrays = None             # 同上四张表的 numpy 版本（批量查询用）
+
+# 底牌不是两张时的默认值（按中等牌处理）
+_DEFAULT_STRENGTH = 0.5
+_DEFAULT_RANK = 70
+_DEFAULT_GROUP = 6
+
+
+def _build_tables():
+    """生成 52×52 查找表：牌力查字典，排名按牌力排序，分组查 SKLANSKY_GROUPS"""
+    global _STRENGTH_BY_PAIR, _RANK_BY_PAIR, _GROUP_BY_PAIR, _CLASS_BY_PAIR
+    from texas_holdem.core.card import Card
+    from texas_holdem.equity.preflop_table import NUM_CLASSES, class_label, hand_class
+    from texas_holdem.equity.ranges import class_order
+
+    rank_by_class = [0] * NUM_CLASSES
+    for rank, index in enumerate(class_order(), 1):
+        rank_by_class[index] = rank
+    group_by_label = {label: group for group, labels in SKLANSKY_GROUPS.items() for label in labels}
+
+    strengths = [0.0] * (52 * 52)
+    ranks = [0] * (52 * 52)
+    groups = [0] * (52 * 52)
+    classes = [0] * (52 * 52)
+    cards = Card.all_cards()
+    for card1 in cards:
+        for card2 in cards:
+            if card1.id == card2.id:
+                continue
+            index = hand_class((card1, card2))
+            label = class_label(index)
+            position = card1.id * 52 + card2.id
+            strengths[position] = PREFLOP_STRENGTH.get(label, 0.30)
+            ranks[position] = rank_by_class[index]
+            # 未列入 Sklansky 分组的牌归入最弱的第8组
+            groups[position] = group_by_label.get(label, 8)
+            classes[position] = index
+    _STRENGTH_BY_PAIR, _RANK_BY_PAIR, _GROUP_BY_PAIR, _CLASS_BY_PAIR = strengths, ranks, groups, classes
+
+
+def _pair_position(hole_cards) -> int:
+    """两张底牌在查找表中的下标；不是两张时返回 -1"""
+    if len(hole_cards) != 2:
+        return -1
+    if _STRENGTH_BY_PAIR is None:
+        _build_tables()
+    card1, card2 = hole_cards
+    return card1.id * 52 + card2.id
+
+
 def get_preflop_strength(hole_cards) -> float:
     """
     获取起手牌牌力
@@ -179,75 +235,26 @@ def get_preflop_strength(hole_cards) -> float:
         hole_cards: 两张底牌列表 [Card, Card]
     
     Returns:
-        牌力值 0.0-1.0
+        牌力值 0.0-1.0（字典中未列出的起手牌为 0.30）
     """
-    if len(hole_cards) != 2:
-        return 0.5
-    
-    card1, card2 = hole_cards
-    
-    # 获取牌面值 (A=14, K=13, Q=12, J=11, T=10, ...)
-    v1, v2 = card1.value, card2.value
-    
-    # 构建字典key
-    ranks = '23456789TJQKA'
-    rank1 = ranks[v1 - 2]  # 2->0, A->12
-    rank2 = ranks[v2 - 2]
-    
-    # 对子
-    if v1 == v2:
-        key = rank1 + rank2  # 如 'AA', 'KK'
-    else:
-        # 确保大牌在前
-        if v1 < v2:
-            rank1, rank2 = rank2, rank1
-        
-        # 判断是否同花
-        if card1.suit == card2.suit:
-            key = rank1 + rank2 + 's'  # 同花，如 'AKs'
-        else:
-            key = rank1 + rank2 + 'o'  # 不同花，如 'AKo'
-    
-    return PREFLOP_STRENGTH.get(key, 0.30)
+    position = _pair_position(hole_cards)
+    return _STRENGTH_BY_PAIR[position] if position >= 0 else _DEFAULT_STRENGTH
 
 
 def get_hand_ranking(hole_cards) -> int:
     """
     获取起手牌排名 (1-169, 1为最强AA)
     
+    按牌力从高到低排序，牌力相同的按对随机一手牌的胜率区分
+    
     Args:
         hole_cards: 两张底牌列表
     
     Returns:
         排名 1-169
     """
-    strength = get_preflop_strength(hole_cards)
-    
-    # 根据牌力值估算排名
-    if strength >= 0.85:
-        return 1
-    elif strength >= 0.80:
-        return 3
-    elif strength >= 0.75:
-        return 7
-    elif strength >= 0.70:
-        return 13
-    elif strength >= 0.65:
-        return 22
-    elif strength >= 0.60:
-        return 34
-    elif strength >= 0.55:
-        return 50
-    elif strength >= 0.50:
-        return 70
-    elif strength >= 0.45:
-        return 95
-    elif strength >= 0.40:
-        return 120
-    elif strength >= 0.35:
-        return 140
-    else:
-        return 155
+    position = _pair_position(hole_cards)
+    return _RANK_BY_PAIR[position] if position >= 0 else _DEFAULT_RANK
 
 
 def get_sklansky_group(hole_cards) -> int:
@@ -258,26 +265,56 @@ def get_sklansky_group(hole_cards) -> int:
         hole_cards: 两张底牌列表
     
     Returns:
-        Sklansky分组 1-8 (0表示未分组)
+        SKLANSKY_GROUPS 中的分组，未列出的起手牌为 8
+    """
+    position = _pair_position(hole_cards)
+    return _GROUP_BY_PAIR[position] if position >= 0 else _DEFAULT_GROUP
+
+
+def get_hand_class(hole_cards) -> int:
+    """
+    获取起手牌类别编号 (0-168，同 equity.preflop_table.hand_class)
+    
+    Args:
+        hole_cards: 两张底牌列表
+    
+    Returns:
+        类别编号
+    """
+    position = _pair_position(hole_cards)
+    if position < 0:
+        raise ValueError(f"Expected 2 hole cards, got {len(hole_cards)}")
+    return _CLASS_BY_PAIR[position]
+
+
+def lookup_batch(first_ids, second_ids) -> dict:
+    """
+    批量查询起手牌（需要 numpy）
+    
+    Args:
+        first_ids: 第一张底牌的牌编号数组
+        second_ids: 第二张底牌的牌编号数组（与 first_ids 形状相同）
+    
+    Returns:
+        {'strength': float 数组, 'rank': 排名数组, 'group': 分组数组, 'class': 类别数组}
     """
-    strength = get_preflop_strength(hole_cards)
+    global _arrays
+    try:
+        import numpy as np
+    except ImportError:
+        raise RuntimeError("批量查询起手牌需要安装 numpy: pip install numpy")
     
-    if strength >= 0.84:
-        return 1
-    elif strength >= 0.75:
-        return 2
-    elif strength >= 0.68:
-        return 3
-    elif strength >= 0.61:
-        return 4
-    elif strength >= 0.55:
-        return 5
-    elif strength >= 0.48:
-        return 6
-    elif strength >= 0.40:
-        return 7
-    else:
-        return 8
+    if _arrays is None:
+        if _STRENGTH_BY_PAIR is None:
+            _build_tables()
+        _arrays = {
+            'strength': np.array(_STRENGTH_BY_PAIR, dtype=np.float64),
+            'rank': np.array(_RANK_BY_PAIR, dtype=np.int16),
+            'group': np.array(_GROUP_BY_PAIR, dtype=np.int8),
+            'class': np.array(_CLASS_BY_PAIR, dtype=np.int16),
+        }
+    positions = np.asarray(first_ids, dtype=np.intp) * 52 + np.asarray(second_ids, dtype=np.intp)
+    return {name: values[positions] for name, values in _arrays.items()}
 
 
 def print_top_hands(n: int = 20):
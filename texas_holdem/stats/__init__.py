@@ -1,9 +1,10 @@
 """
 统计模块
-包含玩家统计和报告生成
+包含玩家统计、报告生成和鲨鱼AI的对手模型
 """
 
 from .stats_reporter import StatsReporter
 from .opponent_tracker import OpponentTracker
+from .opponent_model import OpponentModel
 
-__all__ = ['StatsReporter', 'OpponentTracker']
+__all__ = ['StatsReporter', 'OpponentTracker', 'OpponentModel']
@@ -0,0 +1,151 @@
+"""
+对手模型
+为鲨鱼AI维护每个对手的行动计数与倾向值，以及全体对手倾向的累加和：
+每次行动只更新该对手的计数和累加和中的差值，平均倾向 O(1) 读取，
+只有平均倾向越过阈值时才需要重新调整策略
+"""
+
+from typing import Dict, Iterable, Tuple
+
+# 新对手的默认倾向
+DEFAULT_TENDENCIES = {
+    'fold_tendency': 0.5,
+    'bluff_tendency': 0.5,
+    'calling_tendency': 0.3,
+}
+
+# 策略调整的阈值：对手易弃牌、爱诈唬、跟注多
+FOLD_THRESHOLD = 0.6
+BLUFF_THRESHOLD = 0.4
+CALL_THRESHOLD = 0.6
+
+# 计算倾向所需的最少观察次数
+MIN_OBSERVATIONS = 3
+
+_COUNTERS = ('hands_observed', 'folds', 'calls', 'raises', 'bluffs_detected',
+             'bluff_opportunities', 'fold_to_cbet', 'cbet_opportunities',
+             'showdown_wins', 'showdowns')
+
+
+class OpponentModel:
+    """逐个行动增量更新的对手模型"""
+
+    def __init__(self, adaptation_start: int = 20, decay: float = 0.0):
+        """
+        Args:
+            adaptation_start: 累计观察到多少次对手行动后开始自适应
+            decay: 指数衰减率（0.0-1.0），每次记录某个对手的行动前，
+                   先把该对手已有的计数乘以 (1 - decay)，使近期行动权重更高；0 表示不衰减
+        """
+        if not 0.0 <= decay < 1.0:
+            raise ValueError(f"Decay must be in [0, 1), got {decay}")
+        self.adaptation_start = adaptation_start
+        self.decay = decay
+        self.players: Dict[str, Dict] = {}
+        self.total_observed = 0
+        self.adaptation_active = False
+        self._sums = dict.fromkeys(DEFAULT_TENDENCIES, 0.0)
+        self._regime = None
+
+    def reset(self, names: Iterable[str]):
+        """重新开始追踪给定的对手"""
+        self.players = {}
+        for name in names:
+            data = dict.fromkeys(_COUNTERS, 0)
+            data.update(DEFAULT_TENDENCIES)
+            self.players[name] = data
+        self._sums = {key: value * len(self.players) for key, value in DEFAULT_TENDENCIES.items()}
+        self.total_observed = 0
+        self.adaptation_active = False
+        self._regime = None
+
+    def record(self, name: str, action: str, is_bluff: bool = False,
+               facing_cbet: bool = False) -> bool:
+        """
+        记录一次对手行动
+
+        Args:
+            name: 对手名字（未追踪的对手忽略）
+            action: 'fold' | 'call' | 'raise' | 'bet' | 其他
+            is_bluff: 这次加注/下注是否被识别为诈唬
+            facing_cbet: 是否在面对持续下注时行动
+
+        Returns:
+            是否需要重新调整策略（自适应已开始，且刚开始或平均倾向越过了阈值）
+        """
+        data = self.players.get(name)
+        if data is None:
+            return False
+
+        if self.decay:
+            keep = 1.0 - self.decay
+            for counter in _COUNTERS:
+                data[counter] *= keep
+
+        data['hands_observed'] += 1
+        self.total_observed += 1
+        if action == 'fold':
+            data['folds'] += 1
+            if facing_cbet:
+                data['fold_to_cbet'] += 1
+        elif action == 'call':
+            data['calls'] += 1
+        elif action in ('raise', 'bet'):
+            data['raises'] += 1
+            if is_bluff:
+                data['bluffs_detected'] += 1
+        if facing_cbet:
+            data['cbet_opportunities'] += 1
+
+        self._update_tendencies(data)
+        if not self.adaptation_active:
+            if self.total_observed < self.adaptation_start:
+                return False
+            self.adaptation_active = True
+
+        regime = self.regime()
+        if regime == self._regime:
+            return False
+        self._regime = regime
+        return True
+
+    def _update_tendencies(self, data: Dict):
+        """重新计算一个对手的倾向，并把变化量计入累加和"""
+        hands = data['hands_observed']
+        if hands < MIN_OBSERVATIONS:
+            return
+
+        tendencies = {'fold_tendency': min(1.0, max(0.0, data['folds'] / hands * 2))}
+        if data['raises'] > 0:
+            tendencies['bluff_tendency'] = min(1.0, data['bluffs_detected'] / data['raises'] * 3)
+        if hands > data['folds']:
+            tendencies['calling_tendency'] = min(1.0, max(0.0, data['calls'] / (hands - data['folds'])))
+
+        for key, value in tendencies.items():
+            self._sums[key] += value - data[key]
+            data[key] = value
+
+    def _average(self, key: str) -> float:
+        if not self.players:
+            return DEFAULT_TENDENCIES[key]
+        return self._sums[key] / len(self.players)
+
+    @property
+    def avg_fold(self) -> float:
+        """全体对手的平均弃牌倾向"""
+        return self._average('fold_tendency')
+
+    @property
+    def avg_bluff(self) -> float:
+        """全体对手的平均诈唬倾向"""
+        return self._average('bluff_tendency')
+
+    @property
+    def avg_call(self) -> float:
+        """全体对手的平均跟注倾向"""
+        return self._average('calling_tendency')
+
+    def regime(self) -> Tuple[bool, bool, bool]:
+        """(易弃牌, 爱诈唬, 跟注多)：平均倾向是否超过各自阈值"""
+        return (self.avg_fold > FOLD_THRESHOLD, self.avg_bluff > BLUFF_THRESHOLD,
+                self.avg_call > CALL_THRESHOLD)
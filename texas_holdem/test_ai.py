@@ -15,6 +15,14 @@ except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from texas_holdem.ui.cli import CLI
 
+import itertools
+
+from texas_holdem import preflop_strength
+from texas_holdem.core import batch_evaluator
+from texas_holdem.core.card import Card
+from texas_holdem.core.evaluator import PokerEvaluator
+from texas_holdem.equity import flop_texture, hand_strength, preflop_table
+
 def test_monte_carlo():
     """测试蒙特卡洛胜率计算"""
     cli = CLI()
@@ -93,6 +101,40 @@ def test_opponent_stats():
     tendency = cli._get_opponent_tendency("Human")
     print("对手倾向:", tendency)
 
+def test_opponent_range_from_stats():
+    """对手范围：VPIP 只计主动入池的手牌，紧的对手本手加注时范围更窄、己方胜率更低"""
+    from texas_holdem.equity import HandRange, equity
+    from texas_holdem.game.game_engine import GameEngine
+
+    cli = CLI()
+    cli.game_engine = GameEngine(['AI', 'Tight', 'Loose'], 1000)
+    cli.game_engine.players[0].is_ai = True
+    cli._initialize_opponent_stats(cli.game_engine.players)
+    game_state = cli.game_engine.game_state
+
+    for hand in range(1, 21):
+        game_state.hand_number = hand
+        # 紧的对手20手只玩3手，且都是加注；松的对手每手跟注
+        cli._update_opponent_stats('Tight', 'raise' if hand % 7 == 0 else 'fold', 'preflop')
+        cli._update_opponent_stats('Loose', 'call', 'preflop')
+        cli._update_opponent_stats('Loose', 'call', 'preflop')
+    tight = cli.opponent_stats['Tight']
+    assert tight['total_hands'] == 20 and tight['vpip'] == 0.10 and tight['pfr'] == 0.10
+    assert cli.opponent_stats['Loose']['total_hands'] == 20 and cli.opponent_stats['Loose']['vpip'] == 1.0
+
+    game_state.hand_number = 21
+    cli._update_opponent_stats('Tight', 'raise', 'preflop')
+    ranges = cli._opponent_ranges(game_state)
+    tight = cli.opponent_stats['Tight']
+    loose = HandRange.from_stats(cli.opponent_stats['Loose']['vpip'])
+    assert len(ranges) == 1 and ranges[0].weights == HandRange.from_stats(
+        tight['vpip'], tight['pfr'], raised=True).weights
+    assert ranges[0].fraction < 0.2 < loose.fraction
+
+    hole = [Card.parse('KD'), Card.parse('JC')]
+    assert equity(hole, [], 1, ranges=ranges) < equity(hole, [], 1, ranges=[loose]) - 0.1
+
+
 def test_win_probability():
     """测试胜率估算"""
     cli = CLI()
@@ -117,6 +159,109 @@ def test_win_probability():
         win_prob = cli._estimate_win_probability(hole_cards, community_cards)
         print(f"{desc}: 胜率 = {win_prob:.2%}")
 
+
+def test_hand_strength_tables():
+    """手牌强度：河牌与逐一比较一致，翻牌查表与精确计算在量化误差内一致，花色置换不变"""
+    def cards(*codes):
+        return [Card.parse(code) for code in codes]
+
+    hole, board = cards('AS', 'KD'), cards('KH', '7C', '2D', '9S', 'JH')
+    strength = hand_strength.postflop_strength(hole, board)
+    unseen = [card for card in Card.all_cards() if card not in hole + board]
+    hero = PokerEvaluator.evaluate_hand(hole + board)
+    score = 0.0
+    for opponent in itertools.combinations(unseen, 2):
+        other = PokerEvaluator.evaluate_hand(list(opponent) + board)
+        score += 1.0 if hero > other else 0.5 if hero == other else 0.0
+    assert abs(strength.hs - score / 990) < 1e-9
+    assert abs(strength.ehs2 - strength.hs ** 2) < 1e-9
+
+    # 转牌圈：同花听牌当前牌力弱，但潜力明显更高
+    draw = hand_strength.postflop_strength(cards('5H', '6H'), cards('KH', 'QH', '2C', '9D'))
+    assert draw.potential > draw.hs + 0.1
+    if batch_evaluator.np is not None:
+        hole, board = cards('5H', '6H'), cards('KH', 'QH', '2C', '9D')
+        unseen = [card for card in Card.all_cards() if card not in hole + board]
+        batch = hand_strength._turn_strength_batch(hole, board, unseen)
+        numpy_module, batch_evaluator.np = batch_evaluator.np, None
+        try:
+            exact = hand_strength._turn_strength(hole, board, unseen)
+        finally:
+            batch_evaluator.np = numpy_module
+        assert abs(batch.hs - exact.hs) < 1e-9 and abs(batch.ehs2 - exact.ehs2) < 1e-9
+
+    flop = cards('JH', 'TS', '2H')
+    strength = hand_strength.postflop_strength(cards('KH', 'QH'), flop)
+    assert strength == hand_strength.postflop_strength(cards('KD', 'QD'), cards('JD', 'TC', '2D'))
+    if batch_evaluator.np is not None:
+        flop_index, combo = hand_strength._flop_position(cards('KH', 'QH'), flop)
+        flop_ids = hand_strength._flop_records(flop_texture.get_index())[flop_index]
+        layouts = (hand_strength._PairLayout(49), hand_strength._PairLayout(47))
+        expected = hand_strength._flop_rows(flop_ids, layouts)[combo]
+        assert abs(strength.hs - expected[0]) <= 0.5 / 255 + 1e-9
+        assert abs(strength.ehs2 - expected[1]) <= 0.5 / 255 + 1e-9
+
+
+def test_postflop_strength_scale():
+    """翻牌后强度映射回成牌评分的尺度：常见牌型的分档固定，随机翻牌落在各阈值之上的比例与成牌评分一致"""
+    import random
+    from texas_holdem.ai import policy_table
+    from texas_holdem.ai.ai_engine import AIEngine
+
+    def cards(*codes):
+        return [Card.parse(code) for code in codes]
+
+    def bucket(hole, board):
+        strength = AIEngine.evaluate_hand_strength(cards(*hole), cards(*board))
+        return policy_table.threshold_bucket(AIEngine.STRENGTH_CUTOFFS, strength)
+
+    assert bucket(('3C', '2D'), ('KH', 'QS', '8H')) == 0       # 空气牌
+    assert bucket(('AH', 'KH'), ('8H', '5H', '2C')) == 0       # 坚果同花听牌
+    assert bucket(('AS', 'KD'), ('KH', '7C', '2D')) == 1       # 顶对顶踢脚
+    assert bucket(('KS', '7D'), ('KH', '7C', '2D')) == 1       # 两对
+    assert bucket(('9C', '8D'), ('7H', '6S', '5C')) == 2       # 顺子
+    assert bucket(('7S', '7D'), ('KH', '7C', '2D')) == 3       # 暗三条
+    assert bucket(('3C', '2D'), ('KH', 'QS', '8H', '9C', 'JD')) == 0
+    assert bucket(('AH', '9H'), ('KH', '7H', '2H', '4S', 'JC')) == 3
+
+    rng = random.Random(11)
+    deck = Card.all_cards()
+    hands = [rng.sample(deck, 5) for _ in range(2000)]
+    mapped = [AIEngine.evaluate_hand_strength(hand[:2], hand[2:]) for hand in hands]
+    scores = [AIEngine.made_hand_score(hand) for hand in hands]
+    for cutoff in AIEngine.STRENGTH_CUTOFFS + (0.25, 0.35, 0.45, 0.60):
+        share = sum(value > cutoff for value in mapped) / len(hands)
+        expected = sum(value > cutoff for value in scores) / len(hands)
+        assert abs(share - expected) < 0.02
+
+
+def test_preflop_lookup_array():
+    """起手牌查找表：与按名称查字典一致，排名覆盖 1-169，批量查询与逐个查询一致"""
+    hands = list(itertools.combinations(Card.all_cards(), 2))
+    ranks = set()
+    for card1, card2 in hands:
+        label = preflop_table.class_label(preflop_table.hand_class((card1, card2)))
+        strength = preflop_strength.get_preflop_strength([card1, card2])
+        assert strength == preflop_strength.PREFLOP_STRENGTH.get(label, 0.30)
+        assert strength == preflop_strength.get_preflop_strength([card2, card1])
+        ranks.add(preflop_strength.get_hand_ranking([card1, card2]))
+    assert ranks == set(range(1, 170))
+
+    aces = [Card.parse('AS'), Card.parse('AH')]
+    assert preflop_strength.get_hand_ranking(aces) == 1
+    assert preflop_strength.get_sklansky_group(aces) == 1
+    assert preflop_strength.get_sklansky_group([Card.parse('AD'), Card.parse('QD')]) == 2
+    assert preflop_strength.get_sklansky_group([Card.parse('7S'), Card.parse('2H')]) == 8
+
+    if batch_evaluator.np is not None:
+        sample = hands[::37]
+        batch = preflop_strength.lookup_batch([a.id for a, _ in sample], [b.id for _, b in sample])
+        for position, hand in enumerate(sample):
+            assert batch['strength'][position] == preflop_strength.get_preflop_strength(hand)
+            assert batch['rank'][position] == preflop_strength.get_hand_ranking(hand)
+            assert batch['class'][position] == preflop_strength.get_hand_class(hand)
+
+
 if __name__ == "__main__":
     print("德州扑克AI增强功能测试")
     print("=" * 60)
@@ -124,11 +269,15 @@ if __name__ == "__main__":
     try:
         test_monte_carlo()
         test_opponent_stats()
+        test_opponent_range_from_stats()
         test_win_probability()
+        test_hand_strength_tables()
+        test_postflop_strength_scale()
+        test_preflop_lookup_array()
 
         print("\n所有测试完成!")
 
     except Exception as e:
         print(f"测试出错: {e}")
         import traceback
-        traceback.print_exc()
\ No newline at end of file
+        traceback.print_exc()
@@ -4,6 +4,9 @@
 用于策略改进分析
 """
 
+import contextlib
+import io
+import math
 import sys
 import random
 from typing import List, Dict, Any, Optional
@@ -19,8 +22,11 @@ from texas_holdem.core.player import Player
 from texas_holdem.core.table import Table
 from texas_holdem.game.game_state import GameState
 from texas_holdem.game.game_engine import GameEngine
+from texas_holdem.ai import policy_table
 from texas_holdem.ai.ai_engine import AIEngine
 from texas_holdem.ai.shark_ai import SharkAI
+from texas_holdem.equity import hand_strength
+from texas_holdem.stats.opponent_model import OpponentModel
 
 
 @dataclass
@@ -757,6 +763,168 @@ def run_multiple_tests(num_tests: int = 3, num_hands: int = 100):
     return all_results, all_analyzers
 
 
+def test_opponent_model_incremental():
+    """对手模型：增量维护的平均倾向与逐个重新计算一致，衰减让近期行动占主导"""
+    names = [f"p{index}" for index in range(8)]
+    model = OpponentModel(adaptation_start=20)
+    model.reset(names)
+    rng = random.Random(5)
+    changes = 0
+    for step in range(2000):
+        changes += model.record(rng.choice(names), rng.choice(['fold', 'fold', 'call', 'raise', 'bet']),
+                                is_bluff=rng.random() < 0.2)
+        if step % 97 == 0:
+            for key, average in (('fold_tendency', model.avg_fold), ('bluff_tendency', model.avg_bluff),
+                                 ('calling_tendency', model.avg_call)):
+                expected = sum(data[key] for data in model.players.values()) / len(names)
+                assert abs(average - expected) < 1e-9
+    assert model.adaptation_active and model.total_observed == 2000
+    # 只在开始自适应和越过阈值时要求重新调整
+    assert 1 <= changes < 50
+    assert not model.record('unknown', 'fold')
+
+    decayed = OpponentModel(adaptation_start=1, decay=0.1)
+    decayed.reset(['villain'])
+    for _ in range(50):
+        decayed.record('villain', 'call')
+    for _ in range(30):
+        decayed.record('villain', 'fold')
+    # 不衰减时弃牌率为 30/80，衰减后近期的弃牌占绝大多数
+    assert decayed.players['villain']['fold_tendency'] == 1.0
+    assert decayed.players['villain']['hands_observed'] < 10
+
+
+def test_shark_decision_budget():
+    """带时间预算的鲨鱼AI决策：没有时间时只用廉价特征，时间充足时逐步细化，并记录耗时"""
+    engine = GameEngine(['shark', 'villain'], 1000, seed=3)
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.start_new_hand()
+        engine.deal_flop()
+        engine.deal_turn()
+    engine.game_state.state = GameState.TURN
+    shark = SharkAI()
+    shark.initialize_opponents(engine.players)
+    player = engine.players[0]
+    hole = player.hand.get_cards()
+    board = engine.game_state.table.get_community_cards()
+    hand_strength.STRENGTH_CACHE.clear()
+
+    action, amount = shark.decide(player, engine.betting_round, budget=0.0)
+    assert action in engine.betting_round.get_available_actions(player) and amount >= 0
+    # 没有时间：胜率用当前牌力 HS 代替，不计听牌潜力
+    current = hand_strength.current_strength(hole, board)
+    assert shark.last_decision['stage'] == 'features'
+    assert shark.last_decision['win_probability'] == current
+    assert shark.last_decision['hand_strength'] == AIEngine.scale_postflop_strength(current, 4)
+
+    shark.decide(player, engine.betting_round, budget=5.0)
+    assert shark.last_decision['stage'] == 'equity'
+    # 手牌强度与 AIEngine 一致：sqrt(EHS²) 映射到成牌评分的尺度
+    potential = AIEngine.scale_postflop_strength(hand_strength.postflop_strength(hole, board).potential, 4)
+    assert shark.last_decision['hand_strength'] == potential
+    # EHS² 已缓存，之后即使没有时间也能使用
+    shark.decide(player, engine.betting_round, budget=0.0)
+    assert shark.last_decision['hand_strength'] == potential
+
+    stats = shark.latency_stats()
+    assert stats['count'] == 3 and stats['p50'] <= stats['p90'] <= stats['p99'] <= stats['max']
+    assert 2 <= stats['over_budget'] <= 3
+    assert SharkAI().latency_stats()['count'] == 0
+
+
+def test_push_fold_call_charts_only_vs_all_in():
+    """短筹码时只有面对全押才查跟注图表，最小加注交给常规翻牌前决策"""
+    engine = GameEngine(['shark', 'villain'], 200, seed=3)
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.start_new_hand()
+    game_state = engine.game_state
+    big_blind = next(p for p in engine.players if p.is_big_blind)
+    small_blind = next(p for p in engine.players if p.is_small_blind)
+    shark = SharkAI()
+    shark.initialize_opponents(engine.players)
+
+    def chart_decision():
+        available = engine.betting_round.get_available_actions(big_blind)
+        return shark._push_fold_decision(big_blind, game_state, available,
+                                         engine.betting_round.get_amount_to_call(big_blind),
+                                         big_blind.hand.get_cards())
+
+    assert engine.betting_round.process_action(small_blind, 'raise', 20)[0]
+    assert game_state.current_bet == 40 and not small_blind.is_all_in
+    assert chart_decision() is None
+
+    assert engine.betting_round.process_action(small_blind, 'all_in')[0]
+    assert small_blind.is_all_in
+    assert chart_decision() is not None
+
+
+def test_board_texture_flop_only():
+    """牌面结构只在翻牌圈传给翻牌后决策：转牌、河牌可能已经让牌面变湿润"""
+    engine = GameEngine(['shark', 'villain'], 1000, seed=3)
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.start_new_hand()
+        engine.deal_flop()
+    shark = SharkAI()
+    shark.initialize_opponents(engine.players)
+    player = engine.players[0]
+    textures = []
+    postflop_decision = shark._postflop_decision
+
+    def record_texture(*args, **kwargs):
+        textures.append(kwargs.get('texture'))
+        return postflop_decision(*args, **kwargs)
+
+    shark._postflop_decision = record_texture
+    for deal, state in ((None, GameState.FLOP), (engine.deal_turn, GameState.TURN),
+                        (engine.deal_river, GameState.RIVER)):
+        if deal is not None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                deal()
+        engine.game_state.state = state
+        shark.decide(player, engine.betting_round, budget=0.0)
+    assert textures[0] is not None and textures[1:] == [None, None]
+
+
+def test_compiled_policy_tables():
+    """编译后的权重表：分档与阈值比较一致，同一随机状态下与逐次计算权重再加权选择的结果相同"""
+    engine = AIEngine()
+    rng = random.Random(9)
+    strengths = [rng.random() for _ in range(200)]
+    # 恰好落在分界值上以及紧挨分界值两侧的强度
+    for style, tightness in engine.STYLE_TIGHTNESS.items():
+        for cutoff in engine.STRENGTH_CUTOFFS:
+            edge = cutoff + tightness
+            strengths += [edge, math.nextafter(edge, 0.0), math.nextafter(edge, 1.0)]
+
+    for style in ('TAG', 'LAG', 'LAP', 'LP', 'UNKNOWN'):
+        for strength in strengths:
+            for count in range(1, len(policy_table.ACTIONS) + 1):
+                available = rng.sample(policy_table.ACTIONS, count)
+                seed = rng.random()
+                random.seed(seed)
+                expected = engine._weighted_choice(
+                    engine._calculate_action_weights(strength, style, {}), available)
+                random.seed(seed)
+                assert engine._policy_choice(strength, style, available) == expected
+
+    cutoffs = engine.STRENGTH_CUTOFFS
+    assert policy_table.threshold_bucket(cutoffs, cutoffs[0]) == 0
+    assert policy_table.threshold_bucket(cutoffs, math.nextafter(cutoffs[0], 1.0)) == 1
+    assert policy_table.threshold_bucket(cutoffs, 1.0) == len(cutoffs)
+    assert len(engine._policy_tables['TAG']) == len(cutoffs) + 1
+
+
 if __name__ == '__main__':
+    test_opponent_model_incremental()
+    print("[PASS] 增量对手模型")
+    test_shark_decision_budget()
+    print("[PASS] 鲨鱼AI决策时间预算")
+    test_push_fold_call_charts_only_vs_all_in()
+    print("[PASS] 推弃图表只在面对全押时跟注")
+    test_board_texture_flop_only()
+    print("[PASS] 牌面结构只用于翻牌圈")
+    test_compiled_policy_tables()
+    print("[PASS] 编译后的行动权重表")
+
     # 运行3局测试
     results, analyzers = run_multiple_tests(num_tests=3, num_hands=100)
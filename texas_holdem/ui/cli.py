@@ -7,11 +7,15 @@ import sys
 import time
 import random
 import itertools
-from typing import List, Optional, Dict, Tuple
+from typing import Any, List, Optional, Dict, Tuple
 from texas_holdem.core.player import Player
 from texas_holdem.core.table import Table
 from texas_holdem.core.evaluator import PokerEvaluator
+from texas_holdem.core.lookup_evaluator import BoardEvaluator
 from texas_holdem.core.card import Card
+from texas_holdem.core.card_render import render_cards
+from texas_holdem.core.draw_analyzer import DrawAnalyzer
+from texas_holdem.equity import HandRange, equity
 from texas_holdem.game.game_engine import GameEngine
 from texas_holdem.game.betting import BettingRound
 from texas_holdem.utils.constants import Action, GameState, SMALL_BLIND, BIG_BLIND, INITIAL_CHIPS
@@ -360,7 +364,7 @@ class CLI:
         # 显示公共牌
         community_cards = table.get_community_cards()
         if community_cards:
-            print(f"公共牌: {' '.join(str(card) for card in community_cards)}")
+            print(f"公共牌: {render_cards(community_cards)}")
         
         # 显示玩家信息（一行一个，带位置标记）
         for player in players:
@@ -1004,18 +1008,19 @@ class CLI:
         print("[摊牌] 所有玩家手牌")
         
         community_cards = game_state.table.get_community_cards()
-        print(f"公共牌: {' '.join(str(card) for card in community_cards)}")
+        print(f"公共牌: {render_cards(community_cards)}")
         print()
 
-        # 显示所有玩家的手牌（不只是active的）
+        # 显示所有玩家的手牌（不只是active的），公共牌只处理一次
+        board_evaluator = BoardEvaluator(community_cards)
         for player in game_state.players:
             if player.hand.get_cards():
-                all_cards = player.hand.get_cards() + community_cards
-                hand_desc = PokerEvaluator.get_best_hand_description(all_cards)
+                hand_key = board_evaluator.evaluate_key(player.hand.get_cards())
+                hand_desc = PokerEvaluator.describe_key(hand_key)
                 
                 # 标记状态
                 status = ""
-                won = player in winners
+                won = player in winners or player in (winnings or {})
                 if won:
                     status = "[获胜]"
                 elif not player.is_active:
@@ -2207,6 +2212,12 @@ class CLI:
         game_state = betting_round.game_state
         community_cards = game_state.table.get_community_cards()
         
+        # 鲨鱼AI在时间预算内自己计算特征并决策
+        style = getattr(player, 'ai_style', 'LAG')
+        if style == 'SHARK':
+            return self.shark_ai.decide(player, betting_round,
+                                        ranges=self._opponent_ranges(game_state))
+        
         # 计算手牌数据
         hand_strength = AIEngine.evaluate_hand_strength(
             player.hand.get_cards(), community_cards
@@ -2216,20 +2227,14 @@ class CLI:
             game_state.table.total_pot, amount_to_call
         )
         win_probability = AIEngine.estimate_win_probability(
-            player.hand.get_cards(), community_cards
+            player.hand.get_cards(), community_cards,
+            threshold=AIEngine.breakeven_equity(game_state.table.total_pot, amount_to_call),
+            ranges=self._opponent_ranges(game_state)
         )
         ev = AIEngine.calculate_expected_value(
             hand_strength, pot_odds, amount_to_call, game_state.table.total_pot
         )
         
-        # 鲨鱼AI使用自己的决策逻辑
-        style = getattr(player, 'ai_style', 'LAG')
-        if style == 'SHARK':
-            return self.shark_ai.get_action(
-                player, betting_round, hand_strength,
-                win_probability, pot_odds, ev
-            )
-        
         # 其他AI使用标准引擎
         return self.ai_engine.get_action(
             player, betting_round, hand_strength,
@@ -2346,50 +2351,13 @@ class CLI:
         num_community = len(community_cards)
 
         if num_community >= 3:
-            # 有足够公共牌时使用蒙特卡洛模拟
-            # 根据剩余牌的数量调整迭代次数
-            iterations = 500 if num_community == 3 else 1000  # 翻牌圈500次，转牌河牌1000次
-            win_prob = self._calculate_equity_monte_carlo(hole_cards, community_cards,
-                                                         opponents=1, iterations=iterations)
-
-            # 考虑outs（听牌概率）
-            outs_info = self._calculate_outs(hole_cards, community_cards)
-            total_outs = outs_info['total']
-
-            # 根据outs调整胜率
-            if total_outs > 0:
-                # 计算改进概率：现有胜率 + outs带来的额外胜率
-                cards_to_come = 5 - num_community  # 还要发多少张牌
-                if cards_to_come == 2:  # 翻牌圈，还有2张牌
-                    # 近似公式：胜率提高 ≈ outs * 4%
-                    outs_bonus = total_outs * 0.04
-                else:  # 转牌圈，还有1张牌
-                    # 近似公式：胜率提高 ≈ outs * 2%
-                    outs_bonus = total_outs * 0.02
-
-                win_prob = min(0.95, win_prob + outs_bonus)
-
+            # 转牌、河牌圈单挑的组合数很少，引擎直接精确枚举（结果无随机波动）；
+            # 翻牌圈组合过多，模拟到 95% 置信区间 ±1% 或 20ms 为止。
+            # 全下胜率已经计入了所有后续发牌，听牌的命中概率不再另外叠加
+            win_prob = equity(hole_cards, community_cards, 1, precision=0.01, time_limit=0.02)
         else:
-            # 翻牌前或公共牌不足：基于手牌强度估算胜率
-            hand_strength = self._evaluate_hand_strength(hole_cards, community_cards)
-
-            # 手牌强度转换为胜率（非线性映射，强牌胜率更高）
-            if hand_strength > 0.8:
-                win_prob = 0.7 + (hand_strength - 0.8) * 1.5  # 0.7到1.0
-            elif hand_strength > 0.6:
-                win_prob = 0.5 + (hand_strength - 0.6) * 1.0  # 0.5到0.7
-            elif hand_strength > 0.4:
-                win_prob = 0.3 + (hand_strength - 0.4) * 1.0  # 0.3到0.5
-            else:
-                win_prob = hand_strength * 0.75  # 0.0到0.3
-
-            # 考虑公共牌数量：越多公共牌，估算越准确
-            if num_community == 0:
-                win_prob *= 0.8  # 翻牌前不确定性高
-            elif num_community == 3:
-                win_prob *= 0.9
-            elif num_community >= 4:
-                win_prob *= 1.0  # 转牌和河牌估算更准确
+            # 翻牌前：查预先计算的全下胜率表（对一个随机对手）
+            win_prob = equity(hole_cards, community_cards, 1)
 
         return min(0.95, max(0.05, win_prob))  # 限制在5%-95%
 
@@ -2410,110 +2378,10 @@ class CLI:
         if not hole_cards:
             return 0.5
 
-        # 已知的牌
-        known_cards = hole_cards + community_cards
-
-        # 模拟结果计数
-        wins = 0
-        ties = 0
-
-        for _ in range(iterations):
-            # 生成剩余的牌堆
-            deck = self._generate_remaining_deck(known_cards)
-            random.shuffle(deck)
-
-            # 补全公共牌
-            remaining_community = 5 - len(community_cards)
-            simulated_community = community_cards + deck[:remaining_community]
-            deck = deck[remaining_community:]
-
-            # 生成对手手牌
-            opponent_hole_cards = []
-            for _ in range(opponents):
-                if len(deck) >= 2:
-                    opponent_hole = deck[:2]
-                    opponent_hole_cards.append(opponent_hole)
-                    deck = deck[2:]
-
-            # 如果无法生成足够的手牌，跳过这次模拟
-            if len(opponent_hole_cards) < opponents:
-                continue
-
-            # 评估所有手牌
-            player_cards = hole_cards + simulated_community
-            player_rank, player_values = PokerEvaluator.evaluate_hand(player_cards)
-
-            # 与每个对手比较
-            player_wins = True
-            player_ties = False
-
-            for opp_hole in opponent_hole_cards:
-                opp_cards = opp_hole + simulated_community
-                opp_rank, opp_values = PokerEvaluator.evaluate_hand(opp_cards)
+        return equity(hole_cards, community_cards, opponents,
+                      method='montecarlo', budget=iterations)
 
-                if opp_rank > player_rank:
-                    player_wins = False
-                    break
-                elif opp_rank == player_rank:
-                    # 相同牌型，比较牌面值
-                    comparison = 0
-                    for pv, ov in zip(player_values, opp_values):
-                        if pv > ov:
-                            break
-                        elif pv < ov:
-                            comparison = -1
-                            break
-
-                    if comparison == -1:
-                        player_wins = False
-                        break
-                    elif comparison == 0:
-                        player_ties = True
-
-            if player_wins:
-                if player_ties:
-                    ties += 1
-                else:
-                    wins += 1
-            elif player_ties:
-                ties += 0.5  # 平局算一半
-
-        # 计算胜率：赢的次数 + 平局的一半
-        equity = (wins + ties * 0.5) / iterations
-        return equity
-
-    def _generate_remaining_deck(self, known_cards: List[Card]) -> List[Card]:
-        """
-        生成剩余的牌堆（排除已知的牌）
-
-        Args:
-            known_cards: 已知的牌列表
-
-        Returns:
-            剩余的牌列表
-        """
-        # 创建已知牌的集合（使用rank和suit，因为Card构造函数需要这些）
-        known_set = set((card.rank, card.suit) for card in known_cards)
-        remaining = []
-
-        # 花色映射
-        suit_chars = ['H', 'D', 'C', 'S']  # 对应0,1,2,3
-
-        # 牌面值映射
-        value_to_rank = {
-            2: '2', 3: '3', 4: '4', 5: '5', 6: '6', 7: '7', 8: '8', 9: '9', 10: '10',
-            11: 'J', 12: 'Q', 13: 'K', 14: 'A'
-        }
-
-        for value in range(2, 15):  # 2到Ace (14)
-            rank_str = value_to_rank[value]
-            for suit_char in suit_chars:   # 4种花色
-                if (rank_str, suit_char) not in known_set:
-                    remaining.append(Card(suit_char, rank_str))
-
-        return remaining
-
-    def _calculate_outs(self, hole_cards: List[Card], community_cards: List[Card]) -> Dict[str, int]:
+    def _calculate_outs(self, hole_cards: List[Card], community_cards: List[Card]) -> Dict[str, Any]:
         """
         计算听牌张数（outs）
 
@@ -2522,143 +2390,10 @@ class CLI:
             community_cards: 公共牌列表
 
         Returns:
-            各种听牌的outs数量字典
+            DrawAnalyzer.analyze 的结果：'total' 为不重复的 outs 数（不含只做成小对子的牌），
+            'flush'/'straight'/'pair' 为各类 outs 数，'equity' 为折算污染 outs 后的命中概率
         """
-        if len(hole_cards) != 2 or not hole_cards:
-            return {'total': 0, 'flush': 0, 'straight': 0, 'pair': 0}
-
-        # 合并所有牌
-        all_cards = hole_cards + community_cards
-
-        # 计算同花听牌outs
-        flush_outs = self._count_flush_outs(hole_cards, community_cards)
-
-        # 计算顺子听牌outs
-        straight_outs = self._count_straight_outs(hole_cards, community_cards)
-
-        # 计算对子/三条/四条outs
-        pair_outs = self._count_pair_outs(hole_cards, community_cards)
-
-        # 去重：有些牌可能同时是多种听牌
-        # 简单估计：总outs约等于各种outs之和的70%
-        total_outs = int((flush_outs + straight_outs + pair_outs) * 0.7)
-
-        return {
-            'total': total_outs,
-            'flush': flush_outs,
-            'straight': straight_outs,
-            'pair': pair_outs
-        }
-
-    def _count_flush_outs(self, hole_cards: List[Card], community_cards: List[Card]) -> int:
-        """计算同花听牌outs"""
-        if len(hole_cards) != 2:
-            return 0
-
-        # 统计花色
-        suit_counts = {}
-        for card in hole_cards + community_cards:
-            suit_counts[card.suit] = suit_counts.get(card.suit, 0) + 1
-
-        # 找出最多花色的牌数
-        max_suit_count = max(suit_counts.values()) if suit_counts else 0
-        max_suit = None
-        for suit, count in suit_counts.items():
-            if count == max_suit_count:
-                max_suit = suit
-                break
-
-        if max_suit_count >= 5:  # 已经有同花
-            return 0
-        elif max_suit_count == 4:  # 差1张成同花
-            # 还有13-4=9张该花色的牌在牌堆中
-            return 9
-        elif max_suit_count == 3:  # 差2张成同花
-            # 翻牌圈：有9张outs；转牌圈：有10张outs（因为只剩1张牌要发）
-            if len(community_cards) == 3:  # 翻牌圈
-                return 9
-            else:  # 转牌或河牌圈
-                return 10
-        else:
-            return 0
-
-    def _count_straight_outs(self, hole_cards: List[Card], community_cards: List[Card]) -> int:
-        """计算顺子听牌outs"""
-        if len(hole_cards) != 2:
-            return 0
-
-        # 收集所有牌面值
-        all_values = set(card.value for card in hole_cards + community_cards)
-
-        # 检查可能的顺子听牌
-        straight_draws = []
-
-        # 检查开端顺子（open-ended straight draw）
-        for high_card in range(6, 15):  # 从6到A
-            needed = set(range(high_card-4, high_card+1))
-            missing = needed - all_values
-            if len(missing) == 1:
-                straight_draws.append(('open-ended', len(needed)))
-
-        # 检查内听顺子（gut-shot straight draw）
-        for high_card in range(5, 15):
-            needed = set(range(high_card-4, high_card+1))
-            missing = needed - all_values
-            if len(missing) == 2:
-                # 检查是否是内听顺子（中间缺一张）
-                missing_list = sorted(list(missing))
-                if len(missing_list) == 2:
-                    # 简单判断：如果两张缺牌相邻或接近，可能是内听
-                    straight_draws.append(('gut-shot', 4))
-
-        # 估算outs：开端顺子通常8张outs，内听顺子4张outs
-        outs = 0
-        for draw_type, count in straight_draws:
-            if draw_type == 'open-ended':
-                outs += 8
-            else:  # gut-shot
-                outs += 4
-
-        # 限制最大outs
-        return min(outs, 12)
-
-    def _count_pair_outs(self, hole_cards: List[Card], community_cards: List[Card]) -> int:
-        """计算对子/三条/四条outs"""
-        if len(hole_cards) != 2:
-            return 0
-
-        # 手牌值
-        hole_values = [card.value for card in hole_cards]
-
-        # 检查手牌是否已经是成牌
-        if hole_values[0] == hole_values[1]:  # 口袋对
-            # 口袋对可以提升为三条或四条
-            pair_value = hole_values[0]
-
-            # 检查公共牌中是否有相同的牌
-            community_values = [card.value for card in community_cards]
-            same_in_community = community_values.count(pair_value)
-
-            if same_in_community == 0:  # 没有相同的牌
-                # 2张outs成三条
-                return 2
-            elif same_in_community == 1:  # 已经有三条
-                # 1张outs成四条
-                return 1
-            elif same_in_community == 2:  # 已经有四条
-                return 0
-        else:
-            # 非对子手牌：可以成对、两对、三条
-            # 每张底牌有3张outs成对
-            outs = 6
-
-            # 如果公共牌中已经有相同牌面值，减少outs
-            community_values = [card.value for card in community_cards]
-            for hole_value in hole_values:
-                if hole_value in community_values:
-                    outs -= 3  # 这张牌已经成对
-
-            return max(0, outs)
+        return DrawAnalyzer.analyze(hole_cards, community_cards, discount=True)
 
     def _calculate_expected_value(self, hand_strength, pot_odds, amount_to_call, total_pot):
         """
@@ -3016,16 +2751,9 @@ class CLI:
                     # 获取玩家手牌
                     player_cards = player.hand.get_cards()
                     if len(player_cards) == 2:
-                        # 计算听牌outs
+                        # 计算听牌outs和剩余街的命中概率
                         outs_info = self._calculate_outs(player_cards, community_cards)
-                        total_outs = outs_info['total']
-                        
-                        # 计算听牌胜率（简化公式：outs * 4% for flop, outs * 2% for turn）
-                        cards_to_come = 5 - len(community_cards)
-                        if cards_to_come == 2:  # 翻牌圈
-                            draw_equity = min(0.95, total_outs * 0.04)
-                        else:  # 转牌圈
-                            draw_equity = min(0.95, total_outs * 0.02)
+                        draw_equity = min(0.95, outs_info['equity'])
                         
                         # 计算需要的赔率
                         total_pot = game_state_manager.table.total_pot
@@ -3373,7 +3101,10 @@ class CLI:
                     'preflop_actions': 0,
                     'preflop_raises': 0,
                     'voluntary_put': 0,
-                    'total_hands': 0
+                    'total_hands': 0,
+                    'last_hand': None,     # 最近一次计入统计的手牌编号
+                    'entered_pot': False,  # 本手牌翻牌前是否已主动入池
+                    'raised_preflop': False  # 本手牌翻牌前是否加注过
                 }
 
     def _initialize_shark_tracking(self, players: List[Player]):
@@ -3537,30 +3268,33 @@ class CLI:
 
         stats = self.opponent_stats[player_name]
 
-        # 更新总手牌数
-        if street == 'preflop' and action != 'fold':
-            stats['total_hands'] += 1
-
-        # 更新翻牌前统计
+        # 更新翻牌前统计：每手牌第一次翻牌前行动时计入总手牌数，
+        # 跟注、下注、加注、全押为主动入池（大盲过牌不算），每手牌只计一次
         if street == 'preflop':
+            # 没有进行中的牌局时（单独调用），每次翻牌前行动按新的一手牌计
+            hand_number = (self.game_engine.game_state.hand_number if self.game_engine
+                           else stats['total_hands'] + 1)
+            if stats['last_hand'] != hand_number:
+                stats['last_hand'] = hand_number
+                stats['total_hands'] += 1
+                stats['entered_pot'] = False
+                stats['raised_preflop'] = False
+
             stats['preflop_actions'] += 1
 
-            if action in ['bet', 'raise']:
+            if action in ['bet', 'raise', 'all_in'] and not stats['raised_preflop']:
+                stats['raised_preflop'] = True
                 stats['preflop_raises'] += 1
 
-            if action != 'fold':
+            if action in ['call', 'bet', 'raise', 'all_in'] and not stats['entered_pot']:
+                stats['entered_pot'] = True
                 stats['voluntary_put'] += 1
+                stats['hands_played'] += 1
 
-        # 计算VPIP（主动投入底池频率）
-        if street == 'preflop' and action != 'fold':
-            stats['hands_played'] += 1
-
-        # 更新VPIP和PFR（每10手牌更新一次）
+        # 更新VPIP和PFR（满10手牌后才更新）
         if stats['total_hands'] >= 10:
-            if stats['total_hands'] > 0:
-                stats['vpip'] = stats['hands_played'] / stats['total_hands']
-            if stats['preflop_actions'] > 0:
-                stats['pfr'] = stats['preflop_raises'] / stats['preflop_actions']
+            stats['vpip'] = stats['hands_played'] / stats['total_hands']
+            stats['pfr'] = stats['preflop_raises'] / stats['total_hands']
 
         # 计算激进因子（AF）
         if street != 'preflop':
@@ -3568,6 +3302,30 @@ class CLI:
             # 这里需要更多数据，暂时简单处理
             pass
 
+    def _opponent_ranges(self, game_state) -> Optional[List[HandRange]]:
+        """
+        根据对手统计构造胜率计算用的手牌范围
+
+        只使用仍在牌局中、已有足够统计（10手以上）的人类对手；
+        有多个时取 VPIP 最低（范围最紧）的一个，仍按单挑计算。
+        该对手本手牌翻牌前加注过时范围收窄到前 PFR
+
+        Args:
+            game_state: 游戏状态
+
+        Returns:
+            [HandRange]，没有可用统计时返回 None（对手底牌按随机处理）
+        """
+        tracked = [self.opponent_stats[player.name] for player in game_state.get_active_players()
+                   if not player.is_ai and player.name in self.opponent_stats
+                   and self.opponent_stats[player.name]['total_hands'] >= 10]
+        if not tracked:
+            return None
+        stats = min(tracked, key=lambda item: item['vpip'])
+        raised = (stats['raised_preflop']
+                  and stats['last_hand'] == self.game_engine.game_state.hand_number)
+        return [HandRange.from_stats(stats['vpip'], stats['pfr'], raised=raised)]
+
     def _get_opponent_tendency(self, player_name: str) -> Dict[str, str]:
         """
         获取对手倾向分析
@@ -3849,7 +3607,7 @@ class CLI:
         # 显示公共牌
         community_cards = state_data.get('community_cards', [])
         if community_cards:
-            cards_str = ' '.join([f"{c['rank']}{c['suit']}" for c in community_cards])
+            cards_str = render_cards(community_cards)
             print(f"公共牌: {cards_str}")
         
         # 显示底池
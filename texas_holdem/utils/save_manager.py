@@ -15,6 +15,7 @@ class SaveManager:
     """游戏存档管理器"""
     
     SAVE_DIR = "saves"
+    CACHE_DIR = "cache"
     AUTOSAVE_FILE = "autosave.json"
     
     @classmethod
@@ -31,6 +32,11 @@ class SaveManager:
         """获取存档目录完整路径"""
         return os.path.join(cls._get_base_dir(), cls.SAVE_DIR)
     
+    @classmethod
+    def get_cache_dir(cls) -> str:
+        """获取缓存目录完整路径（与存档目录同级，存放可重新生成的数据表）"""
+        return os.path.join(cls._get_base_dir(), cls.CACHE_DIR)
+    
     @classmethod
     def ensure_save_dir(cls):
         """确保存档目录存在"""
@@ -5,8 +5,8 @@ a = Analysis(
     ['texas_holdem\\main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
-    hiddenimports=['texas_holdem.core.card', 'texas_holdem.core.deck', 'texas_holdem.core.hand', 'texas_holdem.core.player', 'texas_holdem.core.table', 'texas_holdem.core.evaluator', 'texas_holdem.game.game_state', 'texas_holdem.game.betting', 'texas_holdem.game.game_engine', 'texas_holdem.ui.cli', 'texas_holdem.utils.constants'],
+    datas=[('texas_holdem\\equity\\preflop_equity_v1.bin', 'texas_holdem\\equity'), ('texas_holdem\\equity\\flop_texture_v1.bin', 'texas_holdem\\equity'), ('texas_holdem\\equity\\ehs_flop_v1.bin', 'texas_holdem\\equity'), ('texas_holdem\\equity\\push_fold_v1.bin', 'texas_holdem\\equity')],
+    hiddenimports=['texas_holdem.core.card', 'texas_holdem.core.deck', 'texas_holdem.core.hand', 'texas_holdem.core.player', 'texas_holdem.core.table', 'texas_holdem.core.evaluator', 'texas_holdem.core.lookup_evaluator', 'texas_holdem.core.table_cache', 'texas_holdem.core.batch_evaluator', 'texas_holdem.core.draw_analyzer', 'texas_holdem.core.card_render', 'texas_holdem.core.sampler', 'texas_holdem.equity.engine', 'texas_holdem.equity.backends', 'texas_holdem.equity.cache', 'texas_holdem.equity.canonical', 'texas_holdem.equity.preflop_table', 'texas_holdem.equity.parallel', 'texas_holdem.equity.ranges', 'texas_holdem.equity.flop_texture', 'texas_holdem.equity.hand_strength', 'texas_holdem.equity.push_fold', 'texas_holdem.ai.policy_table', 'texas_holdem.stats.opponent_model', 'texas_holdem.game.game_state', 'texas_holdem.game.betting', 'texas_holdem.game.game_engine', 'texas_holdem.ui.cli', 'texas_holdem.utils.constants'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],